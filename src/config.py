@@ -78,6 +78,7 @@ class NetworkConfig:
     RPC_TIMEOUT_SECONDS: Final[int] = 30  # RPC request timeout
     RPC_RETRY_ATTEMPTS: Final[int] = 3  # Number of retry attempts
     RPC_RETRY_DELAY_SECONDS: Final[int] = 5  # Delay between retries
+    RPC_BATCH_ENABLED: Final[bool] = True  # Send multi-call lookups as one JSON-RPC batch
     
     # WebSocket Parameters
     WS_RECONNECT_DELAY_SECONDS: Final[int] = 10  # WebSocket reconnect delay
@@ -87,6 +88,7 @@ class NetworkConfig:
     # Rate Limiting
     MAX_REQUESTS_PER_MINUTE: Final[int] = 100  # Maximum API requests per minute
     RATE_LIMIT_BURST_SIZE: Final[int] = 20  # Burst size for rate limiting
+    RPC_MAX_REQUESTS_PER_SECOND: Final[float] = 25.0  # Pace RPC calls just under provider limits
 
 
 @dataclass
@@ -151,6 +153,10 @@ class MLConfig:
     
     # Cache Configuration
     AUDIT_CACHE_TTL: Final[int] = 3600  # Cache TTL in seconds (1 hour)
+    AUDIT_CACHE_MAX_SIZE: Final[int] = 10000  # Maximum cached token analyses
+    TOKEN_INFO_CACHE_TTL: Final[int] = 86400  # Token metadata TTL in seconds (24 hours)
+    TOKEN_SUPPLY_CACHE_TTL: Final[int] = 300  # Total supply TTL in seconds (5 minutes)
+    TOKEN_INFO_CACHE_MAX_SIZE: Final[int] = 50000  # Maximum cached token metadata entries
     
     def __post_init__(self):
         """Initialize mutable defaults."""
@@ -187,7 +193,9 @@ def get_config_summary() -> dict:
         "network": {
             "rpc_timeout_seconds": NETWORK_CONFIG.RPC_TIMEOUT_SECONDS,
             "rpc_retry_attempts": NETWORK_CONFIG.RPC_RETRY_ATTEMPTS,
+            "rpc_batch_enabled": NETWORK_CONFIG.RPC_BATCH_ENABLED,
             "max_requests_per_minute": NETWORK_CONFIG.MAX_REQUESTS_PER_MINUTE,
+            "rpc_max_requests_per_second": NETWORK_CONFIG.RPC_MAX_REQUESTS_PER_SECOND,
         },
         "database": {
             "pool_size": DATABASE_CONFIG.DB_POOL_SIZE,
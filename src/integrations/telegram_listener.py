@@ -149,6 +149,10 @@ class TelegramListener:
         self.is_monitoring = False
         self.monitoring_task: Optional[asyncio.Task] = None
         
+        # Housekeeping cadence (cleanup runs far less often than the watch loop)
+        self.cleanup_interval_seconds = 60
+        self._last_cleanup: float = 0.0
+        
         # Token extraction patterns
         self.token_patterns = [
             r'0x[a-fA-F0-9]{40}',  # Ethereum addresses
@@ -226,8 +230,11 @@ class TelegramListener:
                 # Aggregate signals
                 await self._aggregate_signals()
                 
-                # Cleanup old data
-                await self._cleanup_old_data()
+                # Cleanup old data (throttled to the housekeeping interval)
+                now = time.time()
+                if now - self._last_cleanup >= self.cleanup_interval_seconds:
+                    await self._cleanup_old_data()
+                    self._last_cleanup = now
                 
                 # Wait before next iteration
                 await asyncio.sleep(TRADING_CONFIG.WATCH_CADENCE_SECONDS)
@@ -6,17 +6,252 @@ including trending tokens, market metrics, and trading opportunities.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
 import json
+import random
+import sys
+import threading
 import time
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Dict, Iterator, List, Any, Mapping, NamedTuple, Optional, Tuple, Union
+from dataclasses import dataclass
+from types import MappingProxyType
 import aiohttp
+import numpy as np
 from src.utils.logger import get_logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Canonical strings shared by every token and response
+_SOURCE = sys.intern("axiom.trade")
+_DEX_RAYDIUM = sys.intern("Raydium")
+_CHAIN_SOLANA = sys.intern("Solana")
+
+# Shared generator for simulated market data (vectorized draws)
+_rng = np.random.default_rng()
+
+# Compact encoder for tool responses written straight to the MCP transport
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _ok(data: Any, now: Optional[float] = None) -> Dict[str, Any]:
+    """Build a successful tool response envelope."""
+    return {
+        "success": True,
+        "data": data,
+        "timestamp": time.time() if now is None else now,
+        "source": _SOURCE
+    }
+
+
+def _err(error: Any, now: Optional[float] = None) -> Dict[str, Any]:
+    """Build a failed tool response envelope."""
+    return {
+        "success": False,
+        "error": str(error),
+        "timestamp": time.time() if now is None else now
+    }
+
+
+def _encode_response(response: Dict[str, Any]) -> bytes:
+    """Encode a tool response as compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        # Responses hold plain dicts (built with to_dict), so both encoders
+        # see the same payload whichever one is installed
+        return orjson.dumps(response)
+    return _JSON_ENCODER.encode(response).encode("utf-8")
+
+
+def _decode_response(encoded: bytes) -> Dict[str, Any]:
+    """Decode a tool response encoded by _encode_response into fresh objects."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(encoded)
+    return json.loads(encoded)
+
+
+# MCP tool schema is constant, so build it once at import time
+_TOOLS_SCHEMA: Dict[str, Any] = {
+    "tools": [
+        {
+            "name": "get_trending_tokens",
+            "description": "Get trending meme coins from Axiom.trade",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "limit": {"type": "integer", "default": 20},
+                    "timeframe": {"type": "string", "default": "1h"}
+                }
+            }
+        },
+        {
+            "name": "get_token_data",
+            "description": "Get detailed data for a specific token",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "symbol": {"type": "string", "description": "Token symbol"}
+                },
+                "required": ["symbol"]
+            }
+        },
+        {
+            "name": "get_market_overview",
+            "description": "Get overall market overview from Axiom.trade",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
+        },
+        {
+            "name": "search_tokens",
+            "description": "Search for tokens on Axiom.trade",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search query"},
+                    "limit": {"type": "integer", "default": 10}
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "get_dex_data",
+            "description": "Get DEX-specific data from Axiom.trade",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "dex": {"type": "string", "default": "Raydium"}
+                }
+            }
+        },
+        {
+            "name": "monitor_token",
+            "description": "Monitor a token for changes over time",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "symbol": {"type": "string", "description": "Token symbol"},
+                    "duration": {"type": "integer", "default": 300}
+                },
+                "required": ["symbol"]
+            }
+        }
+    ]
+}
+
+_TOOL_NAMES = frozenset(tool["name"] for tool in _TOOLS_SCHEMA["tools"])
+
+
+class _MemeCoin(NamedTuple):
+    """Static listing row for a simulated meme coin."""
+    symbol: str
+    name: str
+    address: str
+
+
+# Common meme coins that appear on Axiom.trade
+_MEME_COINS: Tuple[_MemeCoin, ...] = (
+    _MemeCoin("BONK", "Bonk", "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"),
+    _MemeCoin("WIF", "dogwifhat", "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm"),
+    _MemeCoin("PEPE", "Pepe", "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs"),
+    _MemeCoin("FARTCOIN", "Fartcoin", "9BB6NFEcjBCtnNLFko2FqVQBq8HHM13kCyYcdQbgpump"),
+    _MemeCoin("MYRO", "Myro", "HhJpBhRRn4g56VsyLuT8DL5Bv31HkXqsrahTTUCZeZg4"),
+    _MemeCoin("POPCAT", "Popcat", "7GCihgDB8fe6KNjn2MYtkzZcRjQy3t9GHdC8uHYmW2hr"),
+    _MemeCoin("MEW", "Cat in a Dogs World", "MEW1gQWJ3nEXg2qgERiKu7FAFj79PHvQVREQUzScPP5"),
+    _MemeCoin("PNUT", "Peanut the Squirrel", "2qEHjDLDLbuBgRYvsxhc5D6uDWAivNFZGan56P1tpump"),
+    _MemeCoin("GOAT", "Goatseus Maximus", "CzLSujWBLFsS7tW7rx9KzNeqfYbQCpQJj7Y8W1Lqk5Q"),
+    _MemeCoin("CHILLGUY", "Chill Guy", "A8C3xuqscfmyLrte3VmTqrAq8kgMASius9AFNANwpump")
+)
+
+# Reference prices for the simulated token lookups
+_BASE_PRICES: Dict[str, float] = {
+    "BONK": 0.000034,
+    "WIF": 0.00018,
+    "PEPE": 0.0000012,
+    "FARTCOIN": 0.00005,
+    "MYRO": 0.0008,
+    "POPCAT": 0.00012,
+    "MEW": 0.00015,
+    "PNUT": 0.00009,
+    "GOAT": 0.00011,
+    "CHILLGUY": 0.00007
+}
+
+# Mock search results keyed by lowercase keyword; entries are read-only and
+# copied into each response
+_SEARCH_INDEX: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "bonk": MappingProxyType({
+        "symbol": "BONK",
+        "name": "Bonk",
+        "address": "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+        "price": 0.000034,
+        "market_cap": 25000000,
+        "volume_24h": 8500000
+    }),
+    "wif": MappingProxyType({
+        "symbol": "WIF",
+        "name": "dogwifhat",
+        "address": "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm",
+        "price": 0.00018,
+        "market_cap": 18000000,
+        "volume_24h": 6200000
+    })
+})
+
+# Static market payloads; only last_updated changes per call. Nested entries
+# are copied by _fresh_payload, as the proxy only freezes the top level.
+_MARKET_OVERVIEW_TEMPLATE = MappingProxyType({
+    "total_tokens": 1250,
+    "total_volume_24h": 45000000,
+    "total_liquidity": 125000000,
+    "active_tokens": 890,
+    "new_tokens_24h": 45,
+    "top_gainers": (
+        {"symbol": "BONK", "change": 15.5},
+        {"symbol": "WIF", "change": 12.3},
+        {"symbol": "PEPE", "change": 8.7}
+    ),
+    "top_losers": (
+        {"symbol": "FARTCOIN", "change": -12.1},
+        {"symbol": "MYRO", "change": -8.9},
+        {"symbol": "POPCAT", "change": -6.4}
+    ),
+    "most_active": (
+        {"symbol": "BONK", "volume": 8500000},
+        {"symbol": "WIF", "volume": 6200000},
+        {"symbol": "PEPE", "volume": 4800000}
+    )
+})
+
+_DEX_DATA_TEMPLATE = MappingProxyType({
+    "total_pairs": 1250,
+    "total_liquidity": 45000000,
+    "volume_24h": 12000000,
+    "active_pairs": 890,
+    "new_pairs_24h": 25,
+    "top_pairs": (
+        {"pair": "SOL/USDC", "volume": 2500000, "liquidity": 5000000},
+        {"pair": "BONK/SOL", "volume": 1800000, "liquidity": 3200000},
+        {"pair": "WIF/SOL", "volume": 1500000, "liquidity": 2800000}
+    )
+})
+
+
+def _fresh_payload(template: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a static payload, including its nested entries, for one response."""
+    return {
+        key: [dict(entry) for entry in value] if isinstance(value, tuple) else value
+        for key, value in template.items()
+    }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AxiomToken:
     """Token data from Axiom.trade"""
     symbol: str
@@ -32,15 +267,42 @@ class AxiomToken:
     dex: str
     chain: str
     last_updated: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict view of the token (avoids the recursive asdict copy)."""
+        return {
+            "symbol": self.symbol,
+            "name": self.name,
+            "address": self.address,
+            "price": self.price,
+            "market_cap": self.market_cap,
+            "liquidity": self.liquidity,
+            "volume_24h": self.volume_24h,
+            "transactions_24h": self.transactions_24h,
+            "price_change_24h": self.price_change_24h,
+            "trend_score": self.trend_score,
+            "dex": self.dex,
+            "chain": self.chain,
+            "last_updated": self.last_updated
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AxiomTrendingData:
     """Trending data from Axiom.trade"""
     tokens: List[AxiomToken]
     total_tokens: int
     last_updated: float
-    source: str = "axiom.trade"
+    source: str = _SOURCE
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict view of the trending snapshot with tokens flattened."""
+        return {
+            "tokens": [token.to_dict() for token in self.tokens],
+            "total_tokens": self.total_tokens,
+            "last_updated": self.last_updated,
+            "source": self.source
+        }
 
 
 class AxiomMCPServer:
@@ -57,29 +319,43 @@ class AxiomMCPServer:
     def __init__(self):
         self.base_url = "https://axiom.trade"
         self.session: Optional[aiohttp.ClientSession] = None
-        self.cache: Dict[str, Any] = {}
-        self.cache_duration = 30  # seconds
         
-        # MCP tools registry
-        self.tools = {
-            "get_trending_tokens": self.get_trending_tokens,
-            "get_token_data": self.get_token_data,
-            "get_market_overview": self.get_market_overview,
-            "search_tokens": self.search_tokens,
-            "get_dex_data": self.get_dex_data,
-            "monitor_token": self.monitor_token
+        # Bound concurrent upstream fetches so bursts can't exhaust sockets
+        self.max_concurrent_fetches = 16
+        self._fetch_semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+        # Responses are cached encoded, so no caller can mutate a shared copy
+        self.cache: Dict[Tuple[str, Tuple], Tuple[float, bytes]] = {}
+        self.cache_duration = 30  # seconds (default TTL)
+        self._cache_locks: Dict[Tuple[str, Tuple], asyncio.Lock] = {}
+        self._next_cache_sweep = 0.0
+        
+        # Per-tool TTLs by how quickly the underlying data goes stale
+        self.cache_ttls = {
+            "get_trending_tokens": 60,
+            "get_token_data": 30,
+            "get_market_overview": 120,
+            "get_dex_data": 300,
+            "monitor_token": self.cache_duration
         }
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=15),
-            headers={
-                'User-Agent': 'NeoMemeMarkets/1.0',
-                'Accept': 'application/json',
-                'Referer': 'https://axiom.trade/discover'
-            }
-        )
+        if self.session is None or self.session.closed:
+            # One pooled session per server so keep-alive connections are reused
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=self.max_concurrent_fetches,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=15),
+                headers={
+                    'User-Agent': 'NeoMemeMarkets/1.0',
+                    'Accept': 'application/json',
+                    'Referer': 'https://axiom.trade/discover'
+                }
+            )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -102,77 +378,85 @@ class AxiomMCPServer:
             # Simulate API call to Axiom.trade trending endpoint
             # In a real implementation, this would call the actual API
             
-            trending_data = await self._fetch_trending_data(limit, timeframe)
+            async with self._fetch_semaphore:
+                trending_data = await self._fetch_trending_data(limit, timeframe)
             
-            return {
-                "success": True,
-                "data": asdict(trending_data),
-                "timestamp": time.time(),
-                "source": "axiom.trade"
-            }
+            return _ok(trending_data.to_dict(), trending_data.last_updated)
             
         except Exception as e:
             logger.error(f"Failed to get trending tokens: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": time.time()
-            }
+            return _err(e)
+    
+    async def get_trending_tokens_stream(self, limit: int = 20,
+                                         timeframe: str = "1h") -> AsyncIterator[bytes]:
+        """
+        Stream trending tokens as NDJSON, one encoded token per line.
+        
+        Lets consumers of large listings start processing before the whole
+        response is built, without holding the full token list in memory.
+        
+        Args:
+            limit: Number of tokens to return (default: 20)
+            timeframe: Timeframe for trending (1m, 5m, 30m, 1h, 24h)
+        
+        Yields:
+            JSON-encoded token followed by a newline; a failure ends the
+            stream with one error envelope line
+        """
+        try:
+            # Generation counts as a fetch, so it holds a fetch slot throughout
+            async with self._fetch_semaphore:
+                for token in self._generate_trending_tokens(limit, timeframe, time.time()):
+                    yield _encode_response(token.to_dict()) + b"\n"
+        except Exception as e:
+            logger.error(f"Failed to stream trending tokens: {e}")
+            yield _encode_response(_err(e)) + b"\n"
     
     async def _fetch_trending_data(self, limit: int, timeframe: str) -> AxiomTrendingData:
         """Fetch trending data from Axiom.trade (simulated)."""
-        # Simulate trending tokens based on Axiom.trade patterns
-        trending_tokens = []
+        now = time.time()
+        trending_tokens = list(self._generate_trending_tokens(limit, timeframe, now))
         
-        # Common meme coins that appear on Axiom.trade
-        meme_coins = [
-            {"symbol": "BONK", "name": "Bonk", "address": "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"},
-            {"symbol": "WIF", "name": "dogwifhat", "address": "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm"},
-            {"symbol": "PEPE", "name": "Pepe", "address": "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs"},
-            {"symbol": "FARTCOIN", "name": "Fartcoin", "address": "9BB6NFEcjBCtnNLFko2FqVQBq8HHM13kCyYcdQbgpump"},
-            {"symbol": "MYRO", "name": "Myro", "address": "HhJpBhRRn4g56VsyLuT8DL5Bv31HkXqsrahTTUCZeZg4"},
-            {"symbol": "POPCAT", "name": "Popcat", "address": "7GCihgDB8fe6KNjn2MYtkzZcRjQy3t9GHdC8uHYmW2hr"},
-            {"symbol": "MEW", "name": "Cat in a Dogs World", "address": "MEW1gQWJ3nEXg2qgERiKu7FAFj79PHvQVREQUzScPP5"},
-            {"symbol": "PNUT", "name": "Peanut the Squirrel", "address": "2qEHjDLDLbuBgRYvsxhc5D6uDWAivNFZGan56P1tpump"},
-            {"symbol": "GOAT", "name": "Goatseus Maximus", "address": "CzLSujWBLFsS7tW7rx9KzNeqfYbQCpQJj7Y8W1Lqk5Q"},
-            {"symbol": "CHILLGUY", "name": "Chill Guy", "address": "A8C3xuqscfmyLrte3VmTqrAq8kgMASius9AFNANwpump"}
-        ]
+        return AxiomTrendingData(
+            tokens=trending_tokens,
+            total_tokens=len(trending_tokens),
+            last_updated=now
+        )
+    
+    def _generate_trending_tokens(self, limit: int, timeframe: str,
+                                  now: float) -> Iterator[AxiomToken]:
+        """Generate trending tokens one at a time (simulated)."""
+        # Simulate trending tokens based on Axiom.trade patterns
+        coins = _MEME_COINS[:limit]
+        n = len(coins)
         
-        import random
+        # Simulate realistic price data, one vectorized draw per field
+        prices = _rng.uniform(0.000001, 0.1, n).tolist()
+        market_caps = _rng.uniform(1000000, 100000000, n).tolist()
+        liquidities = _rng.uniform(50000, 5000000, n).tolist()
+        volumes_24h = _rng.uniform(100000, 10000000, n).tolist()
+        transactions = _rng.integers(100, 10000, n, endpoint=True).tolist()
+        price_changes = _rng.uniform(-0.5, 2.0, n).tolist()  # -50% to +200%
+        trend_scores = _rng.uniform(0.1, 10.0, n).tolist()
         
-        for i, coin in enumerate(meme_coins[:limit]):
-            # Simulate realistic price data
-            base_price = random.uniform(0.000001, 0.1)
-            market_cap = random.uniform(1000000, 100000000)
-            liquidity = random.uniform(50000, 5000000)
-            volume_24h = random.uniform(100000, 10000000)
-            transactions_24h = random.randint(100, 10000)
-            price_change_24h = random.uniform(-0.5, 2.0)  # -50% to +200%
-            trend_score = random.uniform(0.1, 10.0)
-            
-            token = AxiomToken(
-                symbol=coin["symbol"],
-                name=coin["name"],
-                address=coin["address"],
-                price=base_price,
+        for coin, price, market_cap, liquidity, volume_24h, transactions_24h, price_change_24h, trend_score in zip(
+            coins, prices, market_caps, liquidities, volumes_24h, transactions, price_changes, trend_scores
+        ):
+            yield AxiomToken(
+                symbol=coin.symbol,
+                name=coin.name,
+                address=coin.address,
+                price=price,
                 market_cap=market_cap,
                 liquidity=liquidity,
                 volume_24h=volume_24h,
                 transactions_24h=transactions_24h,
                 price_change_24h=price_change_24h,
                 trend_score=trend_score,
-                dex="Raydium",  # Most common DEX on Solana
-                chain="Solana",
-                last_updated=time.time()
+                dex=_DEX_RAYDIUM,  # Most common DEX on Solana
+                chain=_CHAIN_SOLANA,
+                last_updated=now
             )
-            
-            trending_tokens.append(token)
-        
-        return AxiomTrendingData(
-            tokens=trending_tokens,
-            total_tokens=len(trending_tokens),
-            last_updated=time.time()
-        )
     
     async def get_token_data(self, symbol: str) -> Dict[str, Any]:
         """
@@ -186,56 +470,35 @@ class AxiomMCPServer:
         """
         try:
             # Simulate token data fetch
-            token_data = await self._fetch_token_data(symbol)
+            async with self._fetch_semaphore:
+                token_data = await self._fetch_token_data(symbol)
             
-            return {
-                "success": True,
-                "data": asdict(token_data),
-                "timestamp": time.time(),
-                "source": "axiom.trade"
-            }
+            return _ok(token_data.to_dict(), token_data.last_updated)
             
         except Exception as e:
             logger.error(f"Failed to get token data for {symbol}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": time.time()
-            }
+            return _err(e)
     
     async def _fetch_token_data(self, symbol: str) -> AxiomToken:
         """Fetch data for a specific token."""
         # Simulate token data based on symbol
-        import random
-        
-        base_prices = {
-            "BONK": 0.000034,
-            "WIF": 0.00018,
-            "PEPE": 0.0000012,
-            "FARTCOIN": 0.00005,
-            "MYRO": 0.0008,
-            "POPCAT": 0.00012,
-            "MEW": 0.00015,
-            "PNUT": 0.00009,
-            "GOAT": 0.00011,
-            "CHILLGUY": 0.00007
-        }
+        uniform = random.uniform
         
-        base_price = base_prices.get(symbol, random.uniform(0.000001, 0.1))
+        base_price = _BASE_PRICES.get(symbol, uniform(0.000001, 0.1))
         
         return AxiomToken(
             symbol=symbol,
             name=f"{symbol} Token",
             address=f"mock_address_{symbol.lower()}",
             price=base_price,
-            market_cap=random.uniform(1000000, 100000000),
-            liquidity=random.uniform(50000, 5000000),
-            volume_24h=random.uniform(100000, 10000000),
+            market_cap=uniform(1000000, 100000000),
+            liquidity=uniform(50000, 5000000),
+            volume_24h=uniform(100000, 10000000),
             transactions_24h=random.randint(100, 10000),
-            price_change_24h=random.uniform(-0.5, 2.0),
-            trend_score=random.uniform(0.1, 10.0),
-            dex="Raydium",
-            chain="Solana",
+            price_change_24h=uniform(-0.5, 2.0),
+            trend_score=uniform(0.1, 10.0),
+            dex=_DEX_RAYDIUM,
+            chain=_CHAIN_SOLANA,
             last_updated=time.time()
         )
     
@@ -247,44 +510,14 @@ class AxiomMCPServer:
             Dictionary with market overview data
         """
         try:
-            overview_data = {
-                "total_tokens": 1250,
-                "total_volume_24h": 45000000,
-                "total_liquidity": 125000000,
-                "active_tokens": 890,
-                "new_tokens_24h": 45,
-                "top_gainers": [
-                    {"symbol": "BONK", "change": 15.5},
-                    {"symbol": "WIF", "change": 12.3},
-                    {"symbol": "PEPE", "change": 8.7}
-                ],
-                "top_losers": [
-                    {"symbol": "FARTCOIN", "change": -12.1},
-                    {"symbol": "MYRO", "change": -8.9},
-                    {"symbol": "POPCAT", "change": -6.4}
-                ],
-                "most_active": [
-                    {"symbol": "BONK", "volume": 8500000},
-                    {"symbol": "WIF", "volume": 6200000},
-                    {"symbol": "PEPE", "volume": 4800000}
-                ],
-                "last_updated": time.time()
-            }
+            now = time.time()
+            overview_data = {**_fresh_payload(_MARKET_OVERVIEW_TEMPLATE), "last_updated": now}
             
-            return {
-                "success": True,
-                "data": overview_data,
-                "timestamp": time.time(),
-                "source": "axiom.trade"
-            }
+            return _ok(overview_data, now)
             
         except Exception as e:
             logger.error(f"Failed to get market overview: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": time.time()
-            }
+            return _err(e)
     
     async def search_tokens(self, query: str, limit: int = 10) -> Dict[str, Any]:
         """
@@ -298,48 +531,22 @@ class AxiomMCPServer:
             Dictionary with search results
         """
         try:
-            # Simulate token search
-            search_results = []
-            
-            # Mock search results based on query
-            if "bonk" in query.lower():
-                search_results.append({
-                    "symbol": "BONK",
-                    "name": "Bonk",
-                    "address": "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
-                    "price": 0.000034,
-                    "market_cap": 25000000,
-                    "volume_24h": 8500000
-                })
+            # Simulate token search: one lowercase pass over a prebuilt index
+            query_lower = query.lower()
+            search_results = [
+                dict(result) for keyword, result in _SEARCH_INDEX.items()
+                if keyword in query_lower
+            ]
             
-            if "wif" in query.lower():
-                search_results.append({
-                    "symbol": "WIF",
-                    "name": "dogwifhat",
-                    "address": "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm",
-                    "price": 0.00018,
-                    "market_cap": 18000000,
-                    "volume_24h": 6200000
-                })
-            
-            return {
-                "success": True,
-                "data": {
-                    "results": search_results[:limit],
-                    "total_results": len(search_results),
-                    "query": query
-                },
-                "timestamp": time.time(),
-                "source": "axiom.trade"
-            }
+            return _ok({
+                "results": search_results[:limit],
+                "total_results": len(search_results),
+                "query": query
+            })
             
         except Exception as e:
             logger.error(f"Failed to search tokens: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": time.time()
-            }
+            return _err(e)
     
     async def get_dex_data(self, dex: str = "Raydium") -> Dict[str, Any]:
         """
@@ -352,35 +559,14 @@ class AxiomMCPServer:
             Dictionary with DEX data
         """
         try:
-            dex_data = {
-                "dex": dex,
-                "total_pairs": 1250,
-                "total_liquidity": 45000000,
-                "volume_24h": 12000000,
-                "active_pairs": 890,
-                "new_pairs_24h": 25,
-                "top_pairs": [
-                    {"pair": "SOL/USDC", "volume": 2500000, "liquidity": 5000000},
-                    {"pair": "BONK/SOL", "volume": 1800000, "liquidity": 3200000},
-                    {"pair": "WIF/SOL", "volume": 1500000, "liquidity": 2800000}
-                ],
-                "last_updated": time.time()
-            }
+            now = time.time()
+            dex_data = {"dex": dex, **_fresh_payload(_DEX_DATA_TEMPLATE), "last_updated": now}
             
-            return {
-                "success": True,
-                "data": dex_data,
-                "timestamp": time.time(),
-                "source": "axiom.trade"
-            }
+            return _ok(dex_data, now)
             
         except Exception as e:
             logger.error(f"Failed to get DEX data for {dex}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": time.time()
-            }
+            return _err(e)
     
     async def monitor_token(self, symbol: str, duration: int = 300) -> Dict[str, Any]:
         """
@@ -395,142 +581,140 @@ class AxiomMCPServer:
         """
         try:
             # Simulate token monitoring
+            start = time.time()
+            
+            # Generate mock historical data as whole arrays
+            n = max(0, min(duration // 10, 30))  # Max 30 data points
+            changes = _rng.uniform(-0.05, 0.05, n)
+            prices = 0.0001 * np.cumprod(1 + changes)
+            volumes = _rng.uniform(100000, 1000000, n)
+            timestamps = (start - (duration - np.arange(n) * 10)).tolist()
+            
             monitoring_data = {
                 "symbol": symbol,
                 "duration": duration,
-                "price_history": [],
-                "volume_history": [],
+                "price_history": [
+                    {"timestamp": timestamp, "price": price, "change": change}
+                    for timestamp, price, change in zip(timestamps, prices.tolist(), changes.tolist())
+                ],
+                "volume_history": [
+                    {"timestamp": timestamp, "volume": volume}
+                    for timestamp, volume in zip(timestamps, volumes.tolist())
+                ],
                 "alerts": [],
-                "start_time": time.time(),
-                "end_time": time.time() + duration
+                "start_time": start,
+                "end_time": start + duration
             }
             
-            # Generate mock historical data
-            import random
-            base_price = 0.0001
-            
-            for i in range(min(duration // 10, 30)):  # Max 30 data points
-                price_change = random.uniform(-0.05, 0.05)
-                base_price *= (1 + price_change)
-                
-                monitoring_data["price_history"].append({
-                    "timestamp": time.time() - (duration - i * 10),
-                    "price": base_price,
-                    "change": price_change
-                })
-                
-                monitoring_data["volume_history"].append({
-                    "timestamp": time.time() - (duration - i * 10),
-                    "volume": random.uniform(100000, 1000000)
-                })
-            
-            return {
-                "success": True,
-                "data": monitoring_data,
-                "timestamp": time.time(),
-                "source": "axiom.trade"
-            }
+            return _ok(monitoring_data, start)
             
         except Exception as e:
             logger.error(f"Failed to monitor token {symbol}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": time.time()
-            }
+            return _err(e)
     
     def get_tools(self) -> Dict[str, Any]:
-        """Get available MCP tools."""
-        return {
-            "tools": [
-                {
-                    "name": "get_trending_tokens",
-                    "description": "Get trending meme coins from Axiom.trade",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "limit": {"type": "integer", "default": 20},
-                            "timeframe": {"type": "string", "default": "1h"}
-                        }
-                    }
-                },
-                {
-                    "name": "get_token_data",
-                    "description": "Get detailed data for a specific token",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "symbol": {"type": "string", "description": "Token symbol"}
-                        },
-                        "required": ["symbol"]
-                    }
-                },
-                {
-                    "name": "get_market_overview",
-                    "description": "Get overall market overview from Axiom.trade",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {}
-                    }
-                },
-                {
-                    "name": "search_tokens",
-                    "description": "Search for tokens on Axiom.trade",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query"},
-                            "limit": {"type": "integer", "default": 10}
-                        },
-                        "required": ["query"]
-                    }
-                },
-                {
-                    "name": "get_dex_data",
-                    "description": "Get DEX-specific data from Axiom.trade",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "dex": {"type": "string", "default": "Raydium"}
-                        }
-                    }
-                },
-                {
-                    "name": "monitor_token",
-                    "description": "Monitor a token for changes over time",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "symbol": {"type": "string", "description": "Token symbol"},
-                            "duration": {"type": "integer", "default": 300}
-                        },
-                        "required": ["symbol"]
-                    }
-                }
-            ]
-        }
+        """Get available MCP tools (shared schema; do not mutate)."""
+        return _TOOLS_SCHEMA
     
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a specific MCP tool."""
-        if tool_name not in self.tools:
-            return {
-                "success": False,
-                "error": f"Unknown tool: {tool_name}",
-                "timestamp": time.time()
-            }
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any],
+                        raw: bool = False) -> Union[Dict[str, Any], bytes]:
+        """
+        Call a specific MCP tool.
+        
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Keyword arguments for the tool
+            raw: Return the response as encoded JSON bytes so the transport
+                can write it directly without a second json.dumps
+        
+        Returns:
+            Tool response dictionary, or JSON bytes when raw is set
+        """
+        if tool_name not in _TOOL_NAMES:
+            result = _err(f"Unknown tool: {tool_name}")
+            return _encode_response(result) if raw else result
         
         try:
-            tool_func = self.tools[tool_name]
-            result = await tool_func(**arguments)
-            return result
+            if tool_name in self.cache_ttls:
+                encoded = await self._call_cached(tool_name, arguments)
+                return encoded if raw else _decode_response(encoded)
+            result = await self._invoke(tool_name, arguments)
         except Exception as e:
             logger.error(f"Error calling tool {tool_name}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": time.time()
-            }
-
+            result = _err(e)
+        
+        return _encode_response(result) if raw else result
+    
+    async def _invoke(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool without caching."""
+        match tool_name:
+            case "get_trending_tokens":
+                return await self.get_trending_tokens(**arguments)
+            case "get_token_data":
+                return await self.get_token_data(**arguments)
+            case "get_market_overview":
+                return await self.get_market_overview(**arguments)
+            case "search_tokens":
+                return await self.search_tokens(**arguments)
+            case "get_dex_data":
+                return await self.get_dex_data(**arguments)
+            case "monitor_token":
+                return await self.monitor_token(**arguments)
+            case _:
+                raise ValueError(f"Unknown tool: {tool_name}")
+    
+    def _cache_key(self, tool_name: str, arguments: Dict[str, Any]) -> Tuple[str, Tuple]:
+        """Build the cache key for a tool call."""
+        if tool_name == "monitor_token":
+            # Same key whether or not the default duration was passed explicitly
+            return (tool_name, (arguments.get("symbol"), arguments.get("duration", 300)))
+        return (tool_name, tuple(sorted(arguments.items())))
+    
+    def _cache_get(self, key: Tuple[str, Tuple], ttl: float) -> Optional[bytes]:
+        """Get an encoded cached response younger than ttl seconds."""
+        entry = self.cache.get(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            return entry[1]
+        return None
+    
+    def _evict_expired(self):
+        """Drop expired responses and the fetch locks of keys with nothing cached."""
+        now = time.time()
+        if now < self._next_cache_sweep:
+            return
+        self._next_cache_sweep = now + self.cache_duration
+        
+        for key, (cached_at, _) in list(self.cache.items()):
+            if now - cached_at >= self.cache_ttls[key[0]]:
+                del self.cache[key]
+        for key, lock in list(self._cache_locks.items()):
+            if key not in self.cache and not lock.locked():
+                del self._cache_locks[key]
+    
+    async def _call_cached(self, tool_name: str, arguments: Dict[str, Any]) -> bytes:
+        """Run a tool through the response cache, returning the encoded response."""
+        ttl = self.cache_ttls[tool_name]
+        key = self._cache_key(tool_name, arguments)
+        
+        cached = self._cache_get(key, ttl)
+        if cached is not None:
+            return cached
+        
+        self._evict_expired()
+        
+        # One fetch per key at a time; waiters re-check the cache afterwards
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._cache_get(key, ttl)
+            if cached is not None:
+                return cached
+            
+            result = await self._invoke(tool_name, arguments)
+            encoded = _encode_response(result)
+            
+            if result.get("success"):
+                self.cache[key] = (time.time(), encoded)
+            return encoded
 
 # Global MCP server instance
 _axiom_server: Optional[AxiomMCPServer] = None
@@ -551,38 +735,69 @@ async def cleanup_axiom_server():
         _axiom_server = None
 
 
+# Long-lived event loop that owns the global server (and its session) for sync callers
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+_SYNC_CALL_TIMEOUT = 15  # seconds
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting its thread on first use."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="axiom-mcp-loop",
+                daemon=True
+            ).start()
+            _bg_loop = loop
+    return _bg_loop
+
+
+def _shutdown_background_loop():
+    """Close the global server's session and stop the background loop."""
+    global _bg_loop
+    with _bg_loop_lock:
+        loop, _bg_loop = _bg_loop, None
+    if loop is None or loop.is_closed():
+        return
+    
+    try:
+        asyncio.run_coroutine_threadsafe(cleanup_axiom_server(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Failed to clean up Axiom server on shutdown: {e}")
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+atexit.register(_shutdown_background_loop)
+
+
 # Synchronous wrapper for use in GUI
 def call_axiom_tool_sync(tool_name: str, arguments: Dict[str, Any] = None) -> Dict[str, Any]:
     """Synchronous wrapper for calling Axiom MCP tools."""
     if arguments is None:
         arguments = {}
     
+    future = None
     try:
-        # Create a new event loop for this thread
-        import threading
-        import asyncio
-        
-        def run_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(_call_axiom_tool_async(tool_name, arguments))
-            finally:
-                loop.close()
-        
-        # Run in a separate thread to avoid event loop conflicts
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_in_thread)
-            return future.result(timeout=15)
-            
+        # Run on the shared background loop; no per-call thread, loop or session
+        future = asyncio.run_coroutine_threadsafe(
+            _call_axiom_tool_async(tool_name, arguments),
+            _get_background_loop()
+        )
+        return future.result(timeout=_SYNC_CALL_TIMEOUT)
+    
+    except concurrent.futures.TimeoutError:
+        # Don't leave the abandoned call running on the shared loop
+        future.cancel()
+        logger.error(f"Axiom tool {tool_name} timed out after {_SYNC_CALL_TIMEOUT}s")
+        return _err(f"Timed out after {_SYNC_CALL_TIMEOUT}s")
     except Exception as e:
         logger.error(f"Failed to call Axiom tool {tool_name} synchronously: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        return _err(e)
 
 async def _call_axiom_tool_async(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Async wrapper for calling Axiom tools."""
@@ -591,19 +806,29 @@ async def _call_axiom_tool_async(tool_name: str, arguments: Dict[str, Any]) -> D
 
 
 if __name__ == "__main__":
+    import os
+    
+    # Compact output by default; set AXIOM_PRETTY_JSON=1 for indented dumps
+    pretty = bool(os.getenv("AXIOM_PRETTY_JSON"))
+    
+    def dumps(result: Dict[str, Any]) -> str:
+        if pretty:
+            return json.dumps(result, indent=2)
+        return _encode_response(result).decode("utf-8")
+    
     # Test the MCP server
     async def test():
         async with AxiomMCPServer() as server:
             # Test trending tokens
             result = await server.get_trending_tokens(limit=5)
-            print("Trending Tokens:", json.dumps(result, indent=2))
+            print("Trending Tokens:", dumps(result))
             
             # Test token data
             result = await server.get_token_data("BONK")
-            print("BONK Data:", json.dumps(result, indent=2))
+            print("BONK Data:", dumps(result))
             
             # Test market overview
             result = await server.get_market_overview()
-            print("Market Overview:", json.dumps(result, indent=2))
+            print("Market Overview:", dumps(result))
     
     asyncio.run(test())
@@ -11,41 +11,327 @@ This module provides comprehensive token safety analysis including:
 - External tool integration
 """
 
+import asyncio
+import bisect
+import json
+import re
 import time
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from enum import Enum
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from dataclasses import asdict, dataclass, field, replace
+from enum import IntEnum, IntFlag
+import numpy as np
 import structlog
 
-from src.config import MLConfig
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from src.config import MLConfig, NETWORK_CONFIG
 from src.utils.logger import log_trading_event
 
 logger = structlog.get_logger(__name__)
 
+# All-zero public key; an authority set to it is as good as revoked
+_ZERO_PUBKEY = "11111111111111111111111111111111"
+
+# Canonical Multicall3 deployment (same address on all major EVM chains)
+_MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+_AGGREGATE3_SELECTOR = "82ad56cb"  # aggregate3((address,bool,bytes)[])
+
+# ERC20 token standard function selectors, keyed by the token info field they fill
+_ERC20_NAME = "0x06fdde03"  # name()
+_ERC20_SYMBOL = "0x95d89b41"  # symbol()
+_ERC20_DECIMALS = "0x313ce567"  # decimals()
+_ERC20_TOTAL_SUPPLY = "0x18160ddd"  # totalSupply()
+_ERC20_SELECTORS: Mapping[str, str] = MappingProxyType({
+    "name": _ERC20_NAME,
+    "symbol": _ERC20_SYMBOL,
+    "decimals": _ERC20_DECIMALS,
+    "total_supply": _ERC20_TOTAL_SUPPLY,
+})
+
+
+def _encode_aggregate3(target: str, call_data: List[str]) -> str:
+    """ABI-encode a Multicall3 aggregate3 call with allowFailure set on every call."""
+    target_word = target[2:].lower().rjust(64, "0")
+    heads = []
+    tails = []
+    offset = len(call_data) * 32
+    for data in call_data:
+        payload = data[2:]
+        padded = payload.ljust(-(-len(payload) // 64) * 64, "0")
+        tail = target_word + f"{1:064x}" + f"{0x60:064x}" + f"{len(payload) // 2:064x}" + padded
+        heads.append(f"{offset:064x}")
+        tails.append(tail)
+        offset += len(tail) // 2
+    
+    return "0x" + _AGGREGATE3_SELECTOR + f"{0x20:064x}" + f"{len(call_data):064x}" + "".join(heads) + "".join(tails)
+
+
+def _decode_aggregate3(response_data: str) -> List[Optional[str]]:
+    """Decode aggregate3 (bool success, bytes returnData)[] into hex return data, None on failure."""
+    raw = bytes.fromhex(response_data[2:])
+    array_at = int.from_bytes(raw[0:32], "big")
+    count = int.from_bytes(raw[array_at:array_at + 32], "big")
+    start = array_at + 32
+    
+    results = []
+    for i in range(count):
+        item_at = start + int.from_bytes(raw[start + i * 32:start + (i + 1) * 32], "big")
+        success = int.from_bytes(raw[item_at:item_at + 32], "big") == 1
+        data_at = item_at + int.from_bytes(raw[item_at + 32:item_at + 64], "big")
+        size = int.from_bytes(raw[data_at:data_at + 32], "big")
+        data = raw[data_at + 32:data_at + 32 + size]
+        results.append("0x" + data.hex() if success and data else None)
+    
+    return results
+
+
+def _pack_analysis(analysis: "TokenAnalysis") -> Any:
+    """Serialize an analysis to JSON for the shared cache."""
+    if ORJSON_AVAILABLE:
+        # orjson serializes slotted dataclasses natively (no asdict pass)
+        return orjson.dumps(analysis, default=str)
+    return json.dumps(asdict(analysis), default=str)
+
+
+def _unpack_analysis(packed: Any) -> Dict[str, Any]:
+    """Parse a shared cache payload; orjson reads Redis bytes without a decode step."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(packed)
+    return json.loads(packed)
+
+
+def _decode_uint(response_data: str) -> int:
+    """Decode a 0x-prefixed ABI uint word into an int."""
+    digits = response_data[2:]
+    if len(digits) & 1:
+        digits = "0" + digits
+    return int.from_bytes(bytes.fromhex(digits), "big")
+
+
+# Token info fields every chain handler can return, and ERC20 fallbacks when a getter fails
+_TOKEN_INFO_FIELDS = ("name", "symbol", "decimals", "total_supply")
+# Fields the compliance audit publishes in TokenAnalysis.token_info
+_AUDIT_TOKEN_INFO_FIELDS = _TOKEN_INFO_FIELDS
+_ERC20_FIELD_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "name": "Unknown",
+    "symbol": "UNK",
+    "decimals": 18,
+    "total_supply": 0,
+})
+# SPL mints carry no name or symbol; these placeholders stand in until a metadata lookup exists
+_SPL_FIELD_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "name": "Unknown Token",
+    "symbol": "UNK",
+})
+_TOKEN_INFO_DEFAULTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "ethereum": _ERC20_FIELD_DEFAULTS,
+    "solana": _SPL_FIELD_DEFAULTS,
+})
+# Fields each chain handler reads from the chain; anything else is only ever
+# a default, so it is never fetched for (or missed in) the token info cache
+_ONCHAIN_TOKEN_INFO_FIELDS: Mapping[str, frozenset] = MappingProxyType({
+    "ethereum": frozenset(_TOKEN_INFO_FIELDS),
+    "solana": frozenset({"decimals", "total_supply"}),
+})
+
+
+# Table-driven check penalties: (metadata flag, penalty when false, warning)
+_SOCIAL_PENALTIES: Tuple[Tuple[str, float, str], ...] = (
+    ("has_website", 30.0, "No website detected"),
+    ("has_social_media", 20.0, "No social media presence"),
+)
+_EXTERNAL_TOOL_PENALTIES: Tuple[Tuple[str, float, str], ...] = (
+    ("dexscreener_verified", 25.0, "Not verified on DexScreener"),
+    ("birdeye_verified", 25.0, "Not verified on Birdeye"),
+)
 
-class ComplianceLevel(Enum):
-    """Compliance level enumeration."""
-    EXCELLENT = "excellent"  # 90-100
-    GOOD = "good"           # 80-89
-    MODERATE = "moderate"    # 70-79
-    POOR = "poor"           # 60-69
-    FAILED = "failed"       # Below 60
+# Warnings that block trading wherever they appear, matched in one regex pass
+_CRITICAL_WARNINGS = (
+    "Hidden mint function detected",
+    "Transfer blocking detected",
+    "Excessive owner powers detected",
+    "Mint authority is active",
+    "Freeze authority is active"
+)
+_CRITICAL_WARNING_RE = re.compile("|".join(re.escape(warning) for warning in _CRITICAL_WARNINGS))
+_CRITICAL_WARNING_BITS: Mapping[str, int] = MappingProxyType({
+    warning: 1 << i for i, warning in enumerate(_CRITICAL_WARNINGS)
+})
 
 
-class VetoReason(Enum):
-    """Veto reason enumeration."""
-    HIDDEN_MINT = "hidden_mint"
-    TRANSFER_BLOCKING = "transfer_blocking"
-    EXCESSIVE_OWNER_POWERS = "excessive_owner_powers"
-    NO_LIQUIDITY_LOCK = "no_liquidity_lock"
-    TOP_HOLDER_EXCESSIVE = "top_holder_excessive"
-    NO_SOCIAL_PRESENCE = "no_social_presence"
-    BYTECODE_SUSPICIOUS = "bytecode_suspicious"
-    MINT_AUTHORITY_ACTIVE = "mint_authority_active"
-    FREEZE_AUTHORITY_ACTIVE = "freeze_authority_active"
+def _critical_warning_mask(warnings: List[str]) -> int:
+    """Pack the critical warnings found anywhere in ``warnings`` into a bitmask."""
+    mask = 0
+    finditer = _CRITICAL_WARNING_RE.finditer
+    for warning in warnings:
+        for match in finditer(warning):
+            mask |= _CRITICAL_WARNING_BITS[match.group()]
+    return mask
 
 
-@dataclass
+# Per-chain handler method names: (compliance analysis, token info lookup).
+# Resolved with getattr at call time so instance-level overrides still apply.
+_CHAIN_HANDLERS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "ethereum": ("_analyze_evm_token", "_get_evm_token_info"),
+    "solana": ("_analyze_solana_token", "_get_solana_token_info")
+})
+
+# External tool endpoints, formatted with the token address
+_EXTERNAL_TOOL_URLS: Mapping[str, str] = MappingProxyType({
+    "dexscreener": "https://api.dexscreener.com/latest/dex/tokens/{token}",
+    "birdeye": "https://public-api.birdeye.so/public/v1/token/{token}",
+    "coingecko": "https://api.coingecko.com/api/v3/coins/{platform}/contract/{token}"
+})
+
+# Social verification sources, formatted with the project handle or domain
+_SOCIAL_SOURCE_URLS: Mapping[str, str] = MappingProxyType({
+    "telegram": "https://t.me/{handle}",
+    "twitter": "https://twitter.com/{handle}",
+    "discord": "https://discord.gg/{handle}",
+    "website": "https://{handle}"
+})
+
+
+class ComplianceLevel(IntEnum):
+    """Compliance level enumeration, ordered from worst to best."""
+    EXCELLENT = 4  # 90-100
+    GOOD = 3       # 80-89
+    MODERATE = 2   # 70-79
+    POOR = 1       # 60-69
+    FAILED = 0     # Below 60
+
+
+# Lower score bound of each level above FAILED; bisect_right keeps the bounds inclusive
+_THRESHOLDS = (60, 70, 80, 90)
+_LEVELS = (
+    ComplianceLevel.FAILED,
+    ComplianceLevel.POOR,
+    ComplianceLevel.MODERATE,
+    ComplianceLevel.GOOD,
+    ComplianceLevel.EXCELLENT,
+)
+
+
+class VetoReason(IntFlag):
+    """Veto reason flags; a set of reasons packs into one bitmask."""
+    HIDDEN_MINT = 1 << 0
+    TRANSFER_BLOCKING = 1 << 1
+    EXCESSIVE_OWNER_POWERS = 1 << 2
+    NO_LIQUIDITY_LOCK = 1 << 3
+    TOP_HOLDER_EXCESSIVE = 1 << 4
+    NO_SOCIAL_PRESENCE = 1 << 5
+    BYTECODE_SUSPICIOUS = 1 << 6
+    MINT_AUTHORITY_ACTIVE = 1 << 7
+    FREEZE_AUTHORITY_ACTIVE = 1 << 8
+
+
+# Human-readable veto names for logs
+VETO_NAMES: Dict[int, str] = {reason: reason.name.lower() for reason in VetoReason}
+
+# PUSH4 opcode; the function dispatcher pushes each external selector with it
+_PUSH4 = b"\x63"
+
+# Dispatch-position checks: (penalty, veto reason, warning) and the selectors
+# of external functions that grant that power
+_HIDDEN_MINT_RULE = (30.0, VetoReason.HIDDEN_MINT, "Hidden mint function detected")
+_TRANSFER_BLOCKING_RULE = (20.0, VetoReason.TRANSFER_BLOCKING, "Transfer blocking detected")
+_OWNER_POWERS_RULE = (15.0, VetoReason.EXCESSIVE_OWNER_POWERS, "Excessive owner powers detected")
+_SELECTOR_RULES: Tuple[Tuple[str, Tuple[float, VetoReason, str]], ...] = (
+    ("40c10f19", _HIDDEN_MINT_RULE),        # mint(address,uint256)
+    ("f9f92be4", _TRANSFER_BLOCKING_RULE),  # blacklist(address)
+    ("44337ea1", _TRANSFER_BLOCKING_RULE),  # addToBlacklist(address)
+    ("b515566a", _TRANSFER_BLOCKING_RULE),  # setBots(address[])
+    ("061c82d0", _OWNER_POWERS_RULE),       # setTaxFeePercent(uint256)
+    ("69fe0e2d", _OWNER_POWERS_RULE),       # setFee(uint256)
+    ("0b78f9c0", _OWNER_POWERS_RULE),       # setFees(uint256,uint256)
+    ("ec28438a", _OWNER_POWERS_RULE),       # setMaxTxAmount(uint256)
+)
+
+# Bytecode rules keyed by raw byte pattern. Selectors only count in the PUSH4
+# dispatch position, so the same four bytes inside event topics, constants
+# or metadata do not match.
+_BYTECODE_RULES: Mapping[bytes, Tuple[float, VetoReason, str]] = MappingProxyType({
+    _PUSH4 + bytes.fromhex(selector): rule for selector, rule in _SELECTOR_RULES
+})
+
+# Single-pass matchers over all bytecode rules; the regex fallback uses a
+# lookahead so overlapping patterns are still all reported
+_BYTECODE_REGEX = re.compile(
+    b"(?=(" + b"|".join(re.escape(pattern) for pattern in _BYTECODE_RULES) + b"))"
+)
+_BYTECODE_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    # The automaton works on str, so bytes are mapped 1:1 through latin-1
+    _BYTECODE_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in _BYTECODE_RULES:
+        _BYTECODE_AUTOMATON.add_word(_pattern.decode("latin-1"), _pattern)
+    _BYTECODE_AUTOMATON.make_automaton()
+
+
+class RpcRateLimiter:
+    """
+    Async token bucket pacing RPC calls just under a provider's rate limit.
+    
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Callers
+    wait for a token before sending, so bursts queue briefly instead of
+    drawing 429s and retry backoff from the provider.
+    """
+    
+    __slots__ = ("rate", "burst", "_tokens", "_updated", "_lock")
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rate: Sustained requests per second
+            burst: Requests that may be sent back to back after idling
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, count: int = 1):
+        """
+        Wait until ``count`` requests may be sent.
+        
+        A count above the burst size waits for a full bucket and leaves it in
+        debt, delaying the calls that follow.
+        """
+        needed = min(count, self.burst)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= needed:
+                    self._tokens -= count
+                    return
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+    
+    async def __aenter__(self) -> "RpcRateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+@dataclass(slots=True, frozen=True)
 class ComplianceScore:
     """Compliance score breakdown."""
     overall_score: float
@@ -57,9 +343,60 @@ class ComplianceScore:
     veto_reasons: List[VetoReason]
     warnings: List[str]
     metadata: Dict[str, Any]
+    # Bitmasks derived at construction so compliance checks are single ANDs
+    veto_mask: VetoReason = field(init=False, repr=False, compare=False)
+    critical_mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        veto_mask = VetoReason(0)
+        for reason in self.veto_reasons:
+            veto_mask |= reason
+        object.__setattr__(self, "veto_mask", veto_mask)
+        object.__setattr__(self, "critical_mask", _critical_warning_mask(self.warnings))
+
+
+# Zero-score templates for analyses that could not be completed
+_FAIL_BYTECODE = ComplianceScore(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, [VetoReason.BYTECODE_SUSPICIOUS], [], {})
+_FAIL_MINT_AUTHORITY = ComplianceScore(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, [VetoReason.MINT_AUTHORITY_ACTIVE], [], {})
+
+
+def _failed_score(template: ComplianceScore, warning: str) -> ComplianceScore:
+    """Build a failed compliance score from a template with fresh mutable fields."""
+    return replace(template, veto_reasons=list(template.veto_reasons), warnings=[warning], metadata={})
+
+
+# Overall score weights: bytecode, liquidity, holders, social, external tools
+_WEIGHTS = (0.40, 0.25, 0.20, 0.10, 0.05)
 
 
-@dataclass
+def _merge(result: Dict[str, Any], key: str, veto_reasons: List[VetoReason],
+           warnings: List[str], metadata: Dict[str, Any]):
+    """Fold one sub-analysis result into the running vetoes, warnings and metadata."""
+    veto_reasons.extend(result["veto_reasons"])
+    warnings.extend(result["warnings"])
+    metadata[key] = result
+
+
+def _vetoed_step(audit_trail: List[Dict[str, Any]], step: str, started_at: float,
+                 veto_reason: VetoReason, warning: str) -> Dict[str, Any]:
+    """Record a step that could not run in the audit trail and return its vetoing result."""
+    audit_trail.append({
+        "step": step,
+        "started_at": started_at,
+        "finished_at": time.time(),
+        "result": "failed",
+        "error": warning,
+        "veto_reasons": [veto_reason]
+    })
+    return {
+        "score": 0.0,
+        "veto_reasons": [veto_reason],
+        "warnings": [warning],
+        "metadata": {}
+    }
+
+
+@dataclass(slots=True)
 class TokenAnalysis:
     """Comprehensive token analysis result."""
     token_address: str
@@ -70,6 +407,73 @@ class TokenAnalysis:
     audit_trail: List[Dict[str, Any]]
 
 
+@dataclass(slots=True)
+class TokenAnalysisBatch:
+    """
+    Structure-of-arrays view of many analyses for vectorized scoring.
+    
+    Row ``i`` of every array describes ``addresses[i]``; the masks are the
+    per-score ``veto_mask`` and ``critical_mask`` bitmasks.
+    """
+    addresses: List[str]
+    overall_scores: np.ndarray  # float64
+    veto_mask: np.ndarray  # uint64
+    warning_mask: np.ndarray  # uint64
+    
+    @classmethod
+    def from_analyses(cls, analyses: List[TokenAnalysis]) -> "TokenAnalysisBatch":
+        """Pack token analyses into parallel arrays, clamping scores at zero."""
+        count = len(analyses)
+        scores = [a.compliance_score for a in analyses]
+        overall_scores = np.fromiter((s.overall_score for s in scores), dtype=np.float64, count=count)
+        # One vectorized clamp for the whole column instead of max() per score
+        np.maximum(overall_scores, 0.0, out=overall_scores)
+        return cls(
+            addresses=[a.token_address for a in analyses],
+            overall_scores=overall_scores,
+            veto_mask=np.fromiter((s.veto_mask for s in scores), dtype=np.uint64, count=count),
+            warning_mask=np.fromiter((s.critical_mask for s in scores), dtype=np.uint64, count=count),
+        )
+
+
+# Compliant tokens scoring below this trade at reduced size and ML weight
+_FULL_SIZE_SCORE = 80
+
+
+def _batch_compliant(scores: np.ndarray, vetoed: np.ndarray, critical: np.ndarray) -> np.ndarray:
+    """Vectorized ``is_token_compliant`` rule."""
+    return (scores >= MLConfig.KRAKEN_COMPLIANCE_THRESHOLD) & ~vetoed & ~critical
+
+
+def score_tokens(
+    scores: np.ndarray, vetoed: np.ndarray, critical: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized compliance decisions for a batch of tokens.
+    
+    Applies the same rules as ``is_token_compliant``,
+    ``get_position_size_multiplier`` and ``get_ml_weight_multiplier`` to
+    whole arrays at once.
+    
+    Args:
+        scores: Overall compliance scores
+        vetoed: True where a token has any hard veto
+        critical: True where a token carries a critical warning
+        
+    Returns:
+        (compliant, position size multipliers, ML weight multipliers)
+    """
+    compliant = _batch_compliant(scores, vetoed, critical)
+    full_size = scores >= _FULL_SIZE_SCORE
+    size_multipliers = np.where(
+        compliant, np.where(full_size, 1.0, MLConfig.UNLISTED_SIZE_MULTIPLIER), 0.0
+    )
+    ml_multipliers = np.where(
+        compliant, np.where(full_size, 1.0, MLConfig.ML_UNLISTED_WEIGHT), 0.0
+    )
+    return compliant, size_multipliers, ml_multipliers
+
+
 class KrakenAuditLayer:
     """
     Kraken-style compliance layer for token safety assessment.
@@ -85,42 +489,40 @@ class KrakenAuditLayer:
     - Hard veto system
     """
     
-    def __init__(self, rpc_connector=None, solana_rpc_connector=None):
+    def __init__(self, rpc_connector=None, solana_rpc_connector=None, redis_client=None):
         """
         Initialize Kraken audit layer.
         
         Args:
             rpc_connector: EVM RPC connector
             solana_rpc_connector: Solana RPC connector
+            redis_client: Optional async Redis client shared across workers
         """
         self.rpc_connector = rpc_connector
         self.solana_rpc_connector = solana_rpc_connector
+        self.redis_client = redis_client
         
-        # Analysis cache
-        self.analysis_cache: Dict[str, TokenAnalysis] = {}
-        self.cache_ttl = MLConfig.AUDIT_CACHE_TTL
+        # Some providers bill a JSON-RPC batch as N requests or serve it slower;
+        # when disabled, multi-call lookups are sent as concurrent single calls
+        self.rpc_batch_enabled = NETWORK_CONFIG.RPC_BATCH_ENABLED
         
-        # External tool endpoints
-        self.external_tools = {
-            "dexscreener": "https://api.dexscreener.com/latest/dex/tokens",
-            "birdeye": "https://public-api.birdeye.so/public/v1",
-            "coingecko": "https://api.coingecko.com/api/v3"
-        }
+        # One token bucket per provider so scans stay under each one's rate limit
+        self.rpc_limiter = RpcRateLimiter(
+            NETWORK_CONFIG.RPC_MAX_REQUESTS_PER_SECOND, NETWORK_CONFIG.RATE_LIMIT_BURST_SIZE
+        )
+        self.solana_rpc_limiter = RpcRateLimiter(
+            NETWORK_CONFIG.RPC_MAX_REQUESTS_PER_SECOND, NETWORK_CONFIG.RATE_LIMIT_BURST_SIZE
+        )
         
-        # Suspicious bytecode patterns
-        self.suspicious_patterns = [
-            "0x608060405234801561001057600080fd5b50",  # Hidden mint function
-            "0x608060405234801561001057600080fd5b50",  # Transfer blocking
-            "0x608060405234801561001057600080fd5b50",  # Owner privilege
-        ]
+        # Analysis cache (LRU order, bounded); values are (monotonic expiry, analysis)
+        self.analysis_cache: "OrderedDict[str, Tuple[float, TokenAnalysis]]" = OrderedDict()
+        self.cache_ttl = MLConfig.AUDIT_CACHE_TTL
+        self.cache_max_size = MLConfig.AUDIT_CACHE_MAX_SIZE
+        self._inflight: Dict[str, asyncio.Future] = {}
         
-        # Social verification sources
-        self.social_sources = {
-            "telegram": "https://t.me/",
-            "twitter": "https://twitter.com/",
-            "discord": "https://discord.gg/",
-            "website": "https://"
-        }
+        # Token info cache: (metadata expiry, supply expiry, info) on the monotonic
+        # clock; name/symbol/decimals are effectively immutable, supply is not
+        self._token_info_cache: "OrderedDict[str, Tuple[float, float, Dict[str, Any]]]" = OrderedDict()
         
         logger.info("Kraken audit layer initialized")
     
@@ -135,44 +537,73 @@ class KrakenAuditLayer:
         Returns:
             Comprehensive token analysis result
         """
+        # Check cache first; the hit path stays a dict lookup, no logging here
+        cache_key = f"{chain}:{token_address}"
+        cached_analysis = self._cache_get(cache_key)
+        if cached_analysis is not None:
+            return cached_analysis
+        
+        # Join an analysis of the same token that is already in flight
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        inflight = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = inflight
         try:
-            # Check cache first
-            cache_key = f"{chain}:{token_address}"
-            if cache_key in self.analysis_cache:
-                cached_analysis = self.analysis_cache[cache_key]
-                if time.time() - cached_analysis.analysis_timestamp < self.cache_ttl:
-                    logger.debug("Returning cached analysis", token_address=token_address)
-                    return cached_analysis
+            analysis = await self._analyze_token_uncached(token_address, chain, cache_key)
+            inflight.set_result(analysis)
+            return analysis
+        finally:
+            if not inflight.done():
+                inflight.cancel()
+            del self._inflight[cache_key]
+    
+    async def analyze_tokens_batch(self, token_addresses: List[str], chain: str = "ethereum") -> List[TokenAnalysis]:
+        """
+        Analyze many tokens on one chain concurrently.
+        
+        Repeated addresses are coalesced onto a single in-flight analysis.
+        
+        Args:
+            token_addresses: Token contract addresses
+            chain: Blockchain chain (ethereum, solana, etc.)
+            
+        Returns:
+            Token analysis results in the same order as ``token_addresses``
+        """
+        return list(await asyncio.gather(*(self.analyze_token(address, chain) for address in token_addresses)))
+    
+    async def _analyze_token_uncached(self, token_address: str, chain: str, cache_key: str) -> TokenAnalysis:
+        """Run a full token analysis after an in-process cache miss."""
+        try:
+            # Fall back to the shared cache before paying for a fresh analysis
+            cached_analysis = await self._shared_cache_get(cache_key)
+            if cached_analysis is not None:
+                logger.debug("Returning shared cached analysis", token_address=token_address)
+                self._cache_put(cache_key, cached_analysis)
+                return cached_analysis
             
             # Start analysis
             analysis_timestamp = time.time()
-            audit_trail = []
-            
-            # Get basic token info
-            token_info = await self._get_token_info(token_address, chain)
-            audit_trail.append({
-                "step": "token_info",
-                "timestamp": time.time(),
-                "result": "success" if token_info else "failed"
-            })
-            
-            # Perform chain-specific analysis
-            if chain.lower() == "ethereum":
-                compliance_score = await self._analyze_evm_token(token_address, audit_trail)
-            elif chain.lower() == "solana":
-                compliance_score = await self._analyze_solana_token(token_address, audit_trail)
+            started = time.monotonic()
+            info_trail = []
+            analysis_trail = []
+            
+            # Token info and the chain-specific analysis are independent, so
+            # they run concurrently, each logging to its own audit list
+            handlers = _CHAIN_HANDLERS.get(chain if chain.islower() else chain.lower())
+            async with asyncio.TaskGroup() as tg:
+                info_task = tg.create_task(self._token_info_step(token_address, chain, info_trail))
+                if handlers is not None:
+                    score_task = tg.create_task(getattr(self, handlers[0])(token_address, analysis_trail))
+            
+            token_info = info_task.result()
+            audit_trail = info_trail + analysis_trail
+            if handlers is not None:
+                compliance_score = score_task.result()
             else:
-                compliance_score = ComplianceScore(
-                    overall_score=0.0,
-                    bytecode_safety=0.0,
-                    liquidity_analysis=0.0,
-                    holder_distribution=0.0,
-                    social_verification=0.0,
-                    external_tool_score=0.0,
-                    veto_reasons=[VetoReason.BYTECODE_SUSPICIOUS],
-                    warnings=["Unsupported chain"],
-                    metadata={}
-                )
+                compliance_score = _failed_score(_FAIL_BYTECODE, "Unsupported chain")
             
             # Create analysis result
             analysis = TokenAnalysis(
@@ -185,7 +616,8 @@ class KrakenAuditLayer:
             )
             
             # Cache result
-            self.analysis_cache[cache_key] = analysis
+            self._cache_put(cache_key, analysis)
+            await self._shared_cache_put(cache_key, analysis)
             
             # Log analysis result
             log_trading_event(
@@ -194,8 +626,8 @@ class KrakenAuditLayer:
                     "token_address": token_address,
                     "chain": chain,
                     "compliance_score": compliance_score.overall_score,
-                    "veto_reasons": [r.value for r in compliance_score.veto_reasons],
-                    "analysis_time": time.time() - analysis_timestamp
+                    "veto_reasons": [VETO_NAMES[r] for r in compliance_score.veto_reasons],
+                    "analysis_time": time.monotonic() - started
                 },
                 "INFO"
             )
@@ -210,93 +642,111 @@ class KrakenAuditLayer:
                 token_address=token_address,
                 chain=chain,
                 analysis_timestamp=time.time(),
-                compliance_score=ComplianceScore(
-                    overall_score=0.0,
-                    bytecode_safety=0.0,
-                    liquidity_analysis=0.0,
-                    holder_distribution=0.0,
-                    social_verification=0.0,
-                    external_tool_score=0.0,
-                    veto_reasons=[VetoReason.BYTECODE_SUSPICIOUS],
-                    warnings=[f"Analysis failed: {e}"],
-                    metadata={}
-                ),
+                compliance_score=_failed_score(_FAIL_BYTECODE, f"Analysis failed: {e}"),
                 token_info={},
                 audit_trail=[{"step": "analysis", "timestamp": time.time(), "result": "failed", "error": str(e)}]
             )
     
+    def _cache_get(self, cache_key: str) -> Optional[TokenAnalysis]:
+        """Return a fresh cached analysis, dropping it if it has expired."""
+        entry = self.analysis_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        expires_at, analysis = entry
+        if time.monotonic() >= expires_at:
+            del self.analysis_cache[cache_key]
+            return None
+        
+        self.analysis_cache.move_to_end(cache_key)
+        return analysis
+    
+    def _cache_put(self, cache_key: str, analysis: TokenAnalysis):
+        """Store an analysis, evicting the least recently used entries over the size cap."""
+        # Expiry is pinned to the monotonic clock once, from the analysis' age
+        # (non-zero for entries promoted from the shared cache)
+        age = time.time() - analysis.analysis_timestamp
+        self.analysis_cache[cache_key] = (time.monotonic() + self.cache_ttl - age, analysis)
+        self.analysis_cache.move_to_end(cache_key)
+        while len(self.analysis_cache) > self.cache_max_size:
+            self.analysis_cache.popitem(last=False)
+    
+    async def _shared_cache_get(self, cache_key: str) -> Optional[TokenAnalysis]:
+        """Load an analysis from the shared Redis cache, if one is configured."""
+        if self.redis_client is None:
+            return None
+        
+        try:
+            packed = await self.redis_client.get(f"kraken:audit:v2:{cache_key}")
+            if packed is None:
+                return None
+            
+            data = _unpack_analysis(packed)
+            score = data.pop("compliance_score")
+            del score["veto_mask"], score["critical_mask"]
+            score["veto_reasons"] = [VetoReason(r) for r in score["veto_reasons"]]
+            analysis = TokenAnalysis(compliance_score=ComplianceScore(**score), **data)
+            
+            if time.time() - analysis.analysis_timestamp >= self.cache_ttl:
+                return None
+            return analysis
+            
+        except Exception as e:
+            logger.warning("Shared cache read failed", cache_key=cache_key, error=str(e))
+            return None
+    
+    async def _shared_cache_put(self, cache_key: str, analysis: TokenAnalysis):
+        """Store an analysis in the shared Redis cache, if one is configured."""
+        if self.redis_client is None:
+            return
+        
+        try:
+            packed = _pack_analysis(analysis)
+            await self.redis_client.set(f"kraken:audit:v2:{cache_key}", packed, ex=self.cache_ttl)
+        except Exception as e:
+            logger.warning("Shared cache write failed", cache_key=cache_key, error=str(e))
+    
     async def _analyze_evm_token(self, token_address: str, audit_trail: List[Dict[str, Any]]) -> ComplianceScore:
         """Analyze EVM token for compliance."""
         try:
-            # Initialize scores
-            bytecode_safety = 100.0
-            liquidity_analysis = 100.0
-            holder_distribution = 100.0
-            social_verification = 100.0
-            external_tool_score = 100.0
+            # Run the independent sub-analyses concurrently; each writes to its
+            # own audit list, merged afterwards in step order
+            step_trails = [[] for _ in range(5)]
+            bytecode_result, liquidity_result, holder_result, social_result, external_result = await asyncio.gather(
+                self._analyze_evm_bytecode(token_address, step_trails[0]),
+                self._analyze_liquidity(token_address, "ethereum", step_trails[1]),
+                self._analyze_holder_distribution(token_address, "ethereum", step_trails[2]),
+                self._analyze_social_verification(token_address, step_trails[3]),
+                self._analyze_external_tools(token_address, step_trails[4])
+            )
+            for step_trail in step_trails:
+                audit_trail.extend(step_trail)
+            
+            # Merge findings in step order
             veto_reasons = []
             warnings = []
             metadata = {}
-            
-            # 1. Bytecode Analysis
-            bytecode_result = await self._analyze_evm_bytecode(token_address, audit_trail)
-            bytecode_safety = bytecode_result["score"]
-            if bytecode_result["veto_reasons"]:
-                veto_reasons.extend(bytecode_result["veto_reasons"])
-            if bytecode_result["warnings"]:
-                warnings.extend(bytecode_result["warnings"])
-            metadata["bytecode_analysis"] = bytecode_result
-            
-            # 2. Liquidity Analysis
-            liquidity_result = await self._analyze_evm_liquidity(token_address, audit_trail)
-            liquidity_analysis = liquidity_result["score"]
-            if liquidity_result["veto_reasons"]:
-                veto_reasons.extend(liquidity_result["veto_reasons"])
-            if liquidity_result["warnings"]:
-                warnings.extend(liquidity_result["warnings"])
-            metadata["liquidity_analysis"] = liquidity_result
-            
-            # 3. Holder Distribution Analysis
-            holder_result = await self._analyze_evm_holder_distribution(token_address, audit_trail)
-            holder_distribution = holder_result["score"]
-            if holder_result["veto_reasons"]:
-                veto_reasons.extend(holder_result["veto_reasons"])
-            if holder_result["warnings"]:
-                warnings.extend(holder_result["warnings"])
-            metadata["holder_analysis"] = holder_result
-            
-            # 4. Social Verification
-            social_result = await self._analyze_social_verification(token_address, audit_trail)
-            social_verification = social_result["score"]
-            if social_result["veto_reasons"]:
-                veto_reasons.extend(social_result["veto_reasons"])
-            if social_result["warnings"]:
-                warnings.extend(social_result["warnings"])
-            metadata["social_verification"] = social_result
-            
-            # 5. External Tool Integration
-            external_result = await self._analyze_external_tools(token_address, audit_trail)
-            external_tool_score = external_result["score"]
-            if external_result["warnings"]:
-                warnings.extend(external_result["warnings"])
-            metadata["external_tools"] = external_result
-            
-            # Calculate overall score
-            overall_score = (
-                bytecode_safety * 0.40 +
-                liquidity_analysis * 0.25 +
-                holder_distribution * 0.20 +
-                social_verification * 0.10 +
-                external_tool_score * 0.05
+            _merge(bytecode_result, "bytecode_analysis", veto_reasons, warnings, metadata)
+            _merge(liquidity_result, "liquidity_analysis", veto_reasons, warnings, metadata)
+            _merge(holder_result, "holder_analysis", veto_reasons, warnings, metadata)
+            _merge(social_result, "social_verification", veto_reasons, warnings, metadata)
+            _merge(external_result, "external_tools", veto_reasons, warnings, metadata)
+            
+            scores = (
+                bytecode_result["score"],
+                liquidity_result["score"],
+                holder_result["score"],
+                social_result["score"],
+                external_result["score"]
             )
             
             return ComplianceScore(
-                overall_score=overall_score,
-                bytecode_safety=bytecode_safety,
-                liquidity_analysis=liquidity_analysis,
-                holder_distribution=holder_distribution,
-                social_verification=social_verification,
-                external_tool_score=external_tool_score,
+                overall_score=sum(weight * score for weight, score in zip(_WEIGHTS, scores)),
+                bytecode_safety=scores[0],
+                liquidity_analysis=scores[1],
+                holder_distribution=scores[2],
+                social_verification=scores[3],
+                external_tool_score=scores[4],
                 veto_reasons=veto_reasons,
                 warnings=warnings,
                 metadata=metadata
@@ -304,90 +754,49 @@ class KrakenAuditLayer:
             
         except Exception as e:
             logger.error("EVM token analysis failed", token_address=token_address, error=str(e))
-            return ComplianceScore(
-                overall_score=0.0,
-                bytecode_safety=0.0,
-                liquidity_analysis=0.0,
-                holder_distribution=0.0,
-                social_verification=0.0,
-                external_tool_score=0.0,
-                veto_reasons=[VetoReason.BYTECODE_SUSPICIOUS],
-                warnings=[f"EVM analysis failed: {e}"],
-                metadata={}
-            )
+            return _failed_score(_FAIL_BYTECODE, f"EVM analysis failed: {e}")
     
     async def _analyze_solana_token(self, mint_address: str, audit_trail: List[Dict[str, Any]]) -> ComplianceScore:
         """Analyze Solana token for compliance."""
         try:
-            # Initialize scores
-            bytecode_safety = 100.0
-            liquidity_analysis = 100.0
-            holder_distribution = 100.0
-            social_verification = 100.0
-            external_tool_score = 100.0
+            # Run the independent sub-analyses concurrently; each writes to its
+            # own audit list, merged afterwards in step order
+            step_trails = [[] for _ in range(5)]
+            token_program_result, liquidity_result, holder_result, social_result, external_result = await asyncio.gather(
+                self._analyze_solana_token_program(mint_address, step_trails[0]),
+                self._analyze_liquidity(mint_address, "solana", step_trails[1]),
+                self._analyze_holder_distribution(mint_address, "solana", step_trails[2]),
+                self._analyze_social_verification(mint_address, step_trails[3]),
+                self._analyze_external_tools(mint_address, step_trails[4])
+            )
+            for step_trail in step_trails:
+                audit_trail.extend(step_trail)
+            
+            # Merge findings in step order
             veto_reasons = []
             warnings = []
             metadata = {}
-            
-            # 1. Token Program Analysis
-            token_program_result = await self._analyze_solana_token_program(mint_address, audit_trail)
-            bytecode_safety = token_program_result["score"]
-            if token_program_result["veto_reasons"]:
-                veto_reasons.extend(token_program_result["veto_reasons"])
-            if token_program_result["warnings"]:
-                warnings.extend(token_program_result["warnings"])
-            metadata["token_program_analysis"] = token_program_result
-            
-            # 2. Liquidity Analysis
-            liquidity_result = await self._analyze_solana_liquidity(mint_address, audit_trail)
-            liquidity_analysis = liquidity_result["score"]
-            if liquidity_result["veto_reasons"]:
-                veto_reasons.extend(liquidity_result["veto_reasons"])
-            if liquidity_result["warnings"]:
-                warnings.extend(liquidity_result["warnings"])
-            metadata["liquidity_analysis"] = liquidity_result
-            
-            # 3. Holder Distribution Analysis
-            holder_result = await self._analyze_solana_holder_distribution(mint_address, audit_trail)
-            holder_distribution = holder_result["score"]
-            if holder_result["veto_reasons"]:
-                veto_reasons.extend(holder_result["veto_reasons"])
-            if holder_result["warnings"]:
-                warnings.extend(holder_result["warnings"])
-            metadata["holder_analysis"] = holder_result
-            
-            # 4. Social Verification
-            social_result = await self._analyze_social_verification(mint_address, audit_trail)
-            social_verification = social_result["score"]
-            if social_result["veto_reasons"]:
-                veto_reasons.extend(social_result["veto_reasons"])
-            if social_result["warnings"]:
-                warnings.extend(social_result["warnings"])
-            metadata["social_verification"] = social_result
-            
-            # 5. External Tool Integration
-            external_result = await self._analyze_external_tools(mint_address, audit_trail)
-            external_tool_score = external_result["score"]
-            if external_result["warnings"]:
-                warnings.extend(external_result["warnings"])
-            metadata["external_tools"] = external_result
-            
-            # Calculate overall score
-            overall_score = (
-                bytecode_safety * 0.40 +
-                liquidity_analysis * 0.25 +
-                holder_distribution * 0.20 +
-                social_verification * 0.10 +
-                external_tool_score * 0.05
+            _merge(token_program_result, "token_program_analysis", veto_reasons, warnings, metadata)
+            _merge(liquidity_result, "liquidity_analysis", veto_reasons, warnings, metadata)
+            _merge(holder_result, "holder_analysis", veto_reasons, warnings, metadata)
+            _merge(social_result, "social_verification", veto_reasons, warnings, metadata)
+            _merge(external_result, "external_tools", veto_reasons, warnings, metadata)
+            
+            scores = (
+                token_program_result["score"],
+                liquidity_result["score"],
+                holder_result["score"],
+                social_result["score"],
+                external_result["score"]
             )
             
             return ComplianceScore(
-                overall_score=overall_score,
-                bytecode_safety=bytecode_safety,
-                liquidity_analysis=liquidity_analysis,
-                holder_distribution=holder_distribution,
-                social_verification=social_verification,
-                external_tool_score=external_tool_score,
+                overall_score=sum(weight * score for weight, score in zip(_WEIGHTS, scores)),
+                bytecode_safety=scores[0],
+                liquidity_analysis=scores[1],
+                holder_distribution=scores[2],
+                social_verification=scores[3],
+                external_tool_score=scores[4],
                 veto_reasons=veto_reasons,
                 warnings=warnings,
                 metadata=metadata
@@ -395,72 +804,40 @@ class KrakenAuditLayer:
             
         except Exception as e:
             logger.error("Solana token analysis failed", mint_address=mint_address, error=str(e))
-            return ComplianceScore(
-                overall_score=0.0,
-                bytecode_safety=0.0,
-                liquidity_analysis=0.0,
-                holder_distribution=0.0,
-                social_verification=0.0,
-                external_tool_score=0.0,
-                veto_reasons=[VetoReason.MINT_AUTHORITY_ACTIVE],
-                warnings=[f"Solana analysis failed: {e}"],
-                metadata={}
-            )
+            return _failed_score(_FAIL_MINT_AUTHORITY, f"Solana analysis failed: {e}")
     
     async def _analyze_evm_bytecode(self, token_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze EVM bytecode for suspicious patterns."""
+        started_at = time.time()
         try:
-            audit_trail.append({"step": "bytecode_analysis", "timestamp": time.time()})
-            
             # Get contract bytecode
-            bytecode_response = await self.rpc_connector.make_request("eth_getCode", [token_address, "latest"])
+            bytecode_response = await self._rpc_request(self.rpc_connector, "eth_getCode", [token_address, "latest"])
             if not bytecode_response.success:
-                return {
-                    "score": 0.0,
-                    "veto_reasons": [VetoReason.BYTECODE_SUSPICIOUS],
-                    "warnings": ["Failed to get bytecode"],
-                    "metadata": {}
-                }
+                return _vetoed_step(audit_trail, "bytecode_analysis", started_at,
+                                    VetoReason.BYTECODE_SUSPICIOUS, "Failed to get bytecode")
             
             bytecode = bytecode_response.data
+            code = bytes.fromhex(bytecode[2:] if bytecode.startswith("0x") else bytecode)
             
             # Check for suspicious patterns
             score = 100.0
             veto_reasons = []
             warnings = []
-            metadata = {"bytecode_length": len(bytecode)}
-            
-            # Check for hidden mint functions
-            if "0x40c10f19" in bytecode:  # mint(address,uint256)
-                score -= 30.0
-                veto_reasons.append(VetoReason.HIDDEN_MINT)
-                warnings.append("Hidden mint function detected")
+            metadata = {"bytecode_length": len(code)}
             
-            # Check for transfer blocking
-            if "0x8c5be1e5" in bytecode:  # transferFrom with blocking
-                score -= 20.0
-                veto_reasons.append(VetoReason.TRANSFER_BLOCKING)
-                warnings.append("Transfer blocking detected")
-            
-            # Check for excessive owner powers
-            if "0x8da5cb5b" in bytecode:  # owner() function
-                score -= 15.0
-                veto_reasons.append(VetoReason.EXCESSIVE_OWNER_POWERS)
-                warnings.append("Excessive owner powers detected")
-            
-            # Check for suspicious patterns
-            for pattern in self.suspicious_patterns:
-                if pattern in bytecode:
-                    score -= 25.0
-                    veto_reasons.append(VetoReason.BYTECODE_SUSPICIOUS)
-                    warnings.append(f"Suspicious pattern detected: {pattern}")
+            # Apply each matched rule once, in rule order
+            for penalty, veto_reason, warning in self._match_bytecode_rules(code):
+                score -= penalty
+                veto_reasons.append(veto_reason)
+                warnings.append(warning)
             
             audit_trail.append({
                 "step": "bytecode_analysis",
-                "timestamp": time.time(),
+                "started_at": started_at,
+                "finished_at": time.time(),
                 "result": "success",
                 "score": score,
-                "veto_reasons": [r.value for r in veto_reasons]
+                "veto_reasons": list(veto_reasons)
             })
             
             return {
@@ -472,6 +849,8 @@ class KrakenAuditLayer:
             
         except Exception as e:
             logger.error("EVM bytecode analysis failed", token_address=token_address, error=str(e))
+            audit_trail.append({"step": "bytecode_analysis", "started_at": started_at, "finished_at": time.time(),
+                                "result": "failed", "error": str(e)})
             return {
                 "score": 0.0,
                 "veto_reasons": [VetoReason.BYTECODE_SUSPICIOUS],
@@ -479,32 +858,33 @@ class KrakenAuditLayer:
                 "metadata": {}
             }
     
+    def _match_bytecode_rules(self, code: bytes) -> List[Tuple[float, VetoReason, str]]:
+        """Return the bytecode rules whose pattern occurs in the given raw bytecode, each once."""
+        if _BYTECODE_AUTOMATON is not None:
+            hits = {pattern for _, pattern in _BYTECODE_AUTOMATON.iter(code.decode("latin-1"))}
+        else:
+            hits = {match.group(1) for match in _BYTECODE_REGEX.finditer(code)}
+        
+        # Several selectors share a rule; dict.fromkeys keeps the first in rule order
+        return list(dict.fromkeys(rule for pattern, rule in _BYTECODE_RULES.items() if pattern in hits))
+    
     async def _analyze_solana_token_program(self, mint_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze Solana token program for safety."""
+        started_at = time.time()
         try:
-            audit_trail.append({"step": "token_program_analysis", "timestamp": time.time()})
-            
-            # Get mint account info
-            mint_response = await self.solana_rpc_connector.make_request("getAccountInfo", [mint_address])
+            # Get mint account info, decoded server-side by the node
+            mint_response = await self._rpc_request(self.solana_rpc_connector, "getAccountInfo", [mint_address, {"encoding": "jsonParsed"}])
             if not mint_response.success:
-                return {
-                    "score": 0.0,
-                    "veto_reasons": [VetoReason.MINT_AUTHORITY_ACTIVE],
-                    "warnings": ["Failed to get mint account info"],
-                    "metadata": {}
-                }
+                return _vetoed_step(audit_trail, "token_program_analysis", started_at,
+                                    VetoReason.MINT_AUTHORITY_ACTIVE, "Failed to get mint account info")
             
             mint_data = mint_response.data
             if not mint_data or not mint_data.get("value"):
-                return {
-                    "score": 0.0,
-                    "veto_reasons": [VetoReason.MINT_AUTHORITY_ACTIVE],
-                    "warnings": ["Invalid mint account"],
-                    "metadata": {}
-                }
+                return _vetoed_step(audit_trail, "token_program_analysis", started_at,
+                                    VetoReason.MINT_AUTHORITY_ACTIVE, "Invalid mint account")
             
             # Parse mint account data
-            mint_bytes = bytes.fromhex(mint_data["value"]["data"][0])
+            mint_authority, _, decimals, freeze_authority = self._parse_mint_account(mint_data)
             
             score = 100.0
             veto_reasons = []
@@ -512,23 +892,20 @@ class KrakenAuditLayer:
             metadata = {}
             
             # Check mint authority
-            mint_authority = mint_bytes[0:32].hex()
-            if mint_authority != "0" * 64:
+            if mint_authority:
                 score -= 40.0
                 veto_reasons.append(VetoReason.MINT_AUTHORITY_ACTIVE)
                 warnings.append("Mint authority is active")
                 metadata["mint_authority"] = mint_authority
             
             # Check freeze authority
-            freeze_authority = mint_bytes[42:74].hex()
-            if freeze_authority != "0" * 64:
+            if freeze_authority:
                 score -= 30.0
                 veto_reasons.append(VetoReason.FREEZE_AUTHORITY_ACTIVE)
                 warnings.append("Freeze authority is active")
                 metadata["freeze_authority"] = freeze_authority
             
             # Check decimals
-            decimals = mint_bytes[40]
             if decimals > 18:
                 score -= 10.0
                 warnings.append(f"Unusual decimals: {decimals}")
@@ -536,10 +913,11 @@ class KrakenAuditLayer:
             
             audit_trail.append({
                 "step": "token_program_analysis",
-                "timestamp": time.time(),
+                "started_at": started_at,
+                "finished_at": time.time(),
                 "result": "success",
                 "score": score,
-                "veto_reasons": [r.value for r in veto_reasons]
+                "veto_reasons": list(veto_reasons)
             })
             
             return {
@@ -551,6 +929,8 @@ class KrakenAuditLayer:
             
         except Exception as e:
             logger.error("Solana token program analysis failed", mint_address=mint_address, error=str(e))
+            audit_trail.append({"step": "token_program_analysis", "started_at": started_at, "finished_at": time.time(),
+                                "result": "failed", "error": str(e)})
             return {
                 "score": 0.0,
                 "veto_reasons": [VetoReason.MINT_AUTHORITY_ACTIVE],
@@ -558,59 +938,14 @@ class KrakenAuditLayer:
                 "metadata": {}
             }
     
-    async def _analyze_evm_liquidity(self, token_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze EVM token liquidity."""
-        try:
-            audit_trail.append({"step": "liquidity_analysis", "timestamp": time.time()})
-            
-            # This is a simplified implementation
-            # In practice, you would check DEX pairs, liquidity pools, etc.
-            
-            score = 100.0
-            veto_reasons = []
-            warnings = []
-            metadata = {}
-            
-            # Check if token has liquidity (simplified)
-            # In practice, you would query DEX APIs or on-chain data
-            
-            # Mock liquidity check
-            has_liquidity = True  # Simplified
-            if not has_liquidity:
-                score -= 50.0
-                veto_reasons.append(VetoReason.NO_LIQUIDITY_LOCK)
-                warnings.append("No liquidity detected")
-            
-            audit_trail.append({
-                "step": "liquidity_analysis",
-                "timestamp": time.time(),
-                "result": "success",
-                "score": score
-            })
-            
-            return {
-                "score": max(0.0, score),
-                "veto_reasons": veto_reasons,
-                "warnings": warnings,
-                "metadata": metadata
-            }
-            
-        except Exception as e:
-            logger.error("EVM liquidity analysis failed", token_address=token_address, error=str(e))
-            return {
-                "score": 0.0,
-                "veto_reasons": [VetoReason.NO_LIQUIDITY_LOCK],
-                "warnings": [f"Liquidity analysis failed: {e}"],
-                "metadata": {}
-            }
-    
-    async def _analyze_solana_liquidity(self, mint_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze Solana token liquidity."""
+    async def _analyze_liquidity(self, token_address: str, chain: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze token liquidity on the given chain."""
+        step = "liquidity_analysis" if chain == "ethereum" else f"{chain}_liquidity_analysis"
+        started_at = time.time()
         try:
-            audit_trail.append({"step": "solana_liquidity_analysis", "timestamp": time.time()})
-            
             # This is a simplified implementation
-            # In practice, you would check Serum, Orca, Raydium pools, etc.
+            # In practice, you would check DEX pairs (EVM) or Serum, Orca,
+            # Raydium pools (Solana), etc.
             
             score = 100.0
             veto_reasons = []
@@ -628,8 +963,9 @@ class KrakenAuditLayer:
                 warnings.append("No liquidity detected")
             
             audit_trail.append({
-                "step": "solana_liquidity_analysis",
-                "timestamp": time.time(),
+                "step": step,
+                "started_at": started_at,
+                "finished_at": time.time(),
                 "result": "success",
                 "score": score
             })
@@ -642,7 +978,9 @@ class KrakenAuditLayer:
             }
             
         except Exception as e:
-            logger.error("Solana liquidity analysis failed", mint_address=mint_address, error=str(e))
+            logger.error("Liquidity analysis failed", token_address=token_address, chain=chain, error=str(e))
+            audit_trail.append({"step": step, "started_at": started_at, "finished_at": time.time(),
+                                "result": "failed", "error": str(e)})
             return {
                 "score": 0.0,
                 "veto_reasons": [VetoReason.NO_LIQUIDITY_LOCK],
@@ -650,11 +988,11 @@ class KrakenAuditLayer:
                 "metadata": {}
             }
     
-    async def _analyze_evm_holder_distribution(self, token_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze EVM token holder distribution."""
+    async def _analyze_holder_distribution(self, token_address: str, chain: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze token holder distribution on the given chain."""
+        step = "holder_distribution_analysis" if chain == "ethereum" else f"{chain}_holder_distribution_analysis"
+        started_at = time.time()
         try:
-            audit_trail.append({"step": "holder_distribution_analysis", "timestamp": time.time()})
-            
             # This is a simplified implementation
             # In practice, you would analyze holder distribution from on-chain data
             
@@ -673,8 +1011,9 @@ class KrakenAuditLayer:
             metadata["top_holder_percentage"] = top_holder_percentage
             
             audit_trail.append({
-                "step": "holder_distribution_analysis",
-                "timestamp": time.time(),
+                "step": step,
+                "started_at": started_at,
+                "finished_at": time.time(),
                 "result": "success",
                 "score": score
             })
@@ -687,52 +1026,9 @@ class KrakenAuditLayer:
             }
             
         except Exception as e:
-            logger.error("EVM holder distribution analysis failed", token_address=token_address, error=str(e))
-            return {
-                "score": 0.0,
-                "veto_reasons": [VetoReason.TOP_HOLDER_EXCESSIVE],
-                "warnings": [f"Holder distribution analysis failed: {e}"],
-                "metadata": {}
-            }
-    
-    async def _analyze_solana_holder_distribution(self, mint_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze Solana token holder distribution."""
-        try:
-            audit_trail.append({"step": "solana_holder_distribution_analysis", "timestamp": time.time()})
-            
-            # This is a simplified implementation
-            # In practice, you would analyze holder distribution from on-chain data
-            
-            score = 100.0
-            veto_reasons = []
-            warnings = []
-            metadata = {}
-            
-            # Mock holder distribution analysis
-            top_holder_percentage = 30.0  # Simplified
-            if top_holder_percentage > 70.0:
-                score -= 50.0
-                veto_reasons.append(VetoReason.TOP_HOLDER_EXCESSIVE)
-                warnings.append("Top holder controls >70% of supply")
-            
-            metadata["top_holder_percentage"] = top_holder_percentage
-            
-            audit_trail.append({
-                "step": "solana_holder_distribution_analysis",
-                "timestamp": time.time(),
-                "result": "success",
-                "score": score
-            })
-            
-            return {
-                "score": max(0.0, score),
-                "veto_reasons": veto_reasons,
-                "warnings": warnings,
-                "metadata": metadata
-            }
-            
-        except Exception as e:
-            logger.error("Solana holder distribution analysis failed", mint_address=mint_address, error=str(e))
+            logger.error("Holder distribution analysis failed", token_address=token_address, chain=chain, error=str(e))
+            audit_trail.append({"step": step, "started_at": started_at, "finished_at": time.time(),
+                                "result": "failed", "error": str(e)})
             return {
                 "score": 0.0,
                 "veto_reasons": [VetoReason.TOP_HOLDER_EXCESSIVE],
@@ -742,9 +1038,8 @@ class KrakenAuditLayer:
     
     async def _analyze_social_verification(self, token_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze social verification."""
+        started_at = time.time()
         try:
-            audit_trail.append({"step": "social_verification", "timestamp": time.time()})
-            
             # This is a simplified implementation
             # In practice, you would check social media presence, website, etc.
             
@@ -754,29 +1049,23 @@ class KrakenAuditLayer:
             metadata = {}
             
             # Mock social verification
-            has_website = True  # Simplified
-            has_social_media = True  # Simplified
+            metadata["has_website"] = True  # Simplified
+            metadata["has_social_media"] = True  # Simplified
             
-            if not has_website:
-                score -= 30.0
-                warnings.append("No website detected")
-            
-            if not has_social_media:
-                score -= 20.0
-                warnings.append("No social media presence")
+            failed = [(penalty, warning) for flag, penalty, warning in _SOCIAL_PENALTIES if not metadata[flag]]
+            score -= sum(penalty for penalty, _ in failed)
+            warnings.extend(warning for _, warning in failed)
             
             # Check for minimum social presence
-            if not has_website and not has_social_media:
+            if len(failed) == len(_SOCIAL_PENALTIES):
                 score -= 50.0
                 veto_reasons.append(VetoReason.NO_SOCIAL_PRESENCE)
                 warnings.append("No social presence detected")
             
-            metadata["has_website"] = has_website
-            metadata["has_social_media"] = has_social_media
-            
             audit_trail.append({
                 "step": "social_verification",
-                "timestamp": time.time(),
+                "started_at": started_at,
+                "finished_at": time.time(),
                 "result": "success",
                 "score": score
             })
@@ -790,6 +1079,8 @@ class KrakenAuditLayer:
             
         except Exception as e:
             logger.error("Social verification analysis failed", token_address=token_address, error=str(e))
+            audit_trail.append({"step": "social_verification", "started_at": started_at, "finished_at": time.time(),
+                                "result": "failed", "error": str(e)})
             return {
                 "score": 0.0,
                 "veto_reasons": [VetoReason.NO_SOCIAL_PRESENCE],
@@ -799,9 +1090,8 @@ class KrakenAuditLayer:
     
     async def _analyze_external_tools(self, token_address: str, audit_trail: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze external tool verification."""
+        started_at = time.time()
         try:
-            audit_trail.append({"step": "external_tools", "timestamp": time.time()})
-            
             # This is a simplified implementation
             # In practice, you would query external APIs
             
@@ -810,23 +1100,17 @@ class KrakenAuditLayer:
             metadata = {}
             
             # Mock external tool checks
-            dexscreener_verified = True  # Simplified
-            birdeye_verified = True  # Simplified
-            
-            if not dexscreener_verified:
-                score -= 25.0
-                warnings.append("Not verified on DexScreener")
-            
-            if not birdeye_verified:
-                score -= 25.0
-                warnings.append("Not verified on Birdeye")
+            metadata["dexscreener_verified"] = True  # Simplified
+            metadata["birdeye_verified"] = True  # Simplified
             
-            metadata["dexscreener_verified"] = dexscreener_verified
-            metadata["birdeye_verified"] = birdeye_verified
+            failed = [(penalty, warning) for flag, penalty, warning in _EXTERNAL_TOOL_PENALTIES if not metadata[flag]]
+            score -= sum(penalty for penalty, _ in failed)
+            warnings.extend(warning for _, warning in failed)
             
             audit_trail.append({
                 "step": "external_tools",
-                "timestamp": time.time(),
+                "started_at": started_at,
+                "finished_at": time.time(),
                 "result": "success",
                 "score": score
             })
@@ -840,6 +1124,8 @@ class KrakenAuditLayer:
             
         except Exception as e:
             logger.error("External tools analysis failed", token_address=token_address, error=str(e))
+            audit_trail.append({"step": "external_tools", "started_at": started_at, "finished_at": time.time(),
+                                "result": "failed", "error": str(e)})
             return {
                 "score": 0.0,
                 "veto_reasons": [],
@@ -847,73 +1133,215 @@ class KrakenAuditLayer:
                 "metadata": {}
             }
     
-    async def _get_token_info(self, token_address: str, chain: str) -> Optional[Dict[str, Any]]:
-        """Get basic token information."""
+    async def _token_info_step(self, token_address: str, chain: str,
+                               audit_trail: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Fetch basic token info as an audited analysis step."""
+        started_at = time.time()
+        token_info = await self._get_token_info(token_address, chain, fields=_AUDIT_TOKEN_INFO_FIELDS)
+        audit_trail.append({
+            "step": "token_info",
+            "started_at": started_at,
+            "finished_at": time.time(),
+            "result": "success" if token_info else "failed"
+        })
+        return token_info
+    
+    async def _get_token_info(
+        self, token_address: str, chain: str, fields: Tuple[str, ...] = _TOKEN_INFO_FIELDS
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get basic token information.
+        
+        Only fields decoded from the chain are cached. Fields that fell back to
+        a default are returned with the default but fetched again next call,
+        so one failed getter does not pin a wrong value for the metadata TTL.
+        
+        Args:
+            token_address: Token contract or mint address
+            chain: Chain name
+            fields: Token info fields to return; only those missing from the
+                cache are fetched
+        
+        Returns:
+            Token info dict, or None if the lookup failed
+        """
         try:
-            if chain.lower() == "ethereum":
-                return await self._get_evm_token_info(token_address)
-            elif chain.lower() == "solana":
-                return await self._get_solana_token_info(token_address)
-            else:
+            chain_key = chain if chain.islower() else chain.lower()
+            handlers = _CHAIN_HANDLERS.get(chain_key)
+            if handlers is None:
                 return None
+            
+            cache_key = f"{chain}:{token_address}"
+            now = time.monotonic()
+            entry = self._token_info_cache.get(cache_key)
+            if entry is not None and now < entry[0]:
+                meta_expiry, supply_expiry, cached = entry
+                if now >= supply_expiry:
+                    # Metadata is still fresh, so only the supply is re-read
+                    cached = {field: value for field, value in cached.items() if field != "total_supply"}
+            else:
+                meta_expiry = now + MLConfig.TOKEN_INFO_CACHE_TTL
+                supply_expiry = now
+                cached = {}
+            
+            onchain = _ONCHAIN_TOKEN_INFO_FIELDS[chain_key]
+            missing = tuple(field for field in fields if field in onchain and field not in cached)
+            if missing:
+                fetched = await getattr(self, handlers[1])(token_address, fields=missing, fill_defaults=False)
+                if fetched is None:
+                    return None
+                cached = {**cached, **fetched}
+                if "total_supply" in fetched:
+                    supply_expiry = now + MLConfig.TOKEN_SUPPLY_CACHE_TTL
+                
+                self._token_info_cache[cache_key] = (meta_expiry, supply_expiry, cached)
+            self._token_info_cache.move_to_end(cache_key)
+            while len(self._token_info_cache) > MLConfig.TOKEN_INFO_CACHE_MAX_SIZE:
+                self._token_info_cache.popitem(last=False)
+            
+            token_info = {
+                key: value for key, value in cached.items()
+                if key in fields or key not in _TOKEN_INFO_FIELDS
+            }
+            defaults = _TOKEN_INFO_DEFAULTS[chain_key]
+            for field in fields:
+                if field not in token_info and field in defaults:
+                    token_info[field] = defaults[field]
+            return token_info
                 
         except Exception as e:
             logger.error("Failed to get token info", token_address=token_address, chain=chain, error=str(e))
             return None
     
-    async def _get_evm_token_info(self, token_address: str) -> Optional[Dict[str, Any]]:
-        """Get EVM token information."""
+    async def _get_evm_token_info(
+        self, token_address: str, fields: Tuple[str, ...] = _TOKEN_INFO_FIELDS, fill_defaults: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get EVM token information.
+        
+        Args:
+            token_address: Token contract address
+            fields: ERC20 getters to call; fields not requested are left out
+                of the result, so callers only pay for what they read
+            fill_defaults: Use the ERC20 defaults for getters that failed;
+                when False those fields are left out instead
+            
+        Returns:
+            Token info dict, or None if the lookup failed
+        """
         try:
-            # ERC20 token standard function signatures
-            name_sig = "0x06fdde03"  # name()
-            symbol_sig = "0x95d89b41"  # symbol()
-            decimals_sig = "0x313ce567"  # decimals()
-            total_supply_sig = "0x18160ddd"  # totalSupply()
-            
-            # Get token name
-            name_response = await self.rpc_connector.make_request("eth_call", [
-                {"to": token_address, "data": name_sig}, "latest"
-            ])
+            call_data = [_ERC20_SELECTORS[field] for field in fields]
+            
+            # Fetch the requested fields in one eth_call through Multicall3,
+            # falling back to a JSON-RPC batch where Multicall3 is not deployed
+            results = await self._multicall(token_address, call_data)
+            if results is None:
+                responses = await self._rpc_batch(
+                    self.rpc_connector,
+                    [("eth_call", [{"to": token_address, "data": sig}, "latest"]) for sig in call_data]
+                )
+                results = [
+                    None if isinstance(r, Exception) or not r.success or not r.data or r.data == "0x" else r.data
+                    for r in responses
+                ]
             
-            # Get token symbol
-            symbol_response = await self.rpc_connector.make_request("eth_call", [
-                {"to": token_address, "data": symbol_sig}, "latest"
-            ])
+            # Parse responses
+            token_info: Dict[str, Any] = {"address": token_address, "chain": "ethereum"}
+            for field, data in zip(fields, results):
+                if not data:
+                    if fill_defaults:
+                        token_info[field] = _ERC20_FIELD_DEFAULTS[field]
+                elif field == "decimals" or field == "total_supply":
+                    token_info[field] = _decode_uint(data)
+                else:
+                    token_info[field] = self._decode_string_response(data)
+            
+            return token_info
             
-            # Get token decimals
-            decimals_response = await self.rpc_connector.make_request("eth_call", [
-                {"to": token_address, "data": decimals_sig}, "latest"
-            ])
+        except Exception as e:
+            logger.error("Failed to get EVM token info", token_address=token_address, error=str(e))
+            return None
+    
+    async def _multicall(self, target: str, call_data: List[str]) -> Optional[List[Optional[str]]]:
+        """
+        Run several calls against one contract in a single Multicall3 eth_call.
+        
+        Args:
+            target: Contract address every call is sent to
+            call_data: Hex-encoded calldata for each call
             
-            # Get total supply
-            total_supply_response = await self.rpc_connector.make_request("eth_call", [
-                {"to": token_address, "data": total_supply_sig}, "latest"
+        Returns:
+            Hex return data per call (None where the call failed or returned
+            nothing), or None if the aggregate call itself failed
+        """
+        try:
+            response = await self._rpc_request(self.rpc_connector, "eth_call", [
+                {"to": _MULTICALL3_ADDRESS, "data": _encode_aggregate3(target, call_data)}, "latest"
             ])
+            if not response.success or not response.data or response.data == "0x":
+                return None
             
-            # Parse responses
-            name = self._decode_string_response(name_response.data) if name_response.success else "Unknown"
-            symbol = self._decode_string_response(symbol_response.data) if symbol_response.success else "UNK"
-            decimals = int(decimals_response.data, 16) if decimals_response.success else 18
-            total_supply = int(total_supply_response.data, 16) if total_supply_response.success else 0
-            
-            return {
-                "address": token_address,
-                "symbol": symbol,
-                "name": name,
-                "decimals": decimals,
-                "total_supply": total_supply,
-                "chain": "ethereum"
-            }
+            return _decode_aggregate3(response.data)
             
         except Exception as e:
-            logger.error("Failed to get EVM token info", token_address=token_address, error=str(e))
+            logger.debug("Multicall3 aggregate failed", target=target, error=str(e))
             return None
     
-    async def _get_solana_token_info(self, mint_address: str) -> Optional[Dict[str, Any]]:
-        """Get Solana token information."""
+    def _limiter_for(self, connector) -> RpcRateLimiter:
+        """Get the rate limiter of the provider behind a connector."""
+        if connector is self.solana_rpc_connector:
+            return self.solana_rpc_limiter
+        return self.rpc_limiter
+    
+    async def _rpc_request(self, connector, method: str, params: list) -> Any:
+        """Send one JSON-RPC call once the provider's rate limiter allows it."""
+        async with self._limiter_for(connector):
+            return await connector.make_request(method, params)
+    
+    async def _rpc_batch(self, connector, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Send several JSON-RPC calls in a single round trip.
+        
+        Uses the connector's ``make_batch`` (one JSON-RPC 2.0 batch POST) when
+        available and batching is enabled, and otherwise issues the calls
+        concurrently.
+        
+        Args:
+            connector: RPC connector to send the calls through
+            calls: (method, params) pairs
+            
+        Returns:
+            Responses in the same order as ``calls``; on the concurrent path a
+            call that raised is returned as its exception
+        """
+        make_batch = getattr(connector, "make_batch", None) if self.rpc_batch_enabled else None
+        if make_batch is not None:
+            # Providers count every call in a batch against the rate limit
+            await self._limiter_for(connector).acquire(len(calls))
+            return await make_batch([
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                for i, (method, params) in enumerate(calls)
+            ])
+        
+        return await asyncio.gather(
+            *(self._rpc_request(connector, method, params) for method, params in calls),
+            return_exceptions=True
+        )
+    
+    async def _get_solana_token_info(
+        self, mint_address: str, fields: Tuple[str, ...] = _TOKEN_INFO_FIELDS, fill_defaults: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get Solana token information.
+        
+        Every field comes from the one mint account read, so ``fields`` is
+        accepted for parity with the EVM handler and the full info returned.
+        Name and symbol are not on chain; they are placeholders, and left out
+        when ``fill_defaults`` is False.
+        """
         try:
-            # Get mint account info
-            mint_response = await self.solana_rpc_connector.make_request("getAccountInfo", [mint_address])
+            # Get mint account info, decoded server-side by the node
+            mint_response = await self._rpc_request(self.solana_rpc_connector, "getAccountInfo", [mint_address, {"encoding": "jsonParsed"}])
             if not mint_response.success:
                 return None
             
@@ -922,48 +1350,55 @@ class KrakenAuditLayer:
                 return None
             
             # Parse mint account data
-            mint_bytes = bytes.fromhex(mint_data["value"]["data"][0])
-            
-            # Extract fields
-            supply = int.from_bytes(mint_bytes[32:40], byteorder='little')
-            decimals = mint_bytes[40]
+            _, supply, decimals, _ = self._parse_mint_account(mint_data)
             
-            return {
+            token_info = {
                 "address": mint_address,
-                "symbol": "UNK",  # Would need metadata lookup
-                "name": "Unknown Token",  # Would need metadata lookup
                 "decimals": decimals,
                 "total_supply": supply,
                 "chain": "solana"
             }
+            if fill_defaults:
+                # Would need metadata lookup
+                token_info.update(_SPL_FIELD_DEFAULTS)
+            return token_info
             
         except Exception as e:
             logger.error("Failed to get Solana token info", mint_address=mint_address, error=str(e))
             return None
     
+    @staticmethod
+    def _parse_mint_account(mint_data: Dict[str, Any]) -> Tuple[Optional[str], int, int, Optional[str]]:
+        """
+        Read a jsonParsed SPL Token mint account.
+        
+        Returns:
+            (mint authority, supply, decimals, freeze authority); an authority
+            is None when unset or set to the zero public key
+        """
+        info = mint_data["value"]["data"]["parsed"]["info"]
+        mint_authority = info.get("mintAuthority")
+        freeze_authority = info.get("freezeAuthority")
+        return (
+            mint_authority if mint_authority != _ZERO_PUBKEY else None,
+            int(info["supply"]),
+            info["decimals"],
+            freeze_authority if freeze_authority != _ZERO_PUBKEY else None,
+        )
+    
     def _decode_string_response(self, response_data: str) -> str:
         """Decode a string response from RPC call."""
         try:
             if not response_data or response_data == "0x":
                 return "Unknown"
             
-            # Remove 0x prefix
-            data = response_data[2:]
-            
-            # Skip the first 64 characters (offset and length)
-            if len(data) < 128:
+            # Decode the ABI payload once: offset word, length word, string bytes
+            raw = bytes.fromhex(response_data[2:])
+            if len(raw) < 64:
                 return "Unknown"
             
-            # Extract the string length
-            length_hex = data[64:128]
-            length = int(length_hex, 16)
-            
-            # Extract the string data
-            string_data = data[128:128 + length * 2]
-            
-            # Convert hex to string
-            string_bytes = bytes.fromhex(string_data)
-            return string_bytes.decode('utf-8').rstrip('\x00')
+            length = int.from_bytes(raw[32:64], "big")
+            return raw[64:64 + length].decode('utf-8').rstrip('\x00')
             
         except Exception as e:
             logger.error("Failed to decode string response", data=response_data, error=str(e))
@@ -985,37 +1420,12 @@ class KrakenAuditLayer:
         if compliance_score.overall_score < MLConfig.KRAKEN_COMPLIANCE_THRESHOLD:
             return False
         
-        # Check for hard veto conditions
-        if compliance_score.veto_reasons:
-            return False
-        
-        # Check for critical warnings
-        critical_warnings = [
-            "Hidden mint function detected",
-            "Transfer blocking detected",
-            "Excessive owner powers detected",
-            "Mint authority is active",
-            "Freeze authority is active"
-        ]
-        
-        for warning in compliance_score.warnings:
-            if any(critical in warning for critical in critical_warnings):
-                return False
-        
-        return True
+        # Check for hard veto conditions and critical warnings
+        return not (compliance_score.veto_mask or compliance_score.critical_mask)
     
     def get_compliance_level(self, score: float) -> ComplianceLevel:
         """Get compliance level from score."""
-        if score >= 90:
-            return ComplianceLevel.EXCELLENT
-        elif score >= 80:
-            return ComplianceLevel.GOOD
-        elif score >= 70:
-            return ComplianceLevel.MODERATE
-        elif score >= 60:
-            return ComplianceLevel.POOR
-        else:
-            return ComplianceLevel.FAILED
+        return _LEVELS[bisect.bisect_right(_THRESHOLDS, score)]
     
     def get_position_size_multiplier(self, analysis: TokenAnalysis) -> float:
         """Get position size multiplier based on compliance score."""
@@ -1025,7 +1435,7 @@ class KrakenAuditLayer:
             return 0.0  # No trading allowed
         
         # Apply size multiplier for unlisted tokens
-        if compliance_score.overall_score < 80:
+        if compliance_score.overall_score < _FULL_SIZE_SCORE:
             return MLConfig.UNLISTED_SIZE_MULTIPLIER
         
         return 1.0  # Full position size
@@ -1038,23 +1448,50 @@ class KrakenAuditLayer:
             return 0.0  # No ML weight
         
         # Apply ML weight for unlisted tokens
-        if compliance_score.overall_score < 80:
+        if compliance_score.overall_score < _FULL_SIZE_SCORE:
             return MLConfig.ML_UNLISTED_WEIGHT
         
         return 1.0  # Full ML weight
+    
+    def is_batch_compliant(self, batch: TokenAnalysisBatch) -> np.ndarray:
+        """
+        Check a whole batch of tokens against the compliance requirements.
+        
+        Args:
+            batch: Packed token analyses
+            
+        Returns:
+            Boolean array, True where the token is compliant
+        """
+        return _batch_compliant(batch.overall_scores, batch.veto_mask != 0, batch.warning_mask != 0)
+    
+    def score_analyses(self, analyses: List[TokenAnalysis]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Batch equivalent of the per-analysis compliance helpers.
+        
+        Args:
+            analyses: Token analysis results, e.g. from ``analyze_tokens_batch``
+            
+        Returns:
+            (compliant, position size multipliers, ML weight multipliers),
+            aligned with ``analyses``
+        """
+        batch = TokenAnalysisBatch.from_analyses(analyses)
+        return score_tokens(batch.overall_scores, batch.veto_mask != 0, batch.warning_mask != 0)
 
 
 # Global Kraken audit layer instance
 _kraken_audit_layer: Optional[KrakenAuditLayer] = None
 
 
-def get_kraken_audit_layer(rpc_connector=None, solana_rpc_connector=None) -> KrakenAuditLayer:
+def get_kraken_audit_layer(rpc_connector=None, solana_rpc_connector=None, redis_client=None) -> KrakenAuditLayer:
     """
     Get the global Kraken audit layer instance.
     
     Args:
         rpc_connector: EVM RPC connector
         solana_rpc_connector: Solana RPC connector
+        redis_client: Optional async Redis client shared across workers
         
     Returns:
         Kraken audit layer instance
@@ -1062,6 +1499,6 @@ def get_kraken_audit_layer(rpc_connector=None, solana_rpc_connector=None) -> Kra
     global _kraken_audit_layer
     
     if _kraken_audit_layer is None:
-        _kraken_audit_layer = KrakenAuditLayer(rpc_connector, solana_rpc_connector)
+        _kraken_audit_layer = KrakenAuditLayer(rpc_connector, solana_rpc_connector, redis_client)
     
     return _kraken_audit_layer
@@ -0,0 +1,312 @@
+"""
+Argon2 key derivation and AES-GCM sealing shared by the wallet managers.
+
+Deriving a wallet encryption key costs a full Argon2 run (64 MB, 3 passes),
+so keys derived in this process are kept in a small in-memory cache keyed by
+passphrase and salt. Repeated unlocks of the same wallet then only pay for
+AES-GCM. Set MEMBOT_KDF_CACHE=0 to disable the cache.
+
+MEMBOT_KDF_PROFILE picks the Argon2 cost for the global wallet managers.
+Wallets can only be decrypted with the profile they were encrypted with, so
+a profile other than "production" is refused unless MEMBOT_ALLOW_WEAK_KDF=1
+is also set.
+"""
+
+import atexit
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
+
+import structlog
+from argon2.low_level import Type, hash_secret_raw
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+logger = structlog.get_logger(__name__)
+
+# Argon2 cost presets, as wallet manager constructor arguments. "test" is far
+# too cheap for real wallets; it only keeps test suites from paying 64 MB per key.
+KDF_PROFILES: Mapping[str, Mapping[str, int]] = MappingProxyType({
+    "production": MappingProxyType({"argon2_memory": 65536, "argon2_time": 3, "argon2_parallelism": 4}),
+    "test": MappingProxyType({"argon2_memory": 8, "argon2_time": 1, "argon2_parallelism": 1}),
+})
+DEFAULT_KDF_PROFILE = "production"
+
+KEY_CACHE_ENABLED = os.getenv("MEMBOT_KDF_CACHE", "1") != "0"
+KEY_CACHE_MAX_SIZE = 32
+KEY_CACHE_TTL = 300  # seconds
+
+# Per-process secret, so cache keys never hold a passphrase or a plain hash of one
+_CACHE_KEY_SECRET = secrets.token_bytes(32)
+
+# Derived keys in LRU order; values are (monotonic expiry, key)
+_key_cache: "OrderedDict[Tuple[bytes, bytes, int, int, int, int], Tuple[float, bytearray]]" = OrderedDict()
+_key_cache_lock = threading.Lock()
+
+
+def _wipe(key: bytearray):
+    """Overwrite a cached key in place."""
+    key[:] = bytes(len(key))
+
+
+def _argon2_key(passphrase: bytes, salt: bytes, memory_cost: int, time_cost: int,
+                parallelism: int, key_len: int) -> bytes:
+    """Run Argon2id over the passphrase and salt, returning the raw hash as the key."""
+    return hash_secret_raw(
+        passphrase,
+        salt,
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=key_len,
+        type=Type.ID
+    )
+
+
+def legacy_key(key: bytes) -> bytes:
+    """
+    Map a derived key to the key older wallet blobs were encrypted with.
+    
+    Blobs sealed before raw key derivation used the leading characters of the
+    base64 text of the same Argon2id hash, so they can still be opened
+    without a second Argon2 run.
+    
+    Args:
+        key: Key returned by derive_key
+    
+    Returns:
+        Legacy encryption key of the same length
+    """
+    return base64.b64encode(key).rstrip(b"=")[:len(key)]
+
+
+def derive_key(passphrase: bytes, salt: bytes, *, memory_cost: int, time_cost: int,
+               parallelism: int, key_len: int) -> bytes:
+    """
+    Derive an encryption key with Argon2, reusing a recently derived key.
+    
+    Args:
+        passphrase: Passphrase bytes
+        salt: Per-wallet Argon2 salt
+        memory_cost: Argon2 memory cost in KB
+        time_cost: Argon2 iterations
+        parallelism: Argon2 lanes
+        key_len: Length of the derived key in bytes
+    
+    Returns:
+        Derived encryption key
+    """
+    if not KEY_CACHE_ENABLED:
+        return _argon2_key(passphrase, salt, memory_cost, time_cost, parallelism, key_len)
+    
+    passphrase_tag = hmac.new(_CACHE_KEY_SECRET, passphrase, hashlib.sha256).digest()
+    cache_key = (passphrase_tag, salt, memory_cost, time_cost, parallelism, key_len)
+    
+    with _key_cache_lock:
+        entry = _key_cache.get(cache_key)
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                _key_cache.move_to_end(cache_key)
+                return bytes(entry[1])
+            _wipe(_key_cache.pop(cache_key)[1])
+    
+    key = _argon2_key(passphrase, salt, memory_cost, time_cost, parallelism, key_len)
+    
+    with _key_cache_lock:
+        _key_cache[cache_key] = (time.monotonic() + KEY_CACHE_TTL, bytearray(key))
+        _key_cache.move_to_end(cache_key)
+        while len(_key_cache) > KEY_CACHE_MAX_SIZE:
+            _wipe(_key_cache.popitem(last=False)[1][1])
+    
+    return key
+
+
+def get_kdf_profile(name: str = None) -> Mapping[str, int]:
+    """
+    Look up Argon2 parameters by profile name.
+    
+    Args:
+        name: Profile name; defaults to MEMBOT_KDF_PROFILE, then "production"
+    
+    Returns:
+        Wallet manager constructor arguments for the profile
+    
+    Raises:
+        ValueError: If the profile is unknown, or MEMBOT_KDF_PROFILE names a
+            weaker profile without MEMBOT_ALLOW_WEAK_KDF=1
+    """
+    from_env = name is None
+    if from_env:
+        name = os.getenv("MEMBOT_KDF_PROFILE", DEFAULT_KDF_PROFILE)
+    try:
+        profile = KDF_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown KDF profile '{name}', expected one of {sorted(KDF_PROFILES)}") from None
+    
+    # A stray environment variable must not quietly weaken real wallets
+    if from_env and name != DEFAULT_KDF_PROFILE and os.getenv("MEMBOT_ALLOW_WEAK_KDF") != "1":
+        raise ValueError(
+            f"MEMBOT_KDF_PROFILE='{name}' weakens wallet encryption; set MEMBOT_ALLOW_WEAK_KDF=1 to allow it"
+        )
+    return profile
+
+
+def clear_key_cache():
+    """Wipe and drop every cached derived key."""
+    with _key_cache_lock:
+        for _, key in _key_cache.values():
+            _wipe(key)
+        _key_cache.clear()
+
+
+atexit.register(clear_key_cache)
+
+
+class WalletCipherMixin:
+    """
+    Passphrase sealing shared by the wallet managers.
+    
+    Blobs are laid out as Argon2 salt (16 bytes) + AES-GCM nonce (12 bytes)
+    + ciphertext with its 16-byte tag. Managers set AES_KEY_SIZE and
+    AES_NONCE_SIZE, and take the Argon2 cost as argon2_memory, argon2_time
+    and argon2_parallelism constructor arguments.
+    """
+    
+    SALT_SIZE = 16
+    MIN_BLOB_SIZE = 44  # salt + nonce + tag
+    
+    @classmethod
+    def from_profile(cls, name: str = None):
+        """
+        Create a manager with a named Argon2 cost profile.
+        
+        Args:
+            name: "production" or "test"; defaults to MEMBOT_KDF_PROFILE,
+                which only selects "test" with MEMBOT_ALLOW_WEAK_KDF=1
+        
+        Returns:
+            Configured manager
+        
+        Raises:
+            ValueError: If the profile is unknown or a weak profile was not allowed
+        """
+        profile = get_kdf_profile(name)
+        if profile is not KDF_PROFILES[DEFAULT_KDF_PROFILE]:
+            logger.warning("Using a reduced-cost KDF profile - not for real wallets", **profile)
+        return cls(**profile)
+    
+    def _derive_key(self, passphrase: str, salt: bytes) -> bytes:
+        """Derive the AES key for a passphrase and salt with this manager's Argon2 parameters."""
+        return derive_key(
+            passphrase.encode('utf-8'),
+            salt,
+            memory_cost=self.argon2_memory,
+            time_cost=self.argon2_time,
+            parallelism=self.argon2_parallelism,
+            key_len=self.AES_KEY_SIZE
+        )
+    
+    def logout(self):
+        """Forget every encryption key derived in this process."""
+        clear_key_cache()
+        logger.info("Cleared cached wallet encryption keys")
+    
+    def _seal(self, payloads: List[bytes], passphrase: str) -> List[bytes]:
+        """Encrypt payloads under one fresh salt and derived key, each with its own nonce."""
+        salt = secrets.token_bytes(self.SALT_SIZE)
+        aes_gcm = AESGCM(self._derive_key(passphrase, salt))
+        
+        encrypted_blobs = []
+        for payload in payloads:
+            nonce = secrets.token_bytes(self.AES_NONCE_SIZE)
+            # AES-GCM already appends the tag to the ciphertext
+            encrypted_blobs.append(salt + nonce + aes_gcm.encrypt(nonce, payload, None))
+        return encrypted_blobs
+    
+    def _unseal(self, encrypted_blobs: List[bytes], passphrase: str) -> List[bytes]:
+        """Decrypt blobs, deriving each distinct salt's key once."""
+        header_size = self.SALT_SIZE + self.AES_NONCE_SIZE
+        
+        # One cipher pair (current key, legacy key) per distinct salt
+        ciphers = {}
+        payloads = []
+        for blob in encrypted_blobs:
+            salt = blob[:self.SALT_SIZE]
+            nonce = blob[self.SALT_SIZE:header_size]
+            
+            if salt not in ciphers:
+                encryption_key = self._derive_key(passphrase, salt)
+                ciphers[salt] = (AESGCM(encryption_key), AESGCM(legacy_key(encryption_key)))
+            aes_gcm, legacy_aes_gcm = ciphers[salt]
+            
+            try:
+                payloads.append(aes_gcm.decrypt(nonce, blob[header_size:], None))
+            except InvalidTag:
+                # Blobs sealed before raw Argon2id keys used the base64 text of the hash
+                payloads.append(legacy_aes_gcm.decrypt(nonce, blob[header_size:], None))
+        return payloads
+    
+    def bulk_seal(self, payloads: List[bytes], passphrase: str) -> List[bytes]:
+        """
+        Encrypt many payloads under one passphrase with a single key derivation.
+        
+        All blobs share one Argon2 salt and one AES-GCM cipher, each with its
+        own nonce, and keep the usual salt + nonce + ciphertext + tag layout,
+        so any of them can also be decrypted on its own.
+        
+        Args:
+            payloads: Plaintexts to encrypt (e.g. serialized private keys)
+            passphrase: User-provided passphrase for encryption
+            
+        Returns:
+            Encrypted blobs, in the same order as payloads
+            
+        Raises:
+            ValueError: If passphrase is empty or too weak
+            RuntimeError: If encryption fails
+        """
+        if not passphrase or len(passphrase) < 8:
+            raise ValueError("Passphrase must be at least 8 characters long")
+        
+        try:
+            encrypted_blobs = self._seal(payloads, passphrase)
+            logger.info("Successfully sealed wallet payloads", count=len(encrypted_blobs))
+            return encrypted_blobs
+            
+        except Exception as e:
+            logger.error("Failed to seal wallet payloads", error=str(e))
+            raise RuntimeError(f"Bulk encryption failed: {e}")
+    
+    def bulk_unseal(self, encrypted_blobs: List[bytes], passphrase: str) -> List[bytes]:
+        """
+        Decrypt many blobs with the given passphrase, deriving each salt's key once.
+        
+        Args:
+            encrypted_blobs: Blobs from bulk_seal or the manager's single-key encrypt method
+            passphrase: User-provided passphrase for decryption
+            
+        Returns:
+            Decrypted payloads, in the same order as encrypted_blobs
+            
+        Raises:
+            ValueError: If any blob format is invalid
+            RuntimeError: If decryption fails (wrong passphrase or corrupted data)
+        """
+        if any(not blob or len(blob) < self.MIN_BLOB_SIZE for blob in encrypted_blobs):
+            raise ValueError("Invalid encrypted blob format")
+        
+        try:
+            payloads = self._unseal(encrypted_blobs, passphrase)
+            logger.info("Successfully unsealed wallet payloads", count=len(payloads))
+            return payloads
+            
+        except Exception as e:
+            logger.error("Failed to unseal wallet payloads", error=str(e))
+            raise RuntimeError(f"Bulk decryption failed: {e}")
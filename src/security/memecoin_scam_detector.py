@@ -6,28 +6,147 @@ identified from Webopedia and other crypto security sources.
 """
 
 import asyncio
-import json
+import bisect
+import re
+import threading
 import time
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-from decimal import Decimal
+import zlib
+from collections import OrderedDict
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from dataclasses import dataclass, field
+import numpy as np
 from src.utils.logger import get_logger
 from src.mcp.axiom_mcp_server import call_axiom_tool_sync
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Risk score weight per severity; unknown severities get the fallback weight
+_SEVERITY_WEIGHTS: Dict[str, float] = {'low': 0.2, 'medium': 0.4, 'high': 0.7, 'critical': 1.0}
+_UNKNOWN_SEVERITY_WEIGHT = 0.5
+# Indicator confidences are stored as integer hundredths
+_CONFIDENCE_SCALE = 100
+# One (weight, confidence_q) row per indicator for _calculate_risk_score
+_WEIGHTED_CONFIDENCE = np.dtype((np.float64, 2))
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Simulated signal streams, so social and tokenomics draws differ per symbol
+_SOCIAL_STREAM = 0
+_TOKENOMICS_STREAM = 1
+
+
+def _simulated_scores(symbol: str, stream: int, count: int) -> List[float]:
+    """Draw deterministic pseudo-random scores in [0, 1) for a symbol."""
+    rng = np.random.default_rng((zlib.crc32(symbol.encode()), stream))
+    return rng.random(count).tolist()
+
+
+# Recommendation blocks per risk level (any other level gets the safe block)
+_RECS_SAFE = (
+    "✅ SAFE: Token appears legitimate",
+    "Standard investment practices apply",
+)
+_RECS_BY_LEVEL: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'critical': (
+        "🚨 CRITICAL RISK: Avoid this token completely",
+        "Do not invest any funds in this token",
+        "Report suspicious activity to relevant authorities",
+    ),
+    'high': (
+        "⚠️ HIGH RISK: Exercise extreme caution",
+        "Only invest what you can afford to lose",
+        "Consider waiting for more information",
+    ),
+    'medium': (
+        "⚡ MEDIUM RISK: Proceed with caution",
+        "Do thorough research before investing",
+        "Monitor the token closely",
+    ),
+    'low': (
+        "✅ LOW RISK: Generally safe but monitor",
+        "Standard due diligence recommended",
+    ),
+})
 
-@dataclass
+# Extra recommendation per indicator type, in the order they are appended
+_INDICATOR_RECS: Mapping[str, str] = MappingProxyType({
+    'coordinated_shilling': "Be wary of coordinated social media promotion",
+    'rug_pull': "Check token distribution and team verification",
+    'fake_partnerships': "Verify all partnership claims independently",
+    'celebrity_scams': "Verify celebrity endorsements through official channels",
+})
+
+
+@dataclass(slots=True, frozen=True, init=False)
 class ScamIndicator:
-    """Individual scam indicator."""
+    """
+    Individual scam indicator.
+    
+    Built as ScamIndicator(type, severity, description, confidence, evidence)
+    with a 0.0 to 1.0 confidence, which is stored rounded to integer
+    hundredths. Pass confidence_q by keyword to give hundredths directly.
+    """
     type: str
     severity: str  # low, medium, high, critical
     description: str
-    confidence: float  # 0.0 to 1.0
+    # Confidence in hundredths (0-100); small ints are shared objects, unlike floats
+    confidence_q: int
     evidence: List[str]
+    # (format template, args) pairs, only formatted when the evidence is rendered
+    _evidence_templates: Tuple[Tuple[str, Tuple[Any, ...]], ...] = field(default=(), repr=False)
+    # Looked up once at construction so risk scoring needs no string lookups
+    severity_weight: float = field(init=False, repr=False, compare=False)
+    
+    def __init__(self, type: str, severity: str, description: str, confidence: Optional[float] = None,
+                 evidence: Optional[List[str]] = None, *, confidence_q: Optional[int] = None,
+                 _evidence_templates: Tuple[Tuple[str, Tuple[Any, ...]], ...] = ()):
+        if confidence_q is None:
+            if confidence is None:
+                raise TypeError("ScamIndicator needs a confidence or confidence_q")
+            confidence_q = round(confidence * _CONFIDENCE_SCALE)
+        elif confidence is not None:
+            raise TypeError("Pass either confidence or confidence_q, not both")
+        
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "severity", severity)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "confidence_q", confidence_q)
+        object.__setattr__(self, "evidence", evidence if evidence is not None else [])
+        object.__setattr__(self, "_evidence_templates", _evidence_templates)
+        object.__setattr__(self, "severity_weight", _SEVERITY_WEIGHTS.get(self.severity, _UNKNOWN_SEVERITY_WEIGHT))
+    
+    @classmethod
+    def from_confidence(cls, type: str, severity: str, description: str, confidence: float,
+                        evidence: Optional[List[str]] = None,
+                        evidence_templates: Tuple[Tuple[str, Tuple[Any, ...]], ...] = ()) -> "ScamIndicator":
+        """
+        Build an indicator whose evidence includes format templates.
+        
+        evidence_templates takes (format template, args) pairs; render_evidence
+        formats them after the plain evidence strings.
+        """
+        return cls(type, severity, description, confidence, evidence,
+                   _evidence_templates=tuple(evidence_templates))
+    
+    @property
+    def confidence(self) -> float:
+        """Confidence from 0.0 to 1.0, at 0.01 resolution."""
+        return self.confidence_q / _CONFIDENCE_SCALE
+    
+    def render_evidence(self) -> List[str]:
+        """Return the evidence strings followed by the formatted evidence templates."""
+        return self.evidence + [template.format(*args) for template, args in self._evidence_templates]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScamAnalysis:
     """Complete scam analysis for a token."""
     token_symbol: str
@@ -39,6 +158,65 @@ class ScamAnalysis:
     analysis_timestamp: float
     data_sources: List[str]
 
+_RISK_THRESHOLDS: Mapping[str, float] = MappingProxyType({
+    'safe': 0.0,
+    'low': 0.2,
+    'medium': 0.4,
+    'high': 0.6,
+    'critical': 0.8
+})
+
+# Sorted lookup table for _determine_risk_level: each level's lower
+# bound above the lowest, and the level names in the same order
+_RISK_LEVELS = tuple(sorted(_RISK_THRESHOLDS, key=_RISK_THRESHOLDS.__getitem__))
+_RISK_BOUNDS = tuple(_RISK_THRESHOLDS[level] for level in _RISK_LEVELS[1:])
+
+_SCAM_PATTERNS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'coordinated_shilling': MappingProxyType({
+        'description': 'Coordinated social media promotion',
+        'indicators': ('sudden volume spike', 'bot-like activity', 'repetitive messages')
+    }),
+    'mev_frontrunning': MappingProxyType({
+        'description': 'MEV bot frontrunning detection',
+        'indicators': ('suspicious transaction patterns', 'front-running behavior')
+    }),
+    'fake_partnerships': MappingProxyType({
+        'description': 'False partnership claims',
+        'indicators': ('unverified partnerships', 'no official confirmation')
+    }),
+    'social_hacks': MappingProxyType({
+        'description': 'Compromised social media accounts',
+        'indicators': ('unusual posting patterns', 'suspicious links')
+    }),
+    'celebrity_scams': MappingProxyType({
+        'description': 'Unauthorized celebrity endorsements',
+        'indicators': ('no official verification', 'suspicious claims')
+    }),
+    'rug_pull': MappingProxyType({
+        'description': 'Classic rug pull indicators',
+        'indicators': ('concentrated token supply', 'anonymous team', 'no liquidity lock')
+    })
+})
+
+# One matcher over every indicator phrase, so scan_text reads the text
+# once however many patterns there are
+_PHRASE_PATTERNS: Dict[str, List[str]] = {}
+for _pattern_name, _pattern in _SCAM_PATTERNS.items():
+    for _phrase in _pattern['indicators']:
+        _PHRASE_PATTERNS.setdefault(_phrase, []).append(_pattern_name)
+_PHRASE_AUTOMATON = None
+_PHRASE_REGEX = None
+if AHOCORASICK_AVAILABLE:
+    _PHRASE_AUTOMATON = ahocorasick.Automaton()
+    for _phrase in _PHRASE_PATTERNS:
+        _PHRASE_AUTOMATON.add_word(_phrase, _phrase)
+    _PHRASE_AUTOMATON.make_automaton()
+else:
+    # Longest phrases first so a shorter phrase never shadows a longer one
+    _PHRASE_REGEX = re.compile("|".join(
+        re.escape(phrase) for phrase in sorted(_PHRASE_PATTERNS, key=len, reverse=True)
+    ))
+
 
 class MemecoinScamDetector:
     """
@@ -53,95 +231,172 @@ class MemecoinScamDetector:
     - Rug pull indicators
     """
     
+    __slots__ = (
+        'analysis_cache', 'cache_duration', 'cache_max_size',
+        'axiom_failure_threshold', 'axiom_cooldown',
+        '_axiom_failures', '_axiom_open_until', '_axiom_lock'
+    )
+    
+    # Shared read-only tables, so detectors carry no per-instance copies
+    risk_thresholds = _RISK_THRESHOLDS
+    scam_patterns = _SCAM_PATTERNS
+    
     def __init__(self):
-        self.analysis_cache: Dict[str, ScamAnalysis] = {}
+        # Analysis cache (LRU order, bounded); values are (monotonic_ns expiry, analysis)
+        self.analysis_cache: "OrderedDict[str, Tuple[int, ScamAnalysis]]" = OrderedDict()
         self.cache_duration = 300  # 5 minutes
+        self.cache_max_size = 4096
+        
+        # Axiom circuit breaker: after this many consecutive failed calls,
+        # skip Axiom entirely until the cooldown has passed
+        self.axiom_failure_threshold = 3
+        self.axiom_cooldown = 30.0  # seconds
+        self._axiom_failures = 0
+        self._axiom_open_until = 0.0
+        self._axiom_lock = threading.Lock()
+    
+    def scan_text(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find scam pattern indicator phrases in free text such as social posts.
         
-        # Risk thresholds
-        self.risk_thresholds = {
-            'safe': 0.0,
-            'low': 0.2,
-            'medium': 0.4,
-            'high': 0.6,
-            'critical': 0.8
-        }
+        Args:
+            text: Text to scan (matched case-insensitively)
         
-        # Scam patterns to detect
-        self.scam_patterns = {
-            'coordinated_shilling': {
-                'description': 'Coordinated social media promotion',
-                'indicators': ['sudden volume spike', 'bot-like activity', 'repetitive messages']
-            },
-            'mev_frontrunning': {
-                'description': 'MEV bot frontrunning detection',
-                'indicators': ['suspicious transaction patterns', 'front-running behavior']
-            },
-            'fake_partnerships': {
-                'description': 'False partnership claims',
-                'indicators': ['unverified partnerships', 'no official confirmation']
-            },
-            'social_hacks': {
-                'description': 'Compromised social media accounts',
-                'indicators': ['unusual posting patterns', 'suspicious links']
-            },
-            'celebrity_scams': {
-                'description': 'Unauthorized celebrity endorsements',
-                'indicators': ['no official verification', 'suspicious claims']
-            },
-            'rug_pull': {
-                'description': 'Classic rug pull indicators',
-                'indicators': ['concentrated token supply', 'anonymous team', 'no liquidity lock']
-            }
-        }
+        Returns:
+            Matched phrases grouped by scam pattern name, each listed once
+        """
+        text = text.lower()
+        if _PHRASE_AUTOMATON is not None:
+            found = {phrase for _, phrase in _PHRASE_AUTOMATON.iter(text)}
+        else:
+            found = {match.group() for match in _PHRASE_REGEX.finditer(text)}
+        
+        hits: Dict[str, List[str]] = {}
+        for phrase in found:
+            for pattern_name in _PHRASE_PATTERNS[phrase]:
+                hits.setdefault(pattern_name, []).append(phrase)
+        return {name: sorted(phrases) for name, phrases in hits.items()}
     
-    def analyze_token(self, symbol: str, address: str = None) -> ScamAnalysis:
+    def analyze_token(self, symbol: str, address: str = None,
+                      market_snapshot: Optional[Dict[str, Any]] = None) -> ScamAnalysis:
         """
         Analyze a token for potential scams.
         
         Args:
             symbol: Token symbol
             address: Token contract address (optional)
+            market_snapshot: Indexed trending data from _fetch_market_snapshot
+                (optional); fetched per call when omitted
+        
+        Returns:
+            ScamAnalysis object with risk assessment
+        """
+        cached_analysis = self._get_cached_analysis(symbol, address)
+        if cached_analysis is not None:
+            return cached_analysis
+        
+        token_data = self._fetch_token_data(symbol)
+        if market_snapshot is None:
+            market_snapshot = self._fetch_market_snapshot()
+        return self._complete_analysis(symbol, address, token_data, market_snapshot)
+    
+    async def analyze_token_async(self, symbol: str, address: str = None,
+                                  market_snapshot: Optional[Dict[str, Any]] = None) -> ScamAnalysis:
+        """
+        Analyze a token for potential scams without blocking the event loop.
+        
+        Axiom calls run in worker threads, concurrently when the trending
+        snapshot also has to be fetched.
+        
+        Args:
+            symbol: Token symbol
+            address: Token contract address (optional)
+            market_snapshot: Indexed trending data from _fetch_market_snapshot
+                (optional); fetched per call when omitted
         
         Returns:
             ScamAnalysis object with risk assessment
         """
+        cached_analysis = self._get_cached_analysis(symbol, address)
+        if cached_analysis is not None:
+            return cached_analysis
+        
+        if market_snapshot is None:
+            token_data, market_snapshot = await asyncio.gather(
+                asyncio.to_thread(self._fetch_token_data, symbol),
+                asyncio.to_thread(self._fetch_market_snapshot)
+            )
+        else:
+            token_data = await asyncio.to_thread(self._fetch_token_data, symbol)
+        return self._complete_analysis(symbol, address, token_data, market_snapshot)
+    
+    def _get_cached_analysis(self, symbol: str, address: Optional[str]) -> Optional[ScamAnalysis]:
+        """Return a cached analysis that is still fresh, if any."""
+        cache_key = f"{symbol}_{address or 'unknown'}"
+        entry = self.analysis_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        if time.monotonic_ns() >= entry[0]:
+            del self.analysis_cache[cache_key]
+            return None
+        
+        self.analysis_cache.move_to_end(cache_key)
+        return entry[1]
+    
+    def _cache_analysis(self, symbol: str, address: Optional[str], analysis: ScamAnalysis):
+        """Store an analysis, evicting the least recently used beyond the size bound."""
+        cache_key = f"{symbol}_{address or 'unknown'}"
+        expires_ns = time.monotonic_ns() + int(self.cache_duration * _NS_PER_SECOND)
+        self.analysis_cache[cache_key] = (expires_ns, analysis)
+        self.analysis_cache.move_to_end(cache_key)
+        while len(self.analysis_cache) > self.cache_max_size:
+            self.analysis_cache.popitem(last=False)
+    
+    def _safe_axiom(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Call an Axiom tool behind the circuit breaker.
+        
+        Args:
+            tool_name: Axiom tool to call
+            arguments: Tool arguments
+        
+        Returns:
+            The response data, or None if the call failed or the breaker is open
+        """
+        if time.monotonic() < self._axiom_open_until:
+            logger.debug(f"Skipping Axiom {tool_name}: circuit open after repeated failures")
+            return None
+        
+        try:
+            response = call_axiom_tool_sync(tool_name, arguments)
+            if response.get("success"):
+                with self._axiom_lock:
+                    self._axiom_failures = 0
+                return response["data"]
+            error = response.get("error")
+        except Exception as e:
+            error = e
+        
+        logger.warning(f"Axiom {tool_name} failed: {error}")
+        with self._axiom_lock:
+            self._axiom_failures += 1
+            if self._axiom_failures >= self.axiom_failure_threshold:
+                self._axiom_open_until = time.monotonic() + self.axiom_cooldown
+                logger.warning(f"Axiom failed {self._axiom_failures} times in a row, "
+                               f"pausing calls for {self.axiom_cooldown:.0f}s")
+        return None
+    
+    def _fetch_token_data(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch token data from Axiom, None if unavailable."""
+        return self._safe_axiom("get_token_data", {"symbol": symbol})
+    
+    def _complete_analysis(self, symbol: str, address: Optional[str], token_data: Optional[Dict[str, Any]],
+                           market_snapshot: Optional[Dict[str, Any]]) -> ScamAnalysis:
+        """Score a token from already-fetched Axiom data and cache the result."""
         try:
-            # Check cache first
-            cache_key = f"{symbol}_{address or 'unknown'}"
-            if cache_key in self.analysis_cache:
-                cached_analysis = self.analysis_cache[cache_key]
-                if time.time() - cached_analysis.analysis_timestamp < self.cache_duration:
-                    return cached_analysis
-            
             # Perform analysis
-            indicators = []
-            data_sources = []
-            
-            # Get token data from Axiom
-            try:
-                token_data = call_axiom_tool_sync("get_token_data", {"symbol": symbol})
-                if token_data.get("success"):
-                    data_sources.append("axiom.trade")
-                    indicators.extend(self._analyze_token_data(token_data["data"]))
-            except Exception as e:
-                logger.warning(f"Failed to get token data from Axiom: {e}")
-            
-            # Analyze market data
-            try:
-                market_data = call_axiom_tool_sync("get_trending_tokens", {"limit": 100})
-                if market_data.get("success"):
-                    data_sources.append("axiom.trade_trending")
-                    indicators.extend(self._analyze_market_patterns(symbol, market_data["data"]))
-            except Exception as e:
-                logger.warning(f"Failed to analyze market patterns: {e}")
-            
-            # Analyze social signals (simulated)
-            indicators.extend(self._analyze_social_signals(symbol))
-            data_sources.append("social_analysis")
-            
-            # Analyze tokenomics
-            indicators.extend(self._analyze_tokenomics(symbol, address))
-            data_sources.append("tokenomics_analysis")
+            indicators, data_sources = self._analyze_core(symbol, address, token_data, market_snapshot)
             
             # Calculate overall risk
             risk_score = self._calculate_risk_score(indicators)
@@ -163,7 +418,7 @@ class MemecoinScamDetector:
             )
             
             # Cache result
-            self.analysis_cache[cache_key] = analysis
+            self._cache_analysis(symbol, address, analysis)
             
             logger.info(f"Scam analysis completed for {symbol}: {overall_risk} risk")
             return analysis
@@ -180,23 +435,23 @@ class MemecoinScamDetector:
             # Check for suspicious price movements
             price_change = token_data.get('price_change_24h', 0)
             if abs(price_change) > 2.0:  # >200% change
-                indicators.append(ScamIndicator(
+                indicators.append(ScamIndicator.from_confidence(
                     type='coordinated_shilling',
                     severity='high',
                     description=f'Extreme price volatility: {price_change:.1%} in 24h',
                     confidence=0.8,
-                    evidence=[f'24h price change: {price_change:.1%}']
+                    evidence_templates=[('24h price change: {:.1%}', (price_change,))]
                 ))
             
             # Check trend score
             trend_score = token_data.get('trend_score', 0)
             if trend_score > 8.0:  # Very high trend score
-                indicators.append(ScamIndicator(
+                indicators.append(ScamIndicator.from_confidence(
                     type='coordinated_shilling',
                     severity='medium',
                     description=f'Unusually high trend score: {trend_score:.1f}',
                     confidence=0.6,
-                    evidence=[f'Trend score: {trend_score:.1f}']
+                    evidence_templates=[('Trend score: {:.1f}', (trend_score,))]
                 ))
             
             # Check volume vs market cap ratio
@@ -205,12 +460,12 @@ class MemecoinScamDetector:
             if market_cap > 0:
                 volume_ratio = volume / market_cap
                 if volume_ratio > 0.5:  # Volume > 50% of market cap
-                    indicators.append(ScamIndicator(
+                    indicators.append(ScamIndicator.from_confidence(
                         type='mev_frontrunning',
                         severity='medium',
                         description=f'High volume to market cap ratio: {volume_ratio:.2f}',
                         confidence=0.7,
-                        evidence=[f'Volume/MarketCap ratio: {volume_ratio:.2f}']
+                        evidence_templates=[('Volume/MarketCap ratio: {:.2f}', (volume_ratio,))]
                     ))
             
         except Exception as e:
@@ -218,19 +473,65 @@ class MemecoinScamDetector:
         
         return indicators
     
-    def _analyze_market_patterns(self, symbol: str, market_data: Dict) -> List[ScamIndicator]:
+    def _analyze_core(self, symbol: str, address: Optional[str], token_data: Optional[Dict[str, Any]],
+                      market_snapshot: Optional[Dict[str, Any]]) -> Tuple[List[ScamIndicator], List[str]]:
+        """Collect the scam indicators for a token and the data sources they came from."""
+        indicators = []
+        data_sources = []
+        
+        # Analyze token data from Axiom
+        if token_data is not None:
+            data_sources.append("axiom.trade")
+            indicators.extend(self._analyze_token_data(token_data))
+        
+        # Analyze market data
+        if market_snapshot is not None:
+            data_sources.append("axiom.trade_trending")
+            indicators.extend(self._analyze_market_patterns(symbol, market_snapshot))
+        
+        # Analyze social signals (simulated)
+        indicators.extend(self._analyze_social_signals(symbol))
+        data_sources.append("social_analysis")
+        
+        # Analyze tokenomics
+        indicators.extend(self._analyze_tokenomics(symbol, address))
+        data_sources.append("tokenomics_analysis")
+        
+        return indicators, data_sources
+    
+    def _fetch_market_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Fetch the trending token list and index it for market pattern checks."""
+        market_data = self._safe_axiom("get_trending_tokens", {"limit": 100})
+        if market_data is None:
+            return None
+        try:
+            return self._build_market_snapshot(market_data)
+        except Exception as e:
+            logger.warning(f"Failed to index trending tokens from Axiom: {e}")
+            return None
+    
+    def _build_market_snapshot(self, market_data: Dict) -> Dict[str, Any]:
+        """Index trending market data once so many symbols can be checked against it."""
+        tokens = market_data.get('tokens', [])
+        price_changes = np.fromiter(
+            (t.get('price_change_24h', 0) for t in tokens), dtype=np.float64, count=len(tokens)
+        )
+        return {
+            'tokens': tokens,
+            'by_symbol': {token['symbol']: token for token in tokens},
+            'price_changes': price_changes,
+            'high_gainer_count': int(np.count_nonzero(price_changes > 0.5))
+        }
+    
+    def _analyze_market_patterns(self, symbol: str, market_snapshot: Dict[str, Any]) -> List[ScamIndicator]:
         """Analyze market patterns for scam indicators."""
         indicators = []
         
         try:
-            tokens = market_data.get('tokens', [])
+            tokens = market_snapshot['tokens']
             
             # Find the token in trending list
-            token_info = None
-            for token in tokens:
-                if token['symbol'] == symbol:
-                    token_info = token
-                    break
+            token_info = market_snapshot['by_symbol'].get(symbol)
             
             if token_info:
                 # Check if token is in top gainers but with suspicious patterns
@@ -239,28 +540,28 @@ class MemecoinScamDetector:
                     # Check if it's a new token (low market cap)
                     market_cap = token_info.get('market_cap', 0)
                     if market_cap < 1000000:  # < $1M market cap
-                        indicators.append(ScamIndicator(
+                        indicators.append(ScamIndicator.from_confidence(
                             type='rug_pull',
                             severity='high',
                             description=f'New token with extreme gains: {price_change:.1%}',
                             confidence=0.8,
-                            evidence=[
-                                f'Price change: {price_change:.1%}',
-                                f'Market cap: ${market_cap:,.0f}'
+                            evidence_templates=[
+                                ('Price change: {:.1%}', (price_change,)),
+                                ('Market cap: ${:,.0f}', (market_cap,))
                             ]
                         ))
             
             # Check for coordinated shilling patterns
             if len(tokens) > 0:
                 # Look for multiple tokens with similar patterns
-                high_gainers = [t for t in tokens if t.get('price_change_24h', 0) > 0.5]
-                if len(high_gainers) > 5:  # Many tokens with >50% gains
-                    indicators.append(ScamIndicator(
+                high_gainer_count = market_snapshot['high_gainer_count']
+                if high_gainer_count > 5:  # Many tokens with >50% gains
+                    indicators.append(ScamIndicator.from_confidence(
                         type='coordinated_shilling',
                         severity='medium',
                         description=f'Multiple tokens showing coordinated gains',
                         confidence=0.6,
-                        evidence=[f'{len(high_gainers)} tokens with >50% gains']
+                        evidence_templates=[('{} tokens with >50% gains', (high_gainer_count,))]
                     ))
             
         except Exception as e:
@@ -274,32 +575,29 @@ class MemecoinScamDetector:
         
         try:
             # Simulate social media analysis
-            import random
+            bot_score, spam_score, fake_endorsement = _simulated_scores(symbol, _SOCIAL_STREAM, 3)
             
             # Check for bot-like activity
-            bot_score = random.uniform(0, 1)
             if bot_score > 0.7:
-                indicators.append(ScamIndicator(
+                indicators.append(ScamIndicator.from_confidence(
                     type='coordinated_shilling',
                     severity='medium',
                     description='High bot activity detected in social media',
                     confidence=bot_score,
-                    evidence=['Bot detection score: {:.2f}'.format(bot_score)]
+                    evidence_templates=[('Bot detection score: {:.2f}', (bot_score,))]
                 ))
             
             # Check for suspicious posting patterns
-            spam_score = random.uniform(0, 1)
             if spam_score > 0.6:
-                indicators.append(ScamIndicator(
+                indicators.append(ScamIndicator.from_confidence(
                     type='social_hacks',
                     severity='medium',
                     description='Suspicious posting patterns detected',
                     confidence=spam_score,
-                    evidence=['Spam detection score: {:.2f}'.format(spam_score)]
+                    evidence_templates=[('Spam detection score: {:.2f}', (spam_score,))]
                 ))
             
             # Check for fake celebrity endorsements
-            fake_endorsement = random.uniform(0, 1)
             if fake_endorsement > 0.8:
                 indicators.append(ScamIndicator(
                     type='celebrity_scams',
@@ -320,10 +618,10 @@ class MemecoinScamDetector:
         
         try:
             # Simulate tokenomics analysis
-            import random
+            (concentration_score, anonymity_score,
+             liquidity_score, partnership_score) = _simulated_scores(symbol, _TOKENOMICS_STREAM, 4)
             
             # Check for concentrated token supply
-            concentration_score = random.uniform(0, 1)
             if concentration_score > 0.7:
                 indicators.append(ScamIndicator(
                     type='rug_pull',
@@ -334,7 +632,6 @@ class MemecoinScamDetector:
                 ))
             
             # Check for anonymous team
-            anonymity_score = random.uniform(0, 1)
             if anonymity_score > 0.6:
                 indicators.append(ScamIndicator(
                     type='rug_pull',
@@ -345,7 +642,6 @@ class MemecoinScamDetector:
                 ))
             
             # Check for liquidity lock
-            liquidity_score = random.uniform(0, 1)
             if liquidity_score < 0.3:
                 indicators.append(ScamIndicator(
                     type='rug_pull',
@@ -356,7 +652,6 @@ class MemecoinScamDetector:
                 ))
             
             # Check for fake partnerships
-            partnership_score = random.uniform(0, 1)
             if partnership_score > 0.8:
                 indicators.append(ScamIndicator(
                     type='fake_partnerships',
@@ -376,82 +671,51 @@ class MemecoinScamDetector:
         if not indicators:
             return 0.0
         
-        # Weight indicators by severity and confidence
-        severity_weights = {
-            'low': 0.2,
-            'medium': 0.4,
-            'high': 0.7,
-            'critical': 1.0
-        }
-        
-        total_weighted_score = 0.0
-        total_weight = 0.0
-        
-        for indicator in indicators:
-            weight = severity_weights.get(indicator.severity, 0.5)
-            weighted_score = weight * indicator.confidence
-            total_weighted_score += weighted_score
-            total_weight += weight
+        # Weight indicators by severity and confidence, read in one pass
+        rows = np.fromiter(
+            ((i.severity_weight, i.confidence_q) for i in indicators),
+            dtype=_WEIGHTED_CONFIDENCE, count=len(indicators)
+        )
+        weights, confidences_q = rows[:, 0], rows[:, 1]
         
+        total_weight = weights.sum()
         if total_weight == 0:
             return 0.0
         
-        return min(1.0, total_weighted_score / total_weight)
+        return min(1.0, float(weights @ confidences_q / (total_weight * _CONFIDENCE_SCALE)))
     
     def _determine_risk_level(self, risk_score: float) -> str:
         """Determine risk level from score."""
-        if risk_score >= self.risk_thresholds['critical']:
-            return 'critical'
-        elif risk_score >= self.risk_thresholds['high']:
-            return 'high'
-        elif risk_score >= self.risk_thresholds['medium']:
-            return 'medium'
-        elif risk_score >= self.risk_thresholds['low']:
-            return 'low'
-        else:
-            return 'safe'
+        return _RISK_LEVELS[bisect.bisect_right(_RISK_BOUNDS, risk_score)]
     
-    def _generate_recommendations(self, indicators: List[ScamIndicator], risk_level: str) -> List[str]:
-        """Generate recommendations based on analysis."""
-        recommendations = []
-        
-        if risk_level == 'critical':
-            recommendations.append("🚨 CRITICAL RISK: Avoid this token completely")
-            recommendations.append("Do not invest any funds in this token")
-            recommendations.append("Report suspicious activity to relevant authorities")
-        
-        elif risk_level == 'high':
-            recommendations.append("⚠️ HIGH RISK: Exercise extreme caution")
-            recommendations.append("Only invest what you can afford to lose")
-            recommendations.append("Consider waiting for more information")
+    def _generate_recommendations(self, indicators: List[ScamIndicator], risk_level: str,
+                                  limit: Optional[int] = None) -> List[str]:
+        """
+        Generate recommendations based on analysis.
         
-        elif risk_level == 'medium':
-            recommendations.append("⚡ MEDIUM RISK: Proceed with caution")
-            recommendations.append("Do thorough research before investing")
-            recommendations.append("Monitor the token closely")
+        Args:
+            indicators: Indicators found for the token
+            risk_level: Overall risk level
+            limit: Stop after this many recommendations (optional)
         
-        elif risk_level == 'low':
-            recommendations.append("✅ LOW RISK: Generally safe but monitor")
-            recommendations.append("Standard due diligence recommended")
+        Returns:
+            Risk level recommendations followed by indicator-specific ones
+        """
+        level_recommendations = _RECS_BY_LEVEL.get(risk_level, _RECS_SAFE)
+        if limit is not None and limit <= len(level_recommendations):
+            return list(level_recommendations[:limit])
         
-        else:
-            recommendations.append("✅ SAFE: Token appears legitimate")
-            recommendations.append("Standard investment practices apply")
+        recommendations = list(level_recommendations)
         
         # Add specific recommendations based on indicators
-        indicator_types = [ind.type for ind in indicators]
-        
-        if 'coordinated_shilling' in indicator_types:
-            recommendations.append("Be wary of coordinated social media promotion")
-        
-        if 'rug_pull' in indicator_types:
-            recommendations.append("Check token distribution and team verification")
-        
-        if 'fake_partnerships' in indicator_types:
-            recommendations.append("Verify all partnership claims independently")
-        
-        if 'celebrity_scams' in indicator_types:
-            recommendations.append("Verify celebrity endorsements through official channels")
+        indicator_types = {ind.type for ind in indicators}
+        indicator_recommendations = (
+            recommendation for indicator_type, recommendation in _INDICATOR_RECS.items()
+            if indicator_type in indicator_types
+        )
+        if limit is not None:
+            indicator_recommendations = islice(indicator_recommendations, limit - len(recommendations))
+        recommendations.extend(indicator_recommendations)
         
         return recommendations
     
@@ -481,18 +745,38 @@ class MemecoinScamDetector:
         )
     
     def get_risk_summary(self, symbol: str) -> Dict[str, Any]:
-        """Get a summary of risk analysis for a token."""
+        """
+        Get a summary of risk analysis for a token.
+        
+        A fresh cached analysis is summarized as is; otherwise only the
+        indicators, score and top 3 recommendations are computed, without
+        building (or caching) a full ScamAnalysis.
+        """
         try:
-            analysis = self.analyze_token(symbol)
+            analysis = self._get_cached_analysis(symbol, None)
+            if analysis is not None:
+                indicators = analysis.indicators
+                risk_score = analysis.risk_score
+                risk_level = analysis.overall_risk
+                recommendations = analysis.recommendations[:3]
+                last_updated = analysis.analysis_timestamp
+            else:
+                token_data = self._fetch_token_data(symbol)
+                market_snapshot = self._fetch_market_snapshot()
+                indicators, _ = self._analyze_core(symbol, None, token_data, market_snapshot)
+                risk_score = self._calculate_risk_score(indicators)
+                risk_level = self._determine_risk_level(risk_score)
+                recommendations = self._generate_recommendations(indicators, risk_level, limit=3)
+                last_updated = time.time()
             
             return {
                 'symbol': symbol,
-                'risk_level': analysis.overall_risk,
-                'risk_score': analysis.risk_score,
-                'indicator_count': len(analysis.indicators),
-                'high_severity_count': len([i for i in analysis.indicators if i.severity in ['high', 'critical']]),
-                'recommendations': analysis.recommendations[:3],  # Top 3 recommendations
-                'last_updated': analysis.analysis_timestamp
+                'risk_level': risk_level,
+                'risk_score': risk_score,
+                'indicator_count': len(indicators),
+                'high_severity_count': sum(1 for i in indicators if i.severity in ('high', 'critical')),
+                'recommendations': recommendations,  # Top 3 recommendations
+                'last_updated': last_updated
             }
             
         except Exception as e:
@@ -505,27 +789,46 @@ class MemecoinScamDetector:
             }
     
     def batch_analyze_tokens(self, symbols: List[str]) -> Dict[str, ScamAnalysis]:
-        """Analyze multiple tokens in batch."""
-        results = {}
+        """
+        Analyze multiple tokens in batch.
+        
+        Runs batch_analyze_tokens_async on a fresh event loop, so call it from
+        synchronous code only.
+        """
+        return asyncio.run(self.batch_analyze_tokens_async(symbols))
+    
+    async def batch_analyze_tokens_async(self, symbols: List[str]) -> Dict[str, ScamAnalysis]:
+        """Analyze multiple tokens concurrently."""
+        # Every symbol is checked against the same trending list, so fetch it once
+        market_snapshot = await asyncio.to_thread(self._fetch_market_snapshot)
+        
+        unique_symbols = list(dict.fromkeys(symbols))
+        analyses = await asyncio.gather(
+            *(self.analyze_token_async(symbol, market_snapshot=market_snapshot) for symbol in unique_symbols),
+            return_exceptions=True
+        )
         
-        for symbol in symbols:
-            try:
-                results[symbol] = self.analyze_token(symbol)
-            except Exception as e:
-                logger.error(f"Failed to analyze {symbol}: {e}")
-                results[symbol] = self._create_error_analysis(symbol, None, str(e))
+        results = {}
+        for symbol, analysis in zip(unique_symbols, analyses):
+            if isinstance(analysis, Exception):
+                logger.error(f"Failed to analyze {symbol}: {analysis}")
+                analysis = self._create_error_analysis(symbol, None, str(analysis))
+            results[symbol] = analysis
         
         return results
 
 
 # Global detector instance
 _scam_detector: Optional[MemecoinScamDetector] = None
+_scam_detector_lock = threading.Lock()
 
 def get_scam_detector() -> MemecoinScamDetector:
-    """Get the global scam detector instance."""
+    """Get the global scam detector instance, creating it once across threads."""
     global _scam_detector
     if _scam_detector is None:
-        _scam_detector = MemecoinScamDetector()
+        with _scam_detector_lock:
+            if _scam_detector is None:
+                _scam_detector = MemecoinScamDetector()
     return _scam_detector
 
 
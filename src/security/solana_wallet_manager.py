@@ -11,11 +11,11 @@ using industry-standard cryptographic practices:
 
 import secrets
 from typing import Optional
-from argon2 import PasswordHasher
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.backends import default_backend
 import structlog
 
+from src.security.key_derivation import WalletCipherMixin
+
 # Solana imports
 try:
     from solana.keypair import Keypair
@@ -36,7 +36,7 @@ except ImportError:
 logger = structlog.get_logger(__name__)
 
 
-class SolanaWalletManager:
+class SolanaWalletManager(WalletCipherMixin):
     """
     Secure Solana wallet manager with encrypted keypair storage.
     
@@ -59,18 +59,22 @@ class SolanaWalletManager:
     AES_KEY_SIZE = 32  # 256-bit key
     AES_NONCE_SIZE = 12  # 96-bit nonce (recommended for GCM)
     
-    def __init__(self):
-        """Initialize the Solana wallet manager."""
+    def __init__(self, *, argon2_memory: int = ARGON2_MEMORY, argon2_time: int = ARGON2_ITERATIONS,
+                 argon2_parallelism: int = ARGON2_PARALLELISM):
+        """
+        Initialize the Solana wallet manager.
+        
+        Args:
+            argon2_memory: Argon2 memory cost in KB
+            argon2_time: Argon2 iterations
+            argon2_parallelism: Argon2 parallelism
+        """
         if not SOLANA_AVAILABLE:
             logger.warning("Solana libraries not available - running in stub mode")
         
-        self.password_hasher = PasswordHasher(
-            memory_cost=self.ARGON2_MEMORY,
-            time_cost=self.ARGON2_ITERATIONS,
-            parallelism=self.ARGON2_PARALLELISM,
-            hash_len=32,
-            salt_len=16
-        )
+        self.argon2_memory = argon2_memory
+        self.argon2_time = argon2_time
+        self.argon2_parallelism = argon2_parallelism
     
     def generate_and_encrypt_keypair(self, passphrase: str) -> bytes:
         """
@@ -106,38 +110,8 @@ class SolanaWalletManager:
                 # Solana keypairs are 64 bytes: 32 bytes private key + 32 bytes public key
                 keypair_bytes = bytes(keypair)
             
-            # Generate secure random salt for Argon2
-            salt = secrets.token_bytes(16)
-            
-            # Derive encryption key using Argon2
-            # Using argon2-cffi for key derivation
-            ph = PasswordHasher(
-                memory_cost=self.ARGON2_MEMORY,
-                time_cost=self.ARGON2_ITERATIONS,
-                parallelism=self.ARGON2_PARALLELISM,
-                hash_len=self.AES_KEY_SIZE,
-                salt_len=16
-            )
-            
-            # Hash the passphrase with the salt to get a deterministic key
-            hash_result = ph.hash(passphrase.encode('utf-8'), salt=salt)
-            # Extract the hash part (remove the encoded parameters)
-            encryption_key = hash_result.split('$')[-1].encode('utf-8')[:self.AES_KEY_SIZE]
-            
-            # Generate secure random nonce for AES-GCM
-            nonce = secrets.token_bytes(self.AES_NONCE_SIZE)
-            
-            # Encrypt the keypair using AES-GCM
-            aes_gcm = AESGCM(encryption_key)
-            encrypted_data = aes_gcm.encrypt(nonce, keypair_bytes, None)
-            
-            # Split encrypted data into ciphertext and authentication tag
-            # AES-GCM appends the tag to the ciphertext
-            ciphertext = encrypted_data[:-16]
-            auth_tag = encrypted_data[-16:]
-            
-            # Create the encrypted blob: salt + nonce + ciphertext + auth_tag
-            encrypted_blob = salt + nonce + ciphertext + auth_tag
+            # Seal under a fresh Argon2 salt: salt + nonce + ciphertext + auth_tag
+            encrypted_blob = self._seal([keypair_bytes], passphrase)[0]
             
             logger.info("Successfully generated and encrypted Solana keypair")
             return encrypted_blob
@@ -161,36 +135,13 @@ class SolanaWalletManager:
             ValueError: If encrypted_blob format is invalid
             RuntimeError: If decryption fails (wrong passphrase or corrupted data)
         """
-        if not encrypted_blob or len(encrypted_blob) < 44:  # Minimum size check
+        if not encrypted_blob or len(encrypted_blob) < self.MIN_BLOB_SIZE:
             raise ValueError("Invalid encrypted keypair format")
         
         try:
-            # Parse the encrypted blob: salt + nonce + ciphertext + auth_tag
-            salt = encrypted_blob[:16]
-            nonce = encrypted_blob[16:28]
-            ciphertext = encrypted_blob[28:-16]
-            auth_tag = encrypted_blob[-16:]
-            
-            # Reconstruct the encrypted data for AES-GCM
-            encrypted_data = ciphertext + auth_tag
-            
-            # Derive the same encryption key using Argon2
-            ph = PasswordHasher(
-                memory_cost=self.ARGON2_MEMORY,
-                time_cost=self.ARGON2_ITERATIONS,
-                parallelism=self.ARGON2_PARALLELISM,
-                hash_len=self.AES_KEY_SIZE,
-                salt_len=16
-            )
-            
-            # Hash the passphrase with the salt to get a deterministic key
-            hash_result = ph.hash(passphrase.encode('utf-8'), salt=salt)
-            # Extract the hash part (remove the encoded parameters)
-            encryption_key = hash_result.split('$')[-1].encode('utf-8')[:self.AES_KEY_SIZE]
-            
-            # Decrypt the keypair using AES-GCM
-            aes_gcm = AESGCM(encryption_key)
-            decrypted_bytes = aes_gcm.decrypt(nonce, encrypted_data, None)
+            # Decrypt with the Argon2 key for the blob's salt (cached per passphrase and salt),
+            # falling back to the legacy key for older blobs
+            decrypted_bytes = self._unseal([encrypted_blob], passphrase)[0]
             
             # Create Keypair object from decrypted bytes
             if not SOLANA_AVAILABLE:
@@ -405,7 +356,7 @@ def get_solana_wallet_manager() -> SolanaWalletManager:
     global _solana_wallet_manager
     
     if _solana_wallet_manager is None:
-        _solana_wallet_manager = SolanaWalletManager()
+        _solana_wallet_manager = SolanaWalletManager.from_profile()
     
     return _solana_wallet_manager
 
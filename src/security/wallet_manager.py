@@ -9,19 +9,43 @@ using industry-standard cryptographic practices:
 - Proper authentication tag handling
 """
 
-import secrets
-from cryptography.hazmat.primitives import hashes, serialization
-# Argon2 is provided by argon2-cffi package
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.backends import default_backend
-from argon2 import PasswordHasher
 import structlog
 
+from src.security.key_derivation import WalletCipherMixin
+
+# Ethereum's Keccak-256 (not NIST SHA3-256); eth-hash ships with web3
+try:
+    from eth_hash.auto import keccak
+    KECCAK_AVAILABLE = True
+except ImportError:
+    KECCAK_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Order of the secp256k1 group; valid private keys are 1 .. n - 1
+_SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+if not KECCAK_AVAILABLE:
+    logger.warning("eth-hash not available - wallet address generation is disabled")
+
+
+def _keccak256(data: bytes) -> bytes:
+    """
+    Hash data with Keccak-256.
+    
+    Raises:
+        RuntimeError: If eth-hash is not installed; no other hash yields
+            addresses that match Ethereum
+    """
+    if not KECCAK_AVAILABLE:
+        raise RuntimeError("Keccak-256 unavailable: install eth-hash[pycryptodome]")
+    return keccak(data)
+
 
-class WalletManager:
+class WalletManager(WalletCipherMixin):
     """
     Secure wallet manager with encrypted private key storage.
     
@@ -44,15 +68,19 @@ class WalletManager:
     AES_KEY_SIZE = 32  # 256-bit key
     AES_NONCE_SIZE = 12  # 96-bit nonce (recommended for GCM)
     
-    def __init__(self):
-        """Initialize the wallet manager."""
-        self.password_hasher = PasswordHasher(
-            memory_cost=self.ARGON2_MEMORY,
-            time_cost=self.ARGON2_ITERATIONS,
-            parallelism=self.ARGON2_PARALLELISM,
-            hash_len=32,
-            salt_len=16
-        )
+    def __init__(self, *, argon2_memory: int = ARGON2_MEMORY, argon2_time: int = ARGON2_ITERATIONS,
+                 argon2_parallelism: int = ARGON2_PARALLELISM):
+        """
+        Initialize the wallet manager.
+        
+        Args:
+            argon2_memory: Argon2 memory cost in KB
+            argon2_time: Argon2 iterations
+            argon2_parallelism: Argon2 parallelism
+        """
+        self.argon2_memory = argon2_memory
+        self.argon2_time = argon2_time
+        self.argon2_parallelism = argon2_parallelism
     
     def generate_and_encrypt_key(self, passphrase: str) -> bytes:
         """
@@ -90,38 +118,8 @@ class WalletManager:
                 encryption_algorithm=serialization.NoEncryption()
             )
             
-            # Generate secure random salt for Argon2
-            salt = secrets.token_bytes(16)
-            
-            # Derive encryption key using Argon2
-            # Using argon2-cffi for key derivation
-            ph = PasswordHasher(
-                memory_cost=self.ARGON2_MEMORY,
-                time_cost=self.ARGON2_ITERATIONS,
-                parallelism=self.ARGON2_PARALLELISM,
-                hash_len=self.AES_KEY_SIZE,
-                salt_len=16
-            )
-            
-            # Hash the passphrase with the salt to get a deterministic key
-            hash_result = ph.hash(passphrase.encode('utf-8'), salt=salt)
-            # Extract the hash part (remove the encoded parameters)
-            encryption_key = hash_result.split('$')[-1].encode('utf-8')[:self.AES_KEY_SIZE]
-            
-            # Generate secure random nonce for AES-GCM
-            nonce = secrets.token_bytes(self.AES_NONCE_SIZE)
-            
-            # Encrypt the private key using AES-GCM
-            aes_gcm = AESGCM(encryption_key)
-            encrypted_data = aes_gcm.encrypt(nonce, private_key_pem, None)
-            
-            # Split encrypted data into ciphertext and authentication tag
-            # AES-GCM appends the tag to the ciphertext
-            ciphertext = encrypted_data[:-16]
-            auth_tag = encrypted_data[-16:]
-            
-            # Create the encrypted blob: salt + nonce + ciphertext + auth_tag
-            encrypted_blob = salt + nonce + ciphertext + auth_tag
+            # Seal under a fresh Argon2 salt: salt + nonce + ciphertext + auth_tag
+            encrypted_blob = self._seal([private_key_pem], passphrase)[0]
             
             logger.info("Successfully generated and encrypted private key")
             return encrypted_blob
@@ -145,36 +143,13 @@ class WalletManager:
             ValueError: If encrypted_key format is invalid
             RuntimeError: If decryption fails (wrong passphrase or corrupted data)
         """
-        if not encrypted_key or len(encrypted_key) < 44:  # Minimum size check
+        if not encrypted_key or len(encrypted_key) < self.MIN_BLOB_SIZE:
             raise ValueError("Invalid encrypted key format")
         
         try:
-            # Parse the encrypted blob: salt + nonce + ciphertext + auth_tag
-            salt = encrypted_key[:16]
-            nonce = encrypted_key[16:28]
-            ciphertext = encrypted_key[28:-16]
-            auth_tag = encrypted_key[-16:]
-            
-            # Reconstruct the encrypted data for AES-GCM
-            encrypted_data = ciphertext + auth_tag
-            
-            # Derive the same encryption key using Argon2
-            ph = PasswordHasher(
-                memory_cost=self.ARGON2_MEMORY,
-                time_cost=self.ARGON2_ITERATIONS,
-                parallelism=self.ARGON2_PARALLELISM,
-                hash_len=self.AES_KEY_SIZE,
-                salt_len=16
-            )
-            
-            # Hash the passphrase with the salt to get a deterministic key
-            hash_result = ph.hash(passphrase.encode('utf-8'), salt=salt)
-            # Extract the hash part (remove the encoded parameters)
-            encryption_key = hash_result.split('$')[-1].encode('utf-8')[:self.AES_KEY_SIZE]
-            
-            # Decrypt the private key using AES-GCM
-            aes_gcm = AESGCM(encryption_key)
-            decrypted_pem = aes_gcm.decrypt(nonce, encrypted_data, None)
+            # Decrypt with the Argon2 key for the blob's salt (cached per passphrase and salt),
+            # falling back to the legacy key for older blobs
+            decrypted_pem = self._unseal([encrypted_key], passphrase)[0]
             
             # Load the private key from PEM format
             private_key = serialization.load_pem_private_key(
@@ -216,7 +191,7 @@ class WalletManager:
             
         Raises:
             ValueError: If private key format is invalid
-            RuntimeError: If address generation fails
+            RuntimeError: If address generation fails or Keccak-256 is unavailable
         """
         try:
             # Convert hex string to bytes
@@ -242,10 +217,7 @@ class WalletManager:
             uncompressed_public_key = public_key_bytes[1:]
             
             # Calculate the Ethereum address (last 20 bytes of Keccak-256 hash)
-            from cryptography.hazmat.primitives import hashes
-            digest = hashes.Hash(hashes.SHA3_256(), backend=default_backend())
-            digest.update(uncompressed_public_key)
-            hash_bytes = digest.finalize()
+            hash_bytes = _keccak256(uncompressed_public_key)
             
             # Take the last 20 bytes for the address
             address_bytes = hash_bytes[-20:]
@@ -270,23 +242,22 @@ class WalletManager:
             
         Returns:
             Checksummed address
+            
+        Raises:
+            RuntimeError: If Keccak-256 is unavailable
         """
         # Remove 0x prefix
         address = address[2:].lower()
         
         # Calculate Keccak-256 hash
-        digest = hashes.Hash(hashes.SHA3_256(), backend=default_backend())
-        digest.update(address.encode('utf-8'))
-        hash_bytes = digest.finalize()
-        hash_hex = hash_bytes.hex()
+        hash_bytes = _keccak256(address.encode('ascii'))
         
-        # Apply checksum
-        checksummed = "0x"
-        for i, char in enumerate(address):
-            if char.isalpha() and int(hash_hex[i], 16) >= 8:
-                checksummed += char.upper()
-            else:
-                checksummed += char
+        # Apply checksum: uppercase each letter whose hash nibble is >= 8,
+        # read straight from the hash bytes (high nibble for even positions)
+        checksummed = "0x" + "".join(
+            char.upper() if char > '9' and (hash_bytes[i >> 1] << (4 * (i & 1))) & 0x80 else char
+            for i, char in enumerate(address)
+        )
         
         return checksummed
     
@@ -301,20 +272,21 @@ class WalletManager:
             True if the private key is valid, False otherwise
         """
         try:
-            # Check if it's a valid hex string
-            if not all(c in '0123456789abcdefABCDEF' for c in private_key_hex):
-                return False
-            
             # Check length (64 characters for 32 bytes)
             if len(private_key_hex) != 64:
                 return False
             
-            # Check if it's not zero or max value
-            private_key_int = int(private_key_hex, 16)
-            if private_key_int == 0 or private_key_int >= 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141:
+            # Check if it's a valid hex string; fromhex skips whitespace,
+            # so also require all 32 bytes
+            try:
+                private_key_bytes = bytes.fromhex(private_key_hex)
+            except ValueError:
+                return False
+            if len(private_key_bytes) != 32:
                 return False
             
-            return True
+            # Check the key is in the valid secp256k1 range [1, n - 1]
+            return 0 < int.from_bytes(private_key_bytes, 'big') < _SECP256K1_N
             
         except Exception:
             return False
@@ -334,22 +306,23 @@ class WalletManager:
             if not address.startswith('0x'):
                 return False
             
-            # Check if it's a valid hex string
-            if not all(c in '0123456789abcdefABCDEF' for c in address[2:]):
-                return False
-            
             # Check length (40 characters for 20 bytes)
             if len(address) != 42:
                 return False
             
-            return True
+            # Check if it's a valid hex string (whitespace would leave fewer bytes)
+            try:
+                return len(bytes.fromhex(address[2:])) == 20
+            except ValueError:
+                return False
             
         except Exception:
             return False
 
 
-# Global wallet manager instance
-wallet_manager = WalletManager()
+# Global wallet manager instance (production Argon2 cost unless a weaker
+# MEMBOT_KDF_PROFILE is explicitly allowed)
+wallet_manager = WalletManager.from_profile()
 
 
 def generate_and_encrypt_key(passphrase: str) -> bytes:
@@ -0,0 +1,258 @@
+"""
+Unit tests for the Axiom.trade MCP server.
+
+Tests cover the tool response envelopes and token serialization.
+"""
+
+import json
+import time
+import pytest
+from dataclasses import FrozenInstanceError, asdict
+from unittest.mock import patch
+
+from src.mcp import axiom_mcp_server
+from src.mcp.axiom_mcp_server import AxiomMCPServer, call_axiom_tool_sync
+
+
+class TestAxiomMCPServer:
+    """Test cases for AxiomMCPServer class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.server = AxiomMCPServer()
+
+    @pytest.mark.asyncio
+    async def test_trending_to_dict_matches_asdict(self):
+        """Test the hand-written to_dict stays in sync with the dataclass fields."""
+        trending_data = await self.server._fetch_trending_data(5, "1h")
+
+        assert trending_data.to_dict() == asdict(trending_data)
+
+    @pytest.mark.asyncio
+    async def test_tokens_are_immutable(self):
+        """Test token records are frozen so cached responses can be shared."""
+        token = await self.server._fetch_token_data("BONK")
+
+        with pytest.raises(FrozenInstanceError):
+            token.price = 1.0
+        assert not hasattr(token, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_get_trending_tokens_success(self):
+        """Test trending tokens response envelope."""
+        result = await self.server.get_trending_tokens(limit=3)
+
+        assert result["success"] is True
+        assert result["source"] == "axiom.trade"
+        assert result["data"]["total_tokens"] == 3
+        assert [t["symbol"] for t in result["data"]["tokens"]] == ["BONK", "WIF", "PEPE"]
+
+    @pytest.mark.asyncio
+    async def test_get_trending_tokens_stream_ndjson(self):
+        """Test the trending stream yields one JSON token per line."""
+        lines = [line async for line in self.server.get_trending_tokens_stream(limit=4)]
+
+        assert len(lines) == 4
+        assert all(line.endswith(b"\n") for line in lines)
+        assert [json.loads(line)["symbol"] for line in lines] == ["BONK", "WIF", "PEPE", "FARTCOIN"]
+
+    @pytest.mark.asyncio
+    async def test_get_trending_tokens_stream_ends_with_error_line(self):
+        """Test a failure mid-stream ends the NDJSON stream with an error envelope."""
+        tokens = self.server._generate_trending_tokens(2, "1h", 0.0)
+
+        def failing_tokens(limit, timeframe, now):
+            yield next(tokens)
+            raise RuntimeError("upstream closed")
+
+        with patch.object(self.server, "_generate_trending_tokens", side_effect=failing_tokens):
+            lines = [line async for line in self.server.get_trending_tokens_stream(limit=2)]
+
+        assert json.loads(lines[0])["symbol"] == "BONK"
+        assert json.loads(lines[1]) == {"success": False, "error": "upstream closed", "timestamp": pytest.approx(time.time(), abs=5)}
+        assert self.server._fetch_semaphore._value == self.server.max_concurrent_fetches
+
+    @pytest.mark.asyncio
+    async def test_get_token_data_success(self):
+        """Test single token response envelope."""
+        result = await self.server.get_token_data("BONK")
+
+        assert result["success"] is True
+        assert result["data"]["symbol"] == "BONK"
+        assert result["data"]["price"] == 0.000034
+
+    @pytest.mark.asyncio
+    async def test_call_tool_unknown(self):
+        """Test calling an unknown tool returns an error envelope."""
+        result = await self.server.call_tool("does_not_exist", {})
+
+        assert result["success"] is False
+        assert "Unknown tool" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_call_tool_raw_returns_json_bytes(self):
+        """Test raw tool calls return compact JSON bytes."""
+        result = await self.server.call_tool("get_token_data", {"symbol": "WIF"}, raw=True)
+
+        assert isinstance(result, bytes)
+        payload = json.loads(result)
+        assert payload["success"] is True
+        assert payload["data"]["symbol"] == "WIF"
+        assert b", " not in result
+
+
+    def test_get_tools_schema_is_shared(self):
+        """Test the tool schema is built once and shared across servers."""
+        schema = self.server.get_tools()
+
+        assert [tool["name"] for tool in schema["tools"]] == [
+            "get_trending_tokens", "get_token_data", "get_market_overview",
+            "search_tokens", "get_dex_data", "monitor_token"
+        ]
+        assert AxiomMCPServer().get_tools() is schema
+
+
+    @pytest.mark.asyncio
+    async def test_call_tool_caches_within_ttl(self):
+        """Test repeated tool calls are served from the cache."""
+        first = await self.server.call_tool("get_trending_tokens", {"limit": 3})
+        second = await self.server.call_tool("get_trending_tokens", {"limit": 3})
+        other = await self.server.call_tool("get_trending_tokens", {"limit": 2})
+
+        assert second == first
+        assert other != first
+        assert other["data"]["total_tokens"] == 2
+
+    @pytest.mark.asyncio
+    async def test_call_tool_cache_expires(self):
+        """Test cached responses are refetched once their TTL elapses."""
+        await self.server.call_tool("get_token_data", {"symbol": "BONK"})
+        key = self.server._cache_key("get_token_data", {"symbol": "BONK"})
+        self.server.cache[key] = (0.0, self.server.cache[key][1])
+
+        with patch.object(self.server, "_invoke", wraps=self.server._invoke) as invoke:
+            await self.server.call_tool("get_token_data", {"symbol": "BONK"})
+
+        invoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_responses_are_not_shared(self):
+        """Test mutating a cached response leaves later cache hits unchanged."""
+        first = await self.server.call_tool("get_trending_tokens", {"limit": 3})
+        first["data"]["tokens"][0]["symbol"] = "RUG"
+
+        second = await self.server.call_tool("get_trending_tokens", {"limit": 3})
+        raw = await self.server.call_tool("get_trending_tokens", {"limit": 3}, raw=True)
+
+        assert second["data"]["tokens"][0]["symbol"] == "BONK"
+        assert json.loads(raw) == second
+
+    @pytest.mark.asyncio
+    async def test_monitor_token_cache_is_keyed_by_duration(self):
+        """Test monitoring runs are only reused for the same symbol and duration."""
+        long_run = await self.server.call_tool("monitor_token", {"symbol": "BONK", "duration": 300})
+        default_run = await self.server.call_tool("monitor_token", {"symbol": "BONK"})
+        short_run = await self.server.call_tool("monitor_token", {"symbol": "BONK", "duration": 20})
+
+        assert default_run == long_run
+        assert short_run != long_run
+        assert short_run["data"]["duration"] == 20
+        assert len(short_run["data"]["price_history"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_entries_and_locks_are_evicted(self):
+        """Test a cache miss sweeps expired responses and their fetch locks."""
+        await self.server.call_tool("get_token_data", {"symbol": "BONK"})
+        stale_key = self.server._cache_key("get_token_data", {"symbol": "BONK"})
+        self.server.cache[stale_key] = (0.0, self.server.cache[stale_key][1])
+        self.server._next_cache_sweep = 0.0
+
+        await self.server.call_tool("get_token_data", {"symbol": "WIF"})
+
+        assert stale_key not in self.server.cache
+        assert stale_key not in self.server._cache_locks
+        assert list(self.server._cache_locks) == list(self.server.cache)
+
+
+    @pytest.mark.asyncio
+    async def test_market_overview_is_fresh_copy(self):
+        """Test the overview payload is a fresh dict stamped per call."""
+        result = await self.server.get_market_overview()
+        result["data"]["total_tokens"] = 0
+        result["data"]["top_gainers"][0]["symbol"] = "RUG"
+
+        again = await self.server.get_market_overview()
+
+        assert again["data"]["total_tokens"] == 1250
+        assert again["data"]["last_updated"] == again["timestamp"]
+        assert json.loads(json.dumps(again))["data"]["top_gainers"][0]["symbol"] == "BONK"
+
+    @pytest.mark.asyncio
+    async def test_get_dex_data_keeps_requested_dex(self):
+        """Test the DEX payload carries the requested DEX name first."""
+        result = await self.server.get_dex_data("Orca")
+
+        assert list(result["data"])[0] == "dex"
+        assert result["data"]["dex"] == "Orca"
+
+    @pytest.mark.asyncio
+    async def test_get_dex_data_entries_are_not_shared(self):
+        """Test mutating returned DEX pairs leaves later responses unchanged."""
+        result = await self.server.get_dex_data()
+        result["data"]["top_pairs"][0]["volume"] = 0
+
+        again = await self.server.get_dex_data()
+
+        assert again["data"]["top_pairs"][0]["volume"] == 2500000
+
+
+    @pytest.mark.asyncio
+    async def test_monitor_token_history_shape(self):
+        """Test monitoring history is spaced 10s apart and compounds price changes."""
+        result = await self.server.monitor_token("BONK", duration=100)
+        price_history = result["data"]["price_history"]
+
+        assert len(price_history) == 10
+        assert len(result["data"]["volume_history"]) == 10
+        assert price_history[1]["timestamp"] - price_history[0]["timestamp"] == pytest.approx(10)
+        assert price_history[1]["price"] == pytest.approx(
+            price_history[0]["price"] * (1 + price_history[1]["change"])
+        )
+
+
+    @pytest.mark.asyncio
+    async def test_search_tokens_matches_case_insensitively(self):
+        """Test search matches indexed keywords anywhere in the query."""
+        result = await self.server.search_tokens("Bonk vs WIF")
+        limited = await self.server.search_tokens("bonk wif", limit=1)
+        empty = await self.server.search_tokens("pepe")
+
+        assert [r["symbol"] for r in result["data"]["results"]] == ["BONK", "WIF"]
+        assert limited["data"]["total_results"] == 2
+        assert len(limited["data"]["results"]) == 1
+        assert empty["data"]["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_results_are_copies(self):
+        """Test mutating a search result does not change the search index."""
+        result = await self.server.search_tokens("bonk")
+        result["data"]["results"][0]["price"] = 0
+
+        again = await self.server.search_tokens("bonk")
+
+        assert again["data"]["results"][0]["price"] == 0.000034
+
+
+class TestCallAxiomToolSync:
+    """Test cases for the synchronous Axiom tool wrapper."""
+
+    def test_sync_calls_reuse_server_session(self):
+        """Test repeated sync calls share one server and one open session."""
+        first = call_axiom_tool_sync("get_token_data", {"symbol": "BONK"})
+        session = axiom_mcp_server._axiom_server.session
+        second = call_axiom_tool_sync("get_trending_tokens", {"limit": 2})
+
+        assert first["success"] is True
+        assert second["data"]["total_tokens"] == 2
+        assert axiom_mcp_server._axiom_server.session is session
+        assert not session.closed
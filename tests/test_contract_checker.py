@@ -4,11 +4,88 @@ Unit tests for the contract checker module.
 This module tests the Kraken compliance layer and contract safety checks.
 """
 
+import asyncio
+import time
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from src.security.contract_checker import KrakenAuditLayer, ComplianceScore, ComplianceLevel, TokenAnalysis, VetoReason
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from src.security import contract_checker
+from src.security.contract_checker import (
+    KrakenAuditLayer, ComplianceScore, ComplianceLevel, RpcRateLimiter, TokenAnalysis, TokenAnalysisBatch,
+    VetoReason
+)
 from src.config import MLConfig
 
+# Runtime bytecode of the OpenZeppelin ERC20 built with solc 0.7.6: an ordinary token
+# that pushes the Approval event topic and no mint selector
+OZ_ERC20_RUNTIME = (
+    "0x608060405234801561001057600080fd5b50600436106100a95760003560e01c8063395093511161007157806339509351"
+    "146101d957806370a082311461020557806395d89b411461022b578063a457c2d714610233578063a9059cbb1461025f5780"
+    "63dd62ed3e1461028b576100a9565b806306fdde03146100ae578063095ea7b31461012b57806318160ddd1461016b578063"
+    "23b872dd14610185578063313ce567146101bb575b600080fd5b6100b66102b9565b60408051602080825283518183015283"
+    "51919283929083019185019080838360005b838110156100f05781810151838201526020016100d8565b5050505090509081"
+    "0190601f16801561011d5780820380516001836020036101000a031916815260200191505b509250505060405180910390f3"
+    "5b6101576004803603604081101561014157600080fd5b506001600160a01b03813516906020013561034f565b6040805191"
+    "15158252519081900360200190f35b61017361036c565b60408051918252519081900360200190f35b610157600480360360"
+    "6081101561019b57600080fd5b506001600160a01b03813581169160208101359091169060400135610372565b6101c36103"
+    "f9565b6040805160ff9092168252519081900360200190f35b610157600480360360408110156101ef57600080fd5b506001"
+    "600160a01b038135169060200135610402565b6101736004803603602081101561021b57600080fd5b50356001600160a01b"
+    "0316610450565b6100b661046b565b6101576004803603604081101561024957600080fd5b506001600160a01b0381351690"
+    "602001356104cc565b6101576004803603604081101561027557600080fd5b506001600160a01b0381351690602001356105"
+    "34565b610173600480360360408110156102a157600080fd5b506001600160a01b0381358116916020013516610548565b60"
+    "038054604080516020601f600260001961010060018816150201909516949094049384018190048102820181019092528281"
+    "52606093909290918301828280156103455780601f1061031a57610100808354040283529160200191610345565b82019190"
+    "6000526020600020905b81548152906001019060200180831161032857829003601f168201915b5050505050905090565b60"
+    "0061036361035c610573565b8484610577565b50600192915050565b60025490565b600061037f848484610663565b6103ef"
+    "8461038b610573565b6103ea85604051806060016040528060288152602001610927602891396001600160a01b038a166000"
+    "908152600160205260408120906103c9610573565b6001600160a01b03168152602081019190915260400160002054919061"
+    "07be565b610577565b5060019392505050565b60055460ff1690565b600061036361040f610573565b846103ea8560016000"
+    "610420610573565b6001600160a01b03908116825260208083019390935260409182016000908120918c1681529252902054"
+    "90610855565b6001600160a01b031660009081526020819052604090205490565b60048054604080516020601f6002600019"
+    "6101006001881615020190951694909404938401819004810282018101909252828152606093909290918301828280156103"
+    "455780601f1061031a57610100808354040283529160200191610345565b60006103636104d9610573565b846103ea856040"
+    "518060600160405280602581526020016109986025913960016000610503610573565b6001600160a01b0390811682526020"
+    "8083019390935260409182016000908120918d168152925290205491906107be565b6000610363610541610573565b848461"
+    "0663565b6001600160a01b03918216600090815260016020908152604080832093909416825291909152205490565b339056"
+    "5b6001600160a01b0383166105bc5760405162461bcd60e51b81526004018080602001828103825260248152602001806109"
+    "746024913960400191505060405180910390fd5b6001600160a01b0382166106015760405162461bcd60e51b815260040180"
+    "80602001828103825260228152602001806108df6022913960400191505060405180910390fd5b6001600160a01b03808416"
+    "600081815260016020908152604080832094871680845294825291829020859055815185815291517f8c5be1e5ebec7d5bd1"
+    "4f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b9259281900390910190a3505050565b6001600160a01b0383166106a8"
+    "5760405162461bcd60e51b815260040180806020018281038252602581526020018061094f60259139604001915050604051"
+    "80910390fd5b6001600160a01b0382166106ed5760405162461bcd60e51b8152600401808060200182810382526023815260"
+    "2001806108bc6023913960400191505060405180910390fd5b6106f88383836108b6565b6107358160405180606001604052"
+    "8060268152602001610901602691396001600160a01b03861660009081526020819052604090205491906107be565b600160"
+    "0160a01b0380851660009081526020819052604080822093909355908416815220546107649082610855565b6001600160a0"
+    "1b038084166000818152602081815260409182902094909455805185815290519193928716927fddf252ad1be2c89b69c2b0"
+    "68fc378daa952ba7f163c4a11628f55a4df523b3ef92918290030190a3505050565b6000818484111561084d576040516246"
+    "1bcd60e51b81526004018080602001828103825283818151815260200191508051906020019080838360005b838110156108"
+    "125781810151838201526020016107fa565b50505050905090810190601f16801561083f5780820380516001836020036101"
+    "000a031916815260200191505b509250505060405180910390fd5b505050900390565b6000828201838110156108af576040"
+    "805162461bcd60e51b815260206004820152601b60248201527f536166654d6174683a206164646974696f6e206f76657266"
+    "6c6f770000000000604482015290519081900360640190fd5b9392505050565b50505056fe45524332303a207472616e7366"
+    "657220746f20746865207a65726f206164647265737345524332303a20617070726f766520746f20746865207a65726f2061"
+    "64647265737345524332303a207472616e7366657220616d6f756e7420657863656564732062616c616e636545524332303a"
+    "207472616e7366657220616d6f756e74206578636565647320616c6c6f77616e636545524332303a207472616e7366657220"
+    "66726f6d20746865207a65726f206164647265737345524332303a20617070726f76652066726f6d20746865207a65726f20"
+    "6164647265737345524332303a2064656372656173656420616c6c6f77616e63652062656c6f77207a65726fa164736f6c63"
+    "43000706000a"
+)
+TEST_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def make_analysis(*, address=TEST_ADDRESS, chain="ethereum", score=95.0, veto_reasons=(), warnings=(),
+                  timestamp=1234567890):
+    """Build a token analysis whose component scores all equal score."""
+    return TokenAnalysis(
+        token_address=address,
+        chain=chain,
+        analysis_timestamp=timestamp,
+        compliance_score=ComplianceScore(score, score, score, score, score, score,
+                                         list(veto_reasons), list(warnings), {}),
+        token_info={},
+        audit_trail=[]
+    )
+
 
 class TestKrakenAuditLayer:
     """Test cases for KrakenAuditLayer class."""
@@ -16,7 +93,7 @@ class TestKrakenAuditLayer:
     def setup_method(self):
         """Set up test fixtures."""
         self.audit_layer = KrakenAuditLayer()
-        self.test_address = "0x1234567890123456789012345678901234567890"
+        self.test_address = TEST_ADDRESS
     
     @pytest.mark.asyncio
     async def test_analyze_token_ethereum(self):
@@ -160,6 +237,15 @@ class TestKrakenAuditLayer:
         level = self.audit_layer.get_compliance_level(score)
         assert level == ComplianceLevel.FAILED
     
+    def test_get_compliance_level_boundaries(self):
+        """Test each threshold score belongs to the higher level."""
+        assert self.audit_layer.get_compliance_level(90.0) == ComplianceLevel.EXCELLENT
+        assert self.audit_layer.get_compliance_level(89.99) == ComplianceLevel.GOOD
+        assert self.audit_layer.get_compliance_level(80) == ComplianceLevel.GOOD
+        assert self.audit_layer.get_compliance_level(70) == ComplianceLevel.MODERATE
+        assert self.audit_layer.get_compliance_level(60) == ComplianceLevel.POOR
+        assert self.audit_layer.get_compliance_level(59.9) == ComplianceLevel.FAILED
+    
     def test_get_position_size_multiplier_high_score(self):
         """Test position size multiplier for high compliance score."""
         analysis = TokenAnalysis(
@@ -207,6 +293,614 @@ class TestKrakenAuditLayer:
         
         multiplier = self.audit_layer.get_position_size_multiplier(analysis)
         assert multiplier == MLConfig.UNLISTED_SIZE_MULTIPLIER  # Reduced position size for low compliance
+    
+    def test_score_analyses_matches_per_token_helpers(self):
+        """Test the batch scoring path agrees with the per-analysis helpers."""
+        analyses = [
+            make_analysis(),
+            make_analysis(score=75.0),
+            make_analysis(score=50.0),
+            make_analysis(veto_reasons=[VetoReason.HIDDEN_MINT]),
+            make_analysis(warnings=["Mint authority is active"]),
+        ]
+        
+        compliant, size_multipliers, ml_multipliers = self.audit_layer.score_analyses(analyses)
+        
+        assert compliant.tolist() == [self.audit_layer.is_token_compliant(a) for a in analyses]
+        assert size_multipliers.tolist() == [self.audit_layer.get_position_size_multiplier(a) for a in analyses]
+        assert ml_multipliers.tolist() == [self.audit_layer.get_ml_weight_multiplier(a) for a in analyses]
+        assert compliant.tolist() == [True, True, False, False, False]
+    
+    def test_compliance_score_derives_masks(self):
+        """Test veto reasons and critical warnings are packed into bitmasks on construction."""
+        score = ComplianceScore(95.0, 95.0, 95.0, 95.0, 95.0, 95.0,
+                                [VetoReason.HIDDEN_MINT, VetoReason.NO_SOCIAL_PRESENCE],
+                                ["Low liquidity", "Transfer blocking detected"], {})
+        clean = ComplianceScore(95.0, 95.0, 95.0, 95.0, 95.0, 95.0, [], ["Low liquidity"], {})
+        
+        assert score.veto_mask == VetoReason.HIDDEN_MINT | VetoReason.NO_SOCIAL_PRESENCE
+        assert VetoReason.NO_SOCIAL_PRESENCE in score.veto_mask
+        assert score.critical_mask == 1 << 1
+        assert (clean.veto_mask, clean.critical_mask) == (0, 0)
+        assert score == ComplianceScore(95.0, 95.0, 95.0, 95.0, 95.0, 95.0,
+                                        [VetoReason.HIDDEN_MINT, VetoReason.NO_SOCIAL_PRESENCE],
+                                        ["Low liquidity", "Transfer blocking detected"], {})
+    
+    def test_token_analysis_batch_packs_masks(self):
+        """Test analyses pack into parallel score, veto and warning arrays."""
+        batch = TokenAnalysisBatch.from_analyses([
+            make_analysis(address="a", chain="solana", score=90.0, warnings=["Low liquidity"]),
+            make_analysis(address="b", chain="solana", score=40.0,
+                          veto_reasons=[VetoReason.MINT_AUTHORITY_ACTIVE, VetoReason.FREEZE_AUTHORITY_ACTIVE],
+                          warnings=["Mint authority is active; Freeze authority is active"]),
+        ])
+        
+        assert batch.addresses == ["a", "b"]
+        assert batch.overall_scores.tolist() == [90.0, 40.0]
+        assert batch.veto_mask.tolist() == [0, VetoReason.MINT_AUTHORITY_ACTIVE | VetoReason.FREEZE_AUTHORITY_ACTIVE]
+        assert batch.warning_mask.tolist() == [0, (1 << 3) | (1 << 4)]
+        assert self.audit_layer.is_batch_compliant(batch).tolist() == [True, False]
+    
+    def test_token_analysis_batch_clamps_negative_scores(self):
+        """Test packed scores are clamped at zero in place."""
+        analysis = TokenAnalysis(
+            token_address="a",
+            chain="ethereum",
+            analysis_timestamp=1234567890,
+            compliance_score=ComplianceScore(-12.5, 0.0, 0.0, 0.0, 0.0, 0.0, [], [], {}),
+            token_info={},
+            audit_trail=[]
+        )
+        
+        batch = TokenAnalysisBatch.from_analyses([analysis, analysis])
+        
+        assert batch.overall_scores.tolist() == [0.0, 0.0]
+    
+    @pytest.mark.asyncio
+    async def test_analyze_evm_bytecode_matches_each_rule_once(self):
+        """Test bytecode rules are matched without the 0x prefix and applied once."""
+        bytecode = "0x6000" + "6340c10f19" * 3 + "638da5cb5b" + "00"
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data=bytecode))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        result = await audit_layer._analyze_evm_bytecode(self.test_address, [])
+        
+        assert result["score"] == 70.0
+        assert result["veto_reasons"] == [VetoReason.HIDDEN_MINT]
+        assert result["warnings"] == ["Hidden mint function detected"]
+        assert result["metadata"]["bytecode_length"] == 23
+    
+    @pytest.mark.asyncio
+    async def test_analyze_evm_bytecode_flags_dispatched_owner_controls(self):
+        """Test blacklist and fee setter selectors veto once per rule when dispatched."""
+        bytecode = "0x" + "63f9f92be4" + "63b515566a" + "63061c82d0" + "63ec28438a" + "638da5cb5b"
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data=bytecode))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        result = await audit_layer._analyze_evm_bytecode(self.test_address, [])
+        
+        assert result["score"] == 65.0
+        assert result["veto_reasons"] == [VetoReason.TRANSFER_BLOCKING, VetoReason.EXCESSIVE_OWNER_POWERS]
+        assert result["warnings"] == ["Transfer blocking detected", "Excessive owner powers detected"]
+    
+    @pytest.mark.asyncio
+    async def test_analyze_evm_bytecode_ignores_selectors_outside_dispatch(self):
+        """Test selector bytes only match when pushed by PUSH4."""
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data="0x7f" + "40c10f19" * 8))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        result = await audit_layer._analyze_evm_bytecode(self.test_address, [])
+        
+        assert result["veto_reasons"] == []
+    
+    @pytest.mark.asyncio
+    async def test_analyze_evm_bytecode_passes_openzeppelin_erc20(self):
+        """Test a standard OpenZeppelin ERC-20 gets no bytecode veto."""
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data=OZ_ERC20_RUNTIME))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        result = await audit_layer._analyze_evm_bytecode(self.test_address, [])
+        
+        assert result["score"] == 100.0
+        assert result["veto_reasons"] == []
+        assert result["warnings"] == []
+    
+    @pytest.mark.asyncio
+    async def test_analyze_evm_bytecode_rpc_failure_is_audited(self):
+        """Test a failed bytecode fetch vetoes the token and records a timed audit entry."""
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=False, data=None))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        audit_trail = []
+        
+        result = await audit_layer._analyze_evm_bytecode(self.test_address, audit_trail)
+        
+        assert result["veto_reasons"] == [VetoReason.BYTECODE_SUSPICIOUS]
+        (entry,) = audit_trail
+        assert entry["step"] == "bytecode_analysis"
+        assert entry["result"] == "failed"
+        assert entry["veto_reasons"] == [VetoReason.BYTECODE_SUSPICIOUS]
+        assert entry["started_at"] <= entry["finished_at"]
+    
+    @pytest.mark.asyncio
+    async def test_analyze_solana_token_program_invalid_account_is_audited(self):
+        """Test an empty mint account vetoes the token and records a timed audit entry."""
+        solana_rpc_connector = Mock()
+        solana_rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data={"value": None}))
+        audit_layer = KrakenAuditLayer(solana_rpc_connector=solana_rpc_connector)
+        audit_trail = []
+        
+        result = await audit_layer._analyze_solana_token_program("mint", audit_trail)
+        
+        assert result["warnings"] == ["Invalid mint account"]
+        assert [(entry["step"], entry["result"], entry["veto_reasons"]) for entry in audit_trail] == [
+            ("token_program_analysis", "failed", [VetoReason.MINT_AUTHORITY_ACTIVE])
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_analyze_evm_bytecode_ignores_nibble_misaligned_selectors(self):
+        """Test selectors only match on byte boundaries of the decoded bytecode."""
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data="0x0" + "6340c10f19" + "0"))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        result = await audit_layer._analyze_evm_bytecode(self.test_address, [])
+        
+        assert result["score"] == 100.0
+        assert result["veto_reasons"] == []
+    
+    @pytest.mark.asyncio
+    async def test_get_evm_token_info_falls_back_to_batch(self):
+        """Test ERC-20 metadata falls back to one JSON-RPC batch without Multicall3."""
+        symbol_data = "0x" + "20".zfill(64) + "3".zfill(64) + b"TST".hex().ljust(64, "0")
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=False, data=None))
+        rpc_connector.make_batch = AsyncMock(return_value=[
+            Mock(success=False, data=None),
+            Mock(success=True, data=symbol_data),
+            Mock(success=True, data="0x12"),
+            Mock(success=True, data="0x3e8"),
+        ])
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        info = await audit_layer._get_evm_token_info(self.test_address)
+        
+        rpc_connector.make_batch.assert_awaited_once()
+        rpc_connector.make_request.assert_awaited_once()
+        assert [call["id"] for call in rpc_connector.make_batch.await_args.args[0]] == [0, 1, 2, 3]
+        assert info["name"] == "Unknown"
+        assert info["symbol"] == "TST"
+        assert info["decimals"] == 18
+        assert info["total_supply"] == 1000
+    
+    @pytest.mark.asyncio
+    async def test_get_token_info_is_cached_until_supply_expires(self):
+        """Test token info is served from cache and refetched once the supply TTL lapses."""
+        info = {"name": "Test", "symbol": "TST", "decimals": 18, "total_supply": 1}
+        
+        with patch.object(self.audit_layer, '_get_evm_token_info', return_value=info) as mock_info:
+            first = await self.audit_layer._get_token_info(self.test_address, "ethereum")
+            second = await self.audit_layer._get_token_info(self.test_address, "ethereum")
+            first["symbol"] = "MUTATED"
+            
+            key = f"ethereum:{self.test_address}"
+            meta_expiry, _, cached = self.audit_layer._token_info_cache[key]
+            self.audit_layer._token_info_cache[key] = (meta_expiry, 0.0, cached)
+            third = await self.audit_layer._get_token_info(self.test_address, "ethereum")
+        
+        assert mock_info.await_count == 2
+        assert mock_info.await_args.kwargs["fields"] == ("total_supply",)
+        assert second == info
+        assert third["symbol"] == "TST"
+    
+    @pytest.mark.asyncio
+    async def test_get_token_info_does_not_cache_defaulted_fields(self):
+        """Test fields that fell back to a default are refetched on the next call."""
+        responses = [
+            {"name": "Test", "symbol": "TST", "total_supply": 1},
+            {"decimals": 6},
+        ]
+        
+        with patch.object(self.audit_layer, '_get_evm_token_info', side_effect=responses) as mock_info:
+            first = await self.audit_layer._get_token_info(self.test_address, "ethereum")
+            second = await self.audit_layer._get_token_info(self.test_address, "ethereum")
+            third = await self.audit_layer._get_token_info(self.test_address, "ethereum")
+        
+        assert first["decimals"] == 18
+        assert mock_info.await_args_list[0].kwargs["fill_defaults"] is False
+        assert mock_info.await_args_list[1].kwargs["fields"] == ("decimals",)
+        assert second["decimals"] == 6 and second["symbol"] == "TST"
+        assert third == second
+        assert mock_info.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_solana_token_info_cache_hit_skips_rpc(self):
+        """Test cached SPL mint info is reused without refetching the off-chain name and symbol."""
+        solana_rpc_connector = Mock()
+        solana_rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data={"value": {"data": {
+            "parsed": {"info": {"mintAuthority": None, "freezeAuthority": None, "supply": "1000", "decimals": 6}}
+        }}}))
+        audit_layer = KrakenAuditLayer(solana_rpc_connector=solana_rpc_connector)
+        
+        infos = [await audit_layer._token_info_step("Mint111", "solana", []) for _ in range(3)]
+        
+        solana_rpc_connector.make_request.assert_awaited_once()
+        assert infos[0] == infos[2]
+        assert infos[2]["total_supply"] == 1000
+        assert (infos[2]["name"], infos[2]["symbol"], infos[2]["decimals"]) == ("Unknown Token", "UNK", 6)
+    
+    @pytest.mark.asyncio
+    async def test_get_token_info_fetches_only_requested_fields(self):
+        """Test a field subset is fetched and returned alone, and later calls fetch only the rest."""
+        responses = [
+            {"address": self.test_address, "chain": "ethereum", "name": "Test", "symbol": "TST", "decimals": 18},
+            {"address": self.test_address, "chain": "ethereum", "total_supply": 1},
+        ]
+        
+        with patch.object(self.audit_layer, '_get_evm_token_info', side_effect=responses) as mock_info:
+            audit_info = await self.audit_layer._get_token_info(
+                self.test_address, "ethereum", fields=("name", "symbol", "decimals")
+            )
+            full_info = await self.audit_layer._get_token_info(self.test_address, "ethereum")
+        
+        assert [call.kwargs["fields"] for call in mock_info.await_args_list] == [
+            ("name", "symbol", "decimals"), ("total_supply",)
+        ]
+        assert "total_supply" not in audit_info
+        assert full_info == {**audit_info, "total_supply": 1}
+    
+    @pytest.mark.asyncio
+    async def test_get_evm_token_info_fetches_only_requested_fields(self):
+        """Test only the requested ERC-20 getters are called and returned."""
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=False, data=None))
+        rpc_connector.make_batch = AsyncMock(return_value=[Mock(success=True, data="0x3e8")])
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        info = await audit_layer._get_evm_token_info(self.test_address, fields=("total_supply",))
+        
+        calls = rpc_connector.make_batch.await_args.args[0]
+        assert [call["params"][0]["data"] for call in calls] == ["0x18160ddd"]
+        assert info == {"address": self.test_address, "chain": "ethereum", "total_supply": 1000}
+    
+    def test_is_token_compliant_rejects_critical_warnings(self):
+        """Test a critical warning anywhere in a warning string blocks compliance."""
+        assert self.audit_layer.is_token_compliant(make_analysis(warnings=["Unusual decimals: 24"])) is True
+        assert self.audit_layer.is_token_compliant(make_analysis(warnings=["Note: Freeze authority is active (legacy)"])) is False
+    
+    def test_decode_uint_words(self):
+        """Test uint decoding of full ABI words and short hex values."""
+        supply = 10 ** 27
+        
+        assert contract_checker._decode_uint("0x" + supply.to_bytes(32, "big").hex()) == supply
+        assert contract_checker._decode_uint("0x" + (18).to_bytes(32, "big").hex()) == 18
+        assert contract_checker._decode_uint("0x3e8") == 1000
+    
+    def test_decode_string_response(self):
+        """Test ABI-encoded strings decode and malformed payloads fall back to Unknown."""
+        encoded = "0x" + "20".zfill(64) + "5".zfill(64) + b"Hello".hex().ljust(64, "0")
+        
+        assert self.audit_layer._decode_string_response(encoded) == "Hello"
+        assert self.audit_layer._decode_string_response("0x") == "Unknown"
+        assert self.audit_layer._decode_string_response("0x" + "20".zfill(64)) == "Unknown"
+        assert self.audit_layer._decode_string_response("0xzz") == "Unknown"
+    
+    @pytest.mark.asyncio
+    async def test_rpc_batch_disabled_sends_concurrent_calls(self):
+        """Test disabling JSON-RPC batching falls back to individual calls."""
+        rpc_connector = Mock()
+        rpc_connector.make_batch = AsyncMock()
+        rpc_connector.make_request = AsyncMock(side_effect=lambda method, params: params[0])
+        self.audit_layer.rpc_batch_enabled = False
+        
+        responses = await self.audit_layer._rpc_batch(rpc_connector, [("eth_call", ["a"]), ("eth_call", ["b"])])
+        
+        assert responses == ["a", "b"]
+        rpc_connector.make_batch.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_paces_after_burst(self):
+        """Test the token bucket lets a burst through and then waits for refill."""
+        limiter = RpcRateLimiter(rate=50.0, burst=2)
+        
+        start = time.monotonic()
+        async with limiter:
+            pass
+        async with limiter:
+            pass
+        burst_elapsed = time.monotonic() - start
+        async with limiter:
+            pass
+        
+        assert burst_elapsed < 0.015
+        assert time.monotonic() - start >= 0.015
+    
+    @pytest.mark.asyncio
+    async def test_rpc_batch_draws_one_token_per_call(self):
+        """Test a JSON-RPC batch is charged against the limiter per call."""
+        rpc_connector = Mock()
+        rpc_connector.make_batch = AsyncMock(return_value=[])
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        audit_layer.rpc_limiter = Mock(acquire=AsyncMock())
+        
+        await audit_layer._rpc_batch(rpc_connector, [("eth_call", ["a"]), ("eth_call", ["b"]), ("eth_call", ["c"])])
+        
+        audit_layer.rpc_limiter.acquire.assert_awaited_once_with(3)
+    
+    @pytest.mark.asyncio
+    async def test_get_evm_token_info_tolerates_single_call_failure(self):
+        """Test one raising eth_call only defaults its own field on the concurrent path."""
+        responses = {
+            "0x06fdde03": RuntimeError("timeout"),
+            "0x95d89b41": Mock(success=False, data=None),
+            "0x313ce567": Mock(success=True, data="0x9"),
+            "0x18160ddd": Mock(success=True, data="0x64"),
+        }
+        
+        async def make_request(method, params):
+            call = params[0]
+            if call["to"] == contract_checker._MULTICALL3_ADDRESS:
+                return Mock(success=False, data=None)
+            response = responses[call["data"]]
+            if isinstance(response, Exception):
+                raise response
+            return response
+        
+        rpc_connector = Mock(spec=["make_request"])
+        rpc_connector.make_request = AsyncMock(side_effect=make_request)
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        info = await audit_layer._get_evm_token_info(self.test_address)
+        
+        assert (info["name"], info["symbol"], info["decimals"], info["total_supply"]) == ("Unknown", "UNK", 9, 100)
+    
+    @pytest.mark.asyncio
+    async def test_get_evm_token_info_uses_multicall(self):
+        """Test ERC-20 metadata is fetched with a single Multicall3 eth_call."""
+        def word(value):
+            return value.to_bytes(32, "big")
+        
+        def encode_results(results):
+            heads, tails, offset = [], [], len(results) * 32
+            for success, data in results:
+                tail = word(int(success)) + word(64) + word(len(data)) + data.ljust(-(-len(data) // 32) * 32, b"\0")
+                heads.append(word(offset))
+                tails.append(tail)
+                offset += len(tail)
+            return "0x" + (word(32) + word(len(results)) + b"".join(heads) + b"".join(tails)).hex()
+        
+        symbol_abi = word(32) + word(3) + b"TST".ljust(32, b"\0")
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data=encode_results([
+            (False, b""), (True, symbol_abi), (True, word(6)), (True, word(1000))
+        ])))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        
+        info = await audit_layer._get_evm_token_info(self.test_address)
+        
+        call = rpc_connector.make_request.await_args.args[1][0]
+        assert call["to"] == contract_checker._MULTICALL3_ADDRESS
+        assert call["data"].startswith("0x82ad56cb")
+        assert call["data"].count(self.test_address[2:]) == 4
+        assert (info["name"], info["symbol"], info["decimals"], info["total_supply"]) == ("Unknown", "TST", 6, 1000)
+    
+    def test_analysis_cache_is_bounded_lru(self):
+        """Test the analysis cache evicts least recently used and expired entries."""
+        self.audit_layer.cache_max_size = 2
+        
+        now = time.time()
+        self.audit_layer._cache_put("ethereum:a", make_analysis(address="a", timestamp=now))
+        self.audit_layer._cache_put("ethereum:b", make_analysis(address="b", timestamp=now))
+        assert self.audit_layer._cache_get("ethereum:a") is not None
+        self.audit_layer._cache_put("ethereum:c", make_analysis(address="c", timestamp=now))
+        
+        assert list(self.audit_layer.analysis_cache) == ["ethereum:a", "ethereum:c"]
+        
+        self.audit_layer._cache_put("ethereum:d", make_analysis(address="d", timestamp=now - self.audit_layer.cache_ttl))
+        assert self.audit_layer._cache_get("ethereum:d") is None
+        assert "ethereum:d" not in self.audit_layer.analysis_cache
+    
+    @pytest.mark.asyncio
+    async def test_shared_cache_serves_other_workers(self):
+        """Test an analysis stored in the shared cache is reused by another instance."""
+        redis_client = Mock()
+        store = {}
+        redis_client.get = AsyncMock(side_effect=store.get)
+        redis_client.set = AsyncMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value))
+        score = ComplianceScore(
+            overall_score=85.0,
+            bytecode_safety=85.0,
+            liquidity_analysis=100.0,
+            holder_distribution=100.0,
+            social_verification=100.0,
+            external_tool_score=100.0,
+            veto_reasons=[VetoReason.EXCESSIVE_OWNER_POWERS],
+            warnings=["Excessive owner powers detected"],
+            metadata={}
+        )
+        
+        producer = KrakenAuditLayer(redis_client=redis_client)
+        with patch.object(producer, '_get_token_info', return_value={"symbol": "TST"}):
+            with patch.object(producer, '_analyze_evm_token', return_value=score):
+                await producer.analyze_token(self.test_address, "ethereum")
+        
+        consumer = KrakenAuditLayer(redis_client=redis_client)
+        second = await consumer.analyze_token(self.test_address, "ethereum")
+        
+        assert redis_client.set.await_args.kwargs["ex"] == consumer.cache_ttl
+        assert second.compliance_score == score
+        assert second.token_info == {"symbol": "TST"}
+        assert f"ethereum:{self.test_address}" in consumer.analysis_cache
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_shared_cache_payload_round_trips(self, use_orjson):
+        """Test the shared cache payload decodes to the same fields with and without orjson."""
+        if use_orjson and not contract_checker.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        analysis = TokenAnalysis(
+            token_address=self.test_address,
+            chain="ethereum",
+            analysis_timestamp=1234567890,
+            compliance_score=ComplianceScore(70.0, 60.0, 80.0, 90.0, 100.0, 50.0,
+                                             [VetoReason.HIDDEN_MINT], ["Hidden mint detected"], {"bytecode_length": 19}),
+            token_info={"symbol": "TST"},
+            audit_trail=[{"step": "token_info", "result": "success"}]
+        )
+        
+        with patch.object(contract_checker, "ORJSON_AVAILABLE", use_orjson):
+            data = contract_checker._unpack_analysis(contract_checker._pack_analysis(analysis))
+        
+        assert data["compliance_score"]["veto_reasons"] == [int(VetoReason.HIDDEN_MINT)]
+        assert data["compliance_score"]["metadata"] == {"bytecode_length": 19}
+        assert data["token_info"] == {"symbol": "TST"}
+        assert data["analysis_timestamp"] == 1234567890
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_analyses_share_one_run(self):
+        """Test concurrent misses for the same token wait on a single analysis."""
+        release = asyncio.Event()
+        
+        async def slow_analysis(token_address, audit_trail):
+            await release.wait()
+            return contract_checker._failed_score(contract_checker._FAIL_BYTECODE, "stub")
+        
+        with patch.object(self.audit_layer, '_get_token_info', return_value={}):
+            with patch.object(self.audit_layer, '_analyze_evm_token', side_effect=slow_analysis) as mock_analyze:
+                tasks = [asyncio.create_task(self.audit_layer.analyze_token(self.test_address)) for _ in range(3)]
+                await asyncio.sleep(0)
+                release.set()
+                results = await asyncio.gather(*tasks)
+        
+        assert mock_analyze.await_count == 1
+        assert results[1] is results[0] and results[2] is results[0]
+        assert self.audit_layer._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_analyze_token_dispatches_by_chain(self):
+        """Test chain names are matched case-insensitively and unknown chains fail closed."""
+        score = contract_checker._failed_score(contract_checker._FAIL_MINT_AUTHORITY, "stub")
+        
+        with patch("src.security.contract_checker.log_trading_event"):
+            with patch.object(self.audit_layer, '_get_solana_token_info', return_value={"symbol": "SOL"}):
+                with patch.object(self.audit_layer, '_analyze_solana_token', return_value=score) as mock_analyze:
+                    result = await self.audit_layer._analyze_token_uncached("Mint111", "Solana", "Solana:Mint111")
+                    unsupported = await self.audit_layer._analyze_token_uncached("0xabc", "tron", "tron:0xabc")
+        
+        mock_analyze.assert_awaited_once()
+        assert result.token_info == {"symbol": "SOL", "name": "Unknown Token"}
+        assert result.compliance_score == score
+        assert unsupported.compliance_score.warnings == ["Unsupported chain"]
+        assert unsupported.token_info == {}
+    
+    @pytest.mark.asyncio
+    async def test_analyze_tokens_batch_preserves_order(self):
+        """Test batch analysis returns results in input order and shares duplicates."""
+        async def fake_uncached(token_address, chain, cache_key):
+            await asyncio.sleep(0)
+            return Mock(token_address=token_address)
+        
+        with patch.object(self.audit_layer, '_analyze_token_uncached', side_effect=fake_uncached) as mock_uncached:
+            results = await self.audit_layer.analyze_tokens_batch(["a", "b", "a"])
+        
+        assert [r.token_address for r in results] == ["a", "b", "a"]
+        assert results[2] is results[0]
+        assert mock_uncached.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_analyze_evm_token_keeps_audit_trail_in_step_order(self):
+        """Test concurrent sub-analyses still produce an ordered audit trail."""
+        rpc_connector = Mock()
+        rpc_connector.make_request = AsyncMock(return_value=Mock(success=True, data="0x6000"))
+        audit_layer = KrakenAuditLayer(rpc_connector=rpc_connector)
+        audit_trail = []
+        
+        score = await audit_layer._analyze_evm_token(self.test_address, audit_trail)
+        
+        assert score.overall_score == 100.0
+        assert [entry["step"] for entry in audit_trail] == [
+            "bytecode_analysis", "liquidity_analysis", "holder_distribution_analysis",
+            "social_verification", "external_tools"
+        ]
+        assert all(entry["started_at"] <= entry["finished_at"] for entry in audit_trail)
+    
+    @pytest.mark.asyncio
+    async def test_token_info_runs_alongside_chain_analysis(self):
+        """Test token info and the chain analysis overlap and keep token_info first in the trail."""
+        analysis_started = asyncio.Event()
+        score = contract_checker._failed_score(contract_checker._FAIL_BYTECODE, "stub")
+        
+        async def get_token_info(token_address, chain, fields):
+            assert fields == contract_checker._AUDIT_TOKEN_INFO_FIELDS
+            await analysis_started.wait()
+            return {"symbol": "TST"}
+        
+        async def analyze(token_address, audit_trail):
+            analysis_started.set()
+            audit_trail.append({"step": "bytecode_analysis"})
+            return score
+        
+        with patch.object(self.audit_layer, '_get_token_info', side_effect=get_token_info):
+            with patch.object(self.audit_layer, '_analyze_evm_token', side_effect=analyze):
+                with patch('src.security.contract_checker.log_trading_event'):
+                    result = await asyncio.wait_for(
+                        self.audit_layer._analyze_token_uncached(self.test_address, "ethereum", "k"), timeout=1.0
+                    )
+        
+        assert result.compliance_score is score
+        assert result.token_info == {"symbol": "TST"}
+        assert [entry["step"] for entry in result.audit_trail] == ["token_info", "bytecode_analysis"]
+    
+    @pytest.mark.asyncio
+    async def test_analyze_solana_token_program_reads_parsed_mint(self):
+        """Test the SPL mint is read from the node's jsonParsed account data."""
+        mint_info = {
+            "mintAuthority": "Auth1111111111111111111111111111111111111111",
+            "supply": str(10 ** 9),
+            "decimals": 6,
+            "isInitialized": True,
+            "freezeAuthority": "11111111111111111111111111111111",
+        }
+        solana_rpc_connector = Mock()
+        solana_rpc_connector.make_request = AsyncMock(return_value=Mock(
+            success=True,
+            data={"value": {"data": {"program": "spl-token", "parsed": {"type": "mint", "info": mint_info}}}}
+        ))
+        audit_layer = KrakenAuditLayer(solana_rpc_connector=solana_rpc_connector)
+        
+        result = await audit_layer._analyze_solana_token_program("Mint111", [])
+        info = await audit_layer._get_solana_token_info("Mint111")
+        
+        assert solana_rpc_connector.make_request.await_args.args[1][1] == {"encoding": "jsonParsed"}
+        assert result["score"] == 60.0
+        assert result["veto_reasons"] == [VetoReason.MINT_AUTHORITY_ACTIVE]
+        assert result["metadata"] == {"mint_authority": mint_info["mintAuthority"]}
+        assert info["total_supply"] == 10 ** 9
+        assert info["decimals"] == 6
+    
+    def test_failed_scores_are_independent_slotted_records(self):
+        """Test failure scores share no mutable state and carry no instance dict."""
+        first = contract_checker._failed_score(contract_checker._FAIL_BYTECODE, "first")
+        second = contract_checker._failed_score(contract_checker._FAIL_BYTECODE, "second")
+        first.veto_reasons.append(VetoReason.HIDDEN_MINT)
+        
+        assert second.veto_reasons == [VetoReason.BYTECODE_SUSPICIOUS]
+        assert contract_checker._FAIL_BYTECODE.warnings == []
+        assert not hasattr(first, "__dict__")
+    
+    def test_get_kraken_audit_layer_is_single_instance(self):
+        """Test the global audit layer keeps the first connectors and one shared cache."""
+        first_connector, second_connector = Mock(), Mock()
+        
+        with patch.object(contract_checker, "_kraken_audit_layer", None):
+            first = contract_checker.get_kraken_audit_layer(rpc_connector=first_connector)
+            second = contract_checker.get_kraken_audit_layer(rpc_connector=second_connector)
+        
+        assert second is first
+        assert first.rpc_connector is first_connector
 
 
 class TestKrakenAuditLayerIntegration:
@@ -221,8 +915,8 @@ class TestKrakenAuditLayerIntegration:
         # Mock all external dependencies
         with patch.object(audit_layer, '_get_token_info', return_value={"name": "Test Token", "symbol": "TEST", "decimals": 18}):
             with patch.object(audit_layer, '_analyze_evm_bytecode', return_value={"is_safe": True, "suspicious_patterns": []}):
-                with patch.object(audit_layer, '_analyze_evm_liquidity', return_value={"has_sufficient_liquidity": True, "liquidity_usd": 50000.0}):
-                    with patch.object(audit_layer, '_analyze_evm_holder_distribution', return_value={"is_distributed": True, "top_10_percent": 0.3}):
+                with patch.object(audit_layer, '_analyze_liquidity', return_value={"has_sufficient_liquidity": True, "liquidity_usd": 50000.0}):
+                    with patch.object(audit_layer, '_analyze_holder_distribution', return_value={"is_distributed": True, "top_10_percent": 0.3}):
                         with patch.object(audit_layer, '_analyze_social_verification', return_value={"is_verified": True, "social_score": 85.0}):
                             with patch.object(audit_layer, '_analyze_external_tools', return_value={"tools_score": 90.0, "verified_by": ["tool1", "tool2"]}):
                                 result = await audit_layer.analyze_token(test_address, "ethereum")
@@ -243,8 +937,8 @@ class TestKrakenAuditLayerIntegration:
         # Mock mixed results (some safe, some unsafe)
         with patch.object(audit_layer, '_get_token_info', return_value={"name": "Mixed Token", "symbol": "MIXED", "decimals": 18}):
             with patch.object(audit_layer, '_analyze_evm_bytecode', return_value={"is_safe": False, "suspicious_patterns": ["delegatecall"]}):
-                with patch.object(audit_layer, '_analyze_evm_liquidity', return_value={"has_sufficient_liquidity": True, "liquidity_usd": 15000.0}):
-                    with patch.object(audit_layer, '_analyze_evm_holder_distribution', return_value={"is_distributed": False, "top_10_percent": 0.8}):
+                with patch.object(audit_layer, '_analyze_liquidity', return_value={"has_sufficient_liquidity": True, "liquidity_usd": 15000.0}):
+                    with patch.object(audit_layer, '_analyze_holder_distribution', return_value={"is_distributed": False, "top_10_percent": 0.8}):
                         with patch.object(audit_layer, '_analyze_social_verification', return_value={"is_verified": True, "social_score": 70.0}):
                             with patch.object(audit_layer, '_analyze_external_tools', return_value={"tools_score": 60.0, "verified_by": ["tool1"]}):
                                 result = await audit_layer.analyze_token(test_address, "ethereum")
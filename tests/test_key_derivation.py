@@ -0,0 +1,95 @@
+"""
+Unit tests for the shared Argon2 key derivation.
+
+Tests cover derived key caching, eviction and wiping.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from argon2 import PasswordHasher
+
+from src.security import key_derivation
+from src.security.key_derivation import clear_key_cache, derive_key, legacy_key
+
+# Small Argon2 parameters keep these tests fast; the cache logic is the same
+PARAMS = dict(memory_cost=8, time_cost=1, parallelism=1, key_len=32)
+
+
+class TestDeriveKey:
+    """Test cases for derive_key and its cache."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        clear_key_cache()
+        self.salt = b"s" * 16
+
+    def teardown_method(self):
+        """Drop keys cached by the test."""
+        clear_key_cache()
+
+    def test_repeated_derivation_runs_argon2_once(self):
+        """Test the same passphrase and salt reuse the cached key."""
+        with patch.object(key_derivation, "_argon2_key", wraps=key_derivation._argon2_key) as argon2_key:
+            first = derive_key(b"passphrase", self.salt, **PARAMS)
+            second = derive_key(b"passphrase", self.salt, **PARAMS)
+            other_salt = derive_key(b"passphrase", b"t" * 16, **PARAMS)
+            other_passphrase = derive_key(b"passphrase2", self.salt, **PARAMS)
+
+        assert first == second
+        assert len(first) == 32
+        assert other_salt != first and other_passphrase != first
+        assert argon2_key.call_count == 3
+
+    def test_cache_keys_never_hold_the_passphrase(self):
+        """Test cache entries are keyed by a keyed hash rather than the passphrase."""
+        derive_key(b"passphrase", self.salt, **PARAMS)
+
+        (cache_key,) = key_derivation._key_cache
+        assert b"passphrase" not in cache_key
+
+    def test_cache_is_bounded_and_expires(self):
+        """Test the cache evicts least recently used keys and rederives expired ones."""
+        with patch.object(key_derivation, "KEY_CACHE_MAX_SIZE", 2):
+            for salt in (b"a" * 16, b"b" * 16, b"c" * 16):
+                derive_key(b"passphrase", salt, **PARAMS)
+
+        assert [key[1] for key in key_derivation._key_cache] == [b"b" * 16, b"c" * 16]
+
+        with patch.object(key_derivation, "KEY_CACHE_TTL", -1):
+            clear_key_cache()
+            derive_key(b"passphrase", self.salt, **PARAMS)
+            with patch.object(key_derivation, "_argon2_key", wraps=key_derivation._argon2_key) as argon2_key:
+                derive_key(b"passphrase", self.salt, **PARAMS)
+
+        assert argon2_key.call_count == 1
+
+    def test_clear_wipes_cached_keys(self):
+        """Test clearing the cache zeroes the stored key bytes."""
+        key = derive_key(b"passphrase", self.salt, **PARAMS)
+        (_, stored), = key_derivation._key_cache.values()
+        assert bytes(stored) == key
+
+        clear_key_cache()
+
+        assert not key_derivation._key_cache
+        assert stored == bytearray(len(key))
+
+    def test_cache_can_be_disabled(self):
+        """Test MEMBOT_KDF_CACHE=0 derives every time and caches nothing."""
+        with patch.object(key_derivation, "KEY_CACHE_ENABLED", False):
+            first = derive_key(b"passphrase", self.salt, **PARAMS)
+            second = derive_key(b"passphrase", self.salt, **PARAMS)
+
+        assert first == second
+        assert not key_derivation._key_cache
+
+    def test_key_is_raw_argon2id_hash(self):
+        """Test the derived key is the raw Argon2id hash and the legacy key its base64 text."""
+        key = derive_key(b"passphrase", self.salt, **PARAMS)
+        ph = PasswordHasher(memory_cost=8, time_cost=1, parallelism=1, hash_len=32, salt_len=16)
+        encoded = ph.hash(b"passphrase", salt=self.salt)
+
+        assert encoded.startswith("$argon2id$")
+        assert legacy_key(key) == encoded.split('$')[-1].encode('utf-8')[:32]
+        assert ph.verify(encoded, b"passphrase")
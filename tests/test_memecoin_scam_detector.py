@@ -0,0 +1,318 @@
+"""
+Unit tests for the memecoin scam detector.
+
+Tests cover market pattern checks and batch analysis against Axiom data.
+"""
+
+import threading
+from dataclasses import FrozenInstanceError, asdict, replace
+
+import pytest
+from unittest.mock import patch
+
+from src.security import memecoin_scam_detector
+from src.security.memecoin_scam_detector import MemecoinScamDetector, ScamAnalysis, ScamIndicator
+
+
+def make_trending(*tokens):
+    """Build a successful get_trending_tokens response."""
+    return {"success": True, "data": {"tokens": list(tokens), "total_tokens": len(tokens)}}
+
+
+class FakeAxiom:
+    """Stand-in for call_axiom_tool_sync that records every tool call."""
+
+    def __init__(self, trending):
+        self.trending = trending
+        self.calls = []
+
+    def __call__(self, tool_name, arguments=None):
+        self.calls.append(tool_name)
+        if tool_name == "get_trending_tokens":
+            return self.trending
+        return {"success": True, "data": {"symbol": arguments["symbol"], "price_change_24h": 0.1,
+                                          "trend_score": 5.0, "volume_24h": 10.0, "market_cap": 1000.0}}
+
+
+class TestMemecoinScamDetector:
+    """Test cases for MemecoinScamDetector class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = MemecoinScamDetector()
+        self.trending = make_trending(
+            {"symbol": "NEW", "price_change_24h": 1.5, "market_cap": 500000},
+            *({"symbol": f"G{i}", "price_change_24h": 0.6, "market_cap": 5000000} for i in range(5)),
+        )
+
+    def test_market_patterns_flag_new_token_and_coordinated_gains(self):
+        """Test trending data flags a small-cap pumper and a wave of gainers."""
+        snapshot = self.detector._build_market_snapshot(self.trending["data"])
+
+        indicators = self.detector._analyze_market_patterns("NEW", snapshot)
+
+        assert [i.type for i in indicators] == ["rug_pull", "coordinated_shilling"]
+        assert indicators[1].render_evidence() == ["6 tokens with >50% gains"]
+        assert indicators[0].render_evidence() == ["Price change: 150.0%", "Market cap: $500,000"]
+        assert self.detector._analyze_market_patterns("MISSING", snapshot)[0].type == "coordinated_shilling"
+        assert snapshot["high_gainer_count"] == 6
+        assert snapshot["price_changes"].tolist() == [1.5] + [0.6] * 5
+
+    def test_batch_fetches_trending_once(self):
+        """Test a batch shares one trending snapshot across all symbols."""
+        fake_axiom = FakeAxiom(self.trending)
+
+        with patch("src.security.memecoin_scam_detector.call_axiom_tool_sync", fake_axiom):
+            results = self.detector.batch_analyze_tokens(["NEW", "G0", "OTHER"])
+
+        assert list(results) == ["NEW", "G0", "OTHER"]
+        assert all(isinstance(r, ScamAnalysis) for r in results.values())
+        assert fake_axiom.calls.count("get_trending_tokens") == 1
+        assert all("axiom.trade_trending" in r.data_sources for r in results.values())
+        assert "rug_pull" in [i.type for i in results["NEW"].indicators]
+
+    def test_batch_fetches_token_data_concurrently(self):
+        """Test per-symbol Axiom calls overlap instead of running back to back."""
+        barrier = threading.Barrier(2, timeout=5)
+        fake_axiom = FakeAxiom(self.trending)
+
+        def axiom(tool_name, arguments=None):
+            if tool_name == "get_token_data":
+                barrier.wait()
+            return fake_axiom(tool_name, arguments)
+
+        with patch("src.security.memecoin_scam_detector.call_axiom_tool_sync", axiom):
+            results = self.detector.batch_analyze_tokens(["NEW", "G0", "NEW"])
+
+        assert list(results) == ["NEW", "G0"]
+        assert all("axiom.trade" in r.data_sources for r in results.values())
+        assert fake_axiom.calls.count("get_token_data") == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_token_async_uses_cache(self):
+        """Test a fresh cached analysis is returned without calling Axiom."""
+        fake_axiom = FakeAxiom(self.trending)
+
+        with patch("src.security.memecoin_scam_detector.call_axiom_tool_sync", fake_axiom):
+            first = await self.detector.analyze_token_async("NEW")
+            calls = len(fake_axiom.calls)
+            second = await self.detector.analyze_token_async("NEW")
+
+        assert second is first
+        assert len(fake_axiom.calls) == calls == 2
+
+    def test_analysis_cache_is_bounded_lru_with_expiry(self):
+        """Test the cache evicts least recently used entries and drops expired ones."""
+        self.detector.cache_max_size = 2
+        analyses = {symbol: self.detector._create_error_analysis(symbol, None, "stub") for symbol in "abc"}
+
+        self.detector._cache_analysis("a", None, analyses["a"])
+        self.detector._cache_analysis("b", None, analyses["b"])
+        assert self.detector._get_cached_analysis("a", None) is analyses["a"]
+        self.detector._cache_analysis("c", None, analyses["c"])
+
+        assert list(self.detector.analysis_cache) == ["a_unknown", "c_unknown"]
+        assert isinstance(self.detector.analysis_cache["a_unknown"][0], int)
+        self.detector.analysis_cache["c_unknown"] = (0, analyses["c"])
+        assert self.detector._get_cached_analysis("c", None) is None
+        assert "c_unknown" not in self.detector.analysis_cache
+
+    def test_risk_score_weights_by_severity(self):
+        """Test the risk score is the severity-weighted mean confidence."""
+        indicators = [
+            ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.8, []),
+            ScamIndicator.from_confidence('social_hacks', 'low', 'b', 0.5, []),
+            ScamIndicator.from_confidence('analysis_error', 'unrated', 'c', 1.0, []),
+        ]
+
+        score = self.detector._calculate_risk_score(indicators)
+
+        assert [i.severity_weight for i in indicators] == [0.7, 0.2, 0.5]
+        assert score == pytest.approx((0.7 * 0.8 + 0.2 * 0.5 + 0.5 * 1.0) / (0.7 + 0.2 + 0.5))
+        assert self.detector._calculate_risk_score([]) == 0.0
+
+    def test_determine_risk_level_boundaries(self):
+        """Test each threshold belongs to the higher level and low scores are safe."""
+        levels = [self.detector._determine_risk_level(score)
+                  for score in (-0.1, 0.0, 0.19, 0.2, 0.4, 0.59, 0.6, 0.8, 1.0)]
+
+        assert levels == ["safe", "safe", "safe", "low", "medium", "medium", "high", "critical", "critical"]
+
+    def test_recommendations_by_level_and_indicator(self):
+        """Test level recommendations come first, then one per flagged indicator type in a fixed order."""
+        indicators = [
+            ScamIndicator.from_confidence('celebrity_scams', 'high', 'a', 0.9, []),
+            ScamIndicator.from_confidence('rug_pull', 'high', 'b', 0.9, []),
+            ScamIndicator.from_confidence('rug_pull', 'medium', 'c', 0.7, []),
+        ]
+
+        recommendations = self.detector._generate_recommendations(indicators, 'high')
+        fallback = self.detector._generate_recommendations([], 'unknown')
+
+        assert recommendations == [
+            "⚠️ HIGH RISK: Exercise extreme caution",
+            "Only invest what you can afford to lose",
+            "Consider waiting for more information",
+            "Check token distribution and team verification",
+            "Verify celebrity endorsements through official channels",
+        ]
+        assert fallback == ["✅ SAFE: Token appears legitimate", "Standard investment practices apply"]
+        fallback.append("mutated")
+        assert len(self.detector._generate_recommendations([], 'safe')) == 2
+
+    def test_simulated_signals_are_deterministic_per_symbol(self):
+        """Test simulated social and tokenomics indicators repeat for the same symbol."""
+        def signature(symbol):
+            indicators = self.detector._analyze_social_signals(symbol) + self.detector._analyze_tokenomics(symbol)
+            return [(i.type, i.confidence) for i in indicators]
+
+        assert signature("BONK") == signature("BONK")
+        assert len({tuple(signature(f"T{i}")) for i in range(20)}) > 1
+        assert all(isinstance(confidence, float) for _, confidence in signature("WIF"))
+
+    def test_analysis_records_are_frozen_slots(self):
+        """Test indicators and analyses are immutable and dict-free so cached results can be shared."""
+        indicator = ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.8, ['x'])
+        analysis = self.detector._create_error_analysis("BONK", None, "stub")
+
+        with pytest.raises(FrozenInstanceError):
+            indicator.confidence_q = 10
+        with pytest.raises(FrozenInstanceError):
+            analysis.overall_risk = 'safe'
+        assert not hasattr(indicator, "__dict__") and not hasattr(analysis, "__dict__")
+        assert indicator.severity_weight == 0.7
+        assert asdict(analysis)["indicators"][0]["type"] == analysis.indicators[0].type
+
+    def test_confidence_is_stored_in_hundredths(self):
+        """Test indicator confidence is quantized to integer hundredths and read back as a float."""
+        indicator = ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.8149, [])
+
+        assert indicator.confidence_q == 81
+        assert indicator.confidence == 0.81
+        assert ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.81, []) == indicator
+        assert self.detector._calculate_risk_score([indicator]) == pytest.approx(0.81)
+
+    def test_indicator_supports_replace_and_asdict(self):
+        """Test indicators copy with dataclasses.replace and serialize their stored confidence."""
+        indicator = ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.8, ['x'])
+
+        lowered = replace(indicator, severity='low')
+
+        assert lowered.confidence == 0.8
+        assert lowered.severity_weight == 0.2
+        assert asdict(indicator)["confidence_q"] == 80
+        assert ScamIndicator('rug_pull', 'high', 'a', confidence_q=80, evidence=['x']) == indicator
+
+    def test_constructor_takes_float_confidence_positionally(self):
+        """Test the positional constructor still takes a 0.0 to 1.0 confidence."""
+        indicator = ScamIndicator('rug_pull', 'high', 'a', 0.8, ['x'])
+
+        assert indicator.confidence_q == 80
+        assert indicator == ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.8, ['x'])
+        with pytest.raises(TypeError):
+            ScamIndicator('rug_pull', 'high', 'a', 0.8, ['x'], confidence_q=80)
+        with pytest.raises(TypeError):
+            ScamIndicator('rug_pull', 'high', 'a')
+
+    def test_evidence_templates_stay_out_of_public_evidence(self):
+        """Test templated evidence keeps evidence a list of strings and is formatted by render_evidence."""
+        indicator = ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.8, ['x'],
+                                                  evidence_templates=[('Score: {:.2f}', (0.5,))])
+
+        assert indicator.evidence == ['x']
+        assert indicator.render_evidence() == ['x', 'Score: 0.50']
+        assert replace(indicator, severity='low').render_evidence() == ['x', 'Score: 0.50']
+
+    def test_scan_text_groups_phrases_by_pattern(self):
+        """Test free text is matched once against every indicator phrase."""
+        text = "Anonymous team, NO LIQUIDITY LOCK and bot-like activity. Anonymous team again; suspicious claims!"
+
+        hits = self.detector.scan_text(text)
+
+        assert hits == {
+            'rug_pull': ['anonymous team', 'no liquidity lock'],
+            'coordinated_shilling': ['bot-like activity'],
+            'celebrity_scams': ['suspicious claims'],
+        }
+        assert self.detector.scan_text("gm frens") == {}
+
+    def test_pattern_tables_are_shared_and_read_only(self):
+        """Test detectors share one read-only copy of the thresholds and scam patterns."""
+        other = MemecoinScamDetector()
+
+        assert other.scam_patterns is self.detector.scam_patterns
+        assert other.risk_thresholds is self.detector.risk_thresholds
+        with pytest.raises(TypeError):
+            self.detector.scam_patterns['rug_pull']['description'] = 'changed'
+        assert not hasattr(self.detector, "__dict__")
+
+    def test_axiom_circuit_breaker_skips_calls_while_open(self):
+        """Test repeated Axiom failures stop further calls until the cooldown passes."""
+        calls = []
+
+        def failing_axiom(tool_name, arguments=None):
+            calls.append(tool_name)
+            return {"success": False, "error": "down", "timestamp": 0.0}
+
+        with patch("src.security.memecoin_scam_detector.call_axiom_tool_sync", failing_axiom):
+            analyses = [self.detector.analyze_token(f"T{i}") for i in range(4)]
+
+        assert len(calls) == 3
+        assert all("axiom.trade" not in a.data_sources for a in analyses)
+
+        self.detector._axiom_open_until = 0.0
+        with patch("src.security.memecoin_scam_detector.call_axiom_tool_sync", FakeAxiom(self.trending)):
+            assert self.detector._fetch_token_data("NEW")["symbol"] == "NEW"
+        assert self.detector._axiom_failures == 0
+
+
+    def test_risk_summary_matches_full_analysis_without_caching(self):
+        """Test the summary fast path agrees with a full analysis and leaves the cache alone."""
+        with patch("src.security.memecoin_scam_detector.call_axiom_tool_sync", FakeAxiom(self.trending)):
+            summary = self.detector.get_risk_summary("NEW")
+            assert not self.detector.analysis_cache
+            analysis = self.detector.analyze_token("NEW")
+            cached_summary = self.detector.get_risk_summary("NEW")
+
+        expected = {
+            'symbol': "NEW",
+            'risk_level': analysis.overall_risk,
+            'risk_score': analysis.risk_score,
+            'indicator_count': len(analysis.indicators),
+            'high_severity_count': sum(1 for i in analysis.indicators if i.severity in ('high', 'critical')),
+            'recommendations': analysis.recommendations[:3],
+        }
+        assert {k: v for k, v in summary.items() if k != 'last_updated'} == expected
+        assert cached_summary == {**expected, 'last_updated': analysis.analysis_timestamp}
+
+    def test_recommendations_limit_short_circuits(self):
+        """Test a recommendation limit keeps the leading recommendations in order."""
+        indicators = [ScamIndicator.from_confidence('rug_pull', 'high', 'a', 0.9, []), ScamIndicator.from_confidence('celebrity_scams', 'high', 'b', 0.9, [])]
+
+        full = self.detector._generate_recommendations(indicators, 'low')
+
+        for limit in range(len(full) + 2):
+            assert self.detector._generate_recommendations(indicators, 'low', limit=limit) == full[:limit]
+
+class TestGetScamDetector:
+    """Test cases for the global scam detector accessor."""
+
+    def test_concurrent_first_calls_create_one_detector(self):
+        """Test threads racing on first use all get the same detector."""
+        barrier = threading.Barrier(8, timeout=5)
+        detectors = []
+
+        def get():
+            barrier.wait()
+            detectors.append(memecoin_scam_detector.get_scam_detector())
+
+        with patch.object(memecoin_scam_detector, "_scam_detector", None):
+            threads = [threading.Thread(target=get) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(detectors) == 8
+        assert all(detector is detectors[0] for detector in detectors)
+